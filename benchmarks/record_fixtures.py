@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+
+"""
+This Python script records live source pages as benchmark fixtures.
+
+The pages listed in fixtures/index.json are downloaded for one word. Every
+occurrence of that word in a page is replaced with the {word} placeholder,
+so that the stub server can serve the recorded page for any word.
+
+Usage Examples
+----------
+python benchmarks/record_fixtures.py good --output benchmarks/recorded
+python benchmarks/run_benchmarks.py --fixtures benchmarks/recorded
+"""
+__author__ = 'John Bumgarner'
+__date__ = 'October 19, 2026'
+__status__ = 'Quality Assurance'
+__license__ = 'MIT'
+__copyright__ = "Copyright (C) 2026 John Bumgarner"
+
+##################################################################################
+# “AS-IS” Clause
+#
+# Except as represented in this agreement, all work produced by Developer is
+# provided “AS IS”. Other than as provided in this agreement, Developer makes no
+# other warranties, express or implied, and hereby disclaims all implied warranties,
+# including any warranty of merchantability and warranty of fitness for a particular
+# purpose.
+##################################################################################
+
+##################################################################################
+# Date Completed: October 19, 2026
+# Author: John Bumgarner
+#
+# Date Last Revised:
+# Revised by:
+##################################################################################
+
+##################################################################################
+# Python imports required for basic operations
+##################################################################################
+# Standard library imports
+import os
+import re
+import sys
+import json
+import argparse
+from typing import List, Optional
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Local or project-specific imports
+from wordhoard.utilities.request_html import Query
+from stub_server import FIXTURES_DIRECTORY
+
+
+def main(arguments: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description='Record live source pages as benchmark fixtures.')
+    parser.add_argument('word', help='the word whose pages are recorded')
+    parser.add_argument('--output', required=True, help='directory for the recorded fixtures')
+    parser.add_argument('--hypernym-word', default='red',
+                        help='the word recorded for the classicthesaurus.com pages')
+    parsed = parser.parse_args(arguments)
+
+    with open(file=os.path.join(FIXTURES_DIRECTORY, 'index.json'), mode='r', encoding='utf-8') as infile:
+        index = json.load(infile)
+
+    os.makedirs(parsed.output, exist_ok=True)
+    recorded_index = {}
+    for url_pattern, file_name in index.items():
+        word = parsed.hypernym_word if 'classicthesaurus' in url_pattern else parsed.word
+        url = url_pattern.replace('{word}', word)
+        response = Query(url_to_scrape=url).get_website_html()
+        if response is None or response.status_code != 200:
+            print(f'skipped {url}: the page could not be downloaded', file=sys.stderr)
+            continue
+        page = re.sub(pattern=rf'\b{re.escape(word)}\b', repl='{word}', string=response.text)
+        with open(file=os.path.join(parsed.output, file_name), mode='w', encoding='utf-8') as outfile:
+            outfile.write(page)
+        recorded_index[url_pattern] = file_name
+        print(f'recorded {url} ({len(page) // 1024} KB)')
+
+    with open(file=os.path.join(parsed.output, 'index.json'), mode='w', encoding='utf-8') as outfile:
+        json.dump(recorded_index, outfile, indent=4)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
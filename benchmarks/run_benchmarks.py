@@ -0,0 +1,308 @@
+#!/usr/bin/env python3
+
+"""
+This Python script benchmarks WordHoard against the recorded source pages in
+benchmarks/fixtures, which are served by a local stub HTTP server.
+
+The script measures:
+
+- end-to-end latency of an uncached lookup for every relation
+- parse time for the page of every source
+- lookup throughput at several concurrency levels
+- memory allocated by lookups and by the caches
+
+Usage Examples
+----------
+python benchmarks/run_benchmarks.py
+python benchmarks/run_benchmarks.py --latency-ms 50 --padding-kb 200 --json results.json
+python benchmarks/run_benchmarks.py --compare baseline.json --threshold 0.25
+"""
+__author__ = 'John Bumgarner'
+__date__ = 'October 19, 2026'
+__status__ = 'Quality Assurance'
+__license__ = 'MIT'
+__copyright__ = "Copyright (C) 2026 John Bumgarner"
+
+##################################################################################
+# “AS-IS” Clause
+#
+# Except as represented in this agreement, all work produced by Developer is
+# provided “AS IS”. Other than as provided in this agreement, Developer makes no
+# other warranties, express or implied, and hereby disclaims all implied warranties,
+# including any warranty of merchantability and warranty of fitness for a particular
+# purpose.
+##################################################################################
+
+##################################################################################
+# Date Completed: October 19, 2026
+# Author: John Bumgarner
+#
+# Date Last Revised:
+# Revised by:
+##################################################################################
+
+##################################################################################
+# Python imports required for basic operations
+##################################################################################
+# Standard library imports
+import os
+import sys
+import json
+import time
+import argparse
+import itertools
+import statistics
+import tracemalloc
+from string import ascii_lowercase
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterator, List, Optional
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Third-party imports
+from bs4 import BeautifulSoup
+
+# Local or project-specific imports
+from wordhoard import Antonyms, Definitions, Hypernyms, Hyponyms, Synonyms
+from wordhoard import antonyms, dictionary, hypernyms, hyponyms, synonyms
+from wordhoard.utilities import caching, protection_detector
+from stub_server import FixtureStore, StubServer, route_queries_to
+
+# rate limits that are never reached during a benchmark
+UNLIMITED = {'max_number_of_requests': 10 ** 9, 'rate_limit_timeout_period': 1}
+
+# relation -> (query class, query method, benchmark word)
+RELATIONS = {'synonyms': (Synonyms, 'find_synonyms', 'good'),
+             'antonyms': (Antonyms, 'find_antonyms', 'good'),
+             'definitions': (Definitions, 'find_definitions', 'good'),
+             'hypernyms': (Hypernyms, 'find_hypernyms', 'red'),
+             'hyponyms': (Hyponyms, 'find_hyponyms', 'red')}
+
+# source -> (page URL, parsers applied to the page by the relation classes)
+SOURCES: Dict[str, tuple] = {
+    'collins': ('https://www.collinsdictionary.com/dictionary/english-thesaurus/{word}',
+                lambda soup, word: (synonyms.ParseWords.parse_collins_dictionary(soup=soup, protected=False),
+                                    synonyms.PartOfSpeech.part_of_speech_category_collins_dictionary(soup=soup),
+                                    dictionary.ParseDefinitions.parse_collins_dictionary(soup=soup, word=word))),
+    'merriam-webster': ('https://www.merriam-webster.com/thesaurus/{word}',
+                        lambda soup, word: (synonyms.ParseWords.parse_merriam_webster(soup=soup),
+                                            synonyms.PartOfSpeech.part_of_speech_category_merriam_webster(soup=soup))),
+    'merriam-webster dictionary': ('https://www.merriam-webster.com/dictionary/{word}',
+                                   lambda soup, word: (
+                                       dictionary.ParseDefinitions.parse_merriam_webster(soup=soup),
+                                       dictionary.PartOfSpeech.part_of_speech_category_merriam_webster(soup=soup))),
+    'synonym.com': ('https://www.synonym.com/synonyms/{word}',
+                    lambda soup, word: (synonyms.ParseWords.parse_synonym_com(soup=soup),
+                                        synonyms.PartOfSpeech.part_of_speech_category_synonym_com(soup=soup),
+                                        dictionary.ParseDefinitions.parse_synonym_com(soup=soup))),
+    'thesaurus.com': ('https://www.thesaurus.com/browse/{word}',
+                      lambda soup, word: (synonyms.ParseWords.parse_thesaurus_com(soup=soup, word=word),
+                                          synonyms.PartOfSpeech.part_of_speech_category_thesaurus_com(soup=soup,
+                                                                                                      word=word),
+                                          antonyms.ParseWords.parse_thesaurus_com(soup=soup),
+                                          dictionary.ParseDefinitions.parse_thesaurus_com(soup=soup))),
+    'wordnet': ('http://wordnetweb.princeton.edu/perl/webwn?s={word}',
+                lambda soup, word: (synonyms.ParseWords.parse_wordnet(soup=soup),)),
+    'wordhippo': ('https://www.wordhippo.com/what-is/the-opposite-of/{word}.html',
+                  lambda soup, word: (antonyms.ParseWords.parse_wordhippo(soup=soup),
+                                      antonyms.PartOfSpeech.part_of_speech_category_wordhippo(soup=soup))),
+    'google': ('https://www.google.com/search?q=antonym+for+/{word}',
+               lambda soup, word: (antonyms.ParseWords.parse_google_com(soup=soup, word=word),)),
+    'classicthesaurus': ('https://www.classicthesaurus.com/{word}/broader',
+                         lambda soup, word: (hypernyms.SoupParser.get_hypernyms(soup=soup),
+                                             hypernyms.SoupParser.get_number_of_pages(soup=soup),
+                                             hyponyms.SoupParser.get_hyponyms(soup=soup))),
+}
+
+
+def clear_caches() -> None:
+    """
+    Empties the relation caches, so that the next lookup queries the sources.
+    """
+    for cache in caching._RELATION_CACHES.values():
+        cache.clear()
+    caching.clear_output_memo()
+
+
+def generated_words() -> Iterator[str]:
+    """
+    Yields distinct, syntactically valid words, so that concurrent lookups never hit the caches.
+    """
+    for letters in itertools.product(ascii_lowercase, repeat=4):
+        yield 'bench' + ''.join(letters)
+
+
+def lookup(relation: str, word: str) -> Any:
+    query_class, query_method, _ = RELATIONS[relation]
+    return getattr(query_class(search_string=word, **UNLIMITED), query_method)()
+
+
+def percentile(samples: List[float], fraction: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(round(fraction * (len(ordered) - 1))))]
+
+
+def summarize(samples: List[float]) -> Dict[str, float]:
+    return {'p50_ms': percentile(samples, 0.50) * 1000,
+            'p95_ms': percentile(samples, 0.95) * 1000,
+            'mean_ms': statistics.fmean(samples) * 1000}
+
+
+def benchmark_latency(iterations: int) -> Dict[str, Dict[str, float]]:
+    results = {}
+    for relation, (_, _, word) in RELATIONS.items():
+        samples = []
+        for iteration in range(iterations):
+            clear_caches()
+            start_time = time.perf_counter()
+            output = lookup(relation, word)
+            samples.append(time.perf_counter() - start_time)
+            if iteration == 0 and not output:
+                print(f'warning: the {relation} lookup returned no results from the fixtures', file=sys.stderr)
+        results[relation] = summarize(samples)
+    return results
+
+
+def benchmark_parsing(store: FixtureStore, iterations: int) -> Dict[str, Dict[str, float]]:
+    results = {}
+    for source, (url_pattern, parse) in SOURCES.items():
+        word = 'red' if source == 'classicthesaurus' else 'good'
+        page = store.render(url_pattern.replace('{word}', word))
+        if page is None:
+            print(f'warning: no fixture for the source {source}', file=sys.stderr)
+            continue
+        markup = page.decode('utf-8')
+        samples = []
+        for _ in range(iterations):
+            start_time = time.perf_counter()
+            # the request path classifies the raw page before it is parsed
+            protection_detector.classify_response(200, {}, page)
+            soup = BeautifulSoup(markup=markup, features='lxml')
+            parse(soup, word)
+            samples.append(time.perf_counter() - start_time)
+        results[source] = {**summarize(samples), 'page_kb': len(page) / 1024}
+    return results
+
+
+def benchmark_throughput(concurrency_levels: List[int], lookups: int) -> Dict[str, Dict[str, float]]:
+    words = generated_words()
+    relations = itertools.cycle(['synonyms', 'antonyms', 'definitions'])
+    results = {}
+    for concurrency in concurrency_levels:
+        jobs = [(next(relations), next(words)) for _ in range(lookups)]
+        start_time = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            list(executor.map(lambda job: lookup(*job), jobs))
+        elapsed_time = time.perf_counter() - start_time
+        results[str(concurrency)] = {'lookups_per_second': lookups / elapsed_time,
+                                     'elapsed_s': elapsed_time}
+    return results
+
+
+def benchmark_memory(lookups: int) -> Dict[str, float]:
+    clear_caches()
+    words = generated_words()
+    tracemalloc.start()
+    try:
+        baseline, _ = tracemalloc.get_traced_memory()
+        if hasattr(tracemalloc, 'reset_peak'):
+            # Python 3.8 has no reset_peak, and tracing has only just started, so the peak is close to the baseline
+            tracemalloc.reset_peak()
+        lookup('synonyms', next(words))
+        _, single_lookup_peak = tracemalloc.get_traced_memory()
+        for relation, word in zip(itertools.cycle(RELATIONS), itertools.islice(words, lookups)):
+            lookup(relation, word)
+        cache_size, lookups_peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {'single_lookup_peak_kb': (single_lookup_peak - baseline) / 1024,
+            'peak_kb': (lookups_peak - baseline) / 1024,
+            'retained_cache_kb': (cache_size - baseline) / 1024,
+            'cached_lookups': lookups + 1}
+
+
+def compare(results: Dict[str, Any], baseline: Dict[str, Any], threshold: float) -> List[str]:
+    """
+    Returns a description of every measurement that regressed by more than the threshold.
+    """
+    regressions = []
+    checks: List[tuple] = []
+    for section in ('latency', 'parsing'):
+        for name, values in results[section].items():
+            checks.append((f'{section} {name} p50', values['p50_ms'],
+                           baseline.get(section, {}).get(name, {}).get('p50_ms'), True))
+    for level, values in results['throughput'].items():
+        checks.append((f'throughput at concurrency {level}', values['lookups_per_second'],
+                       baseline.get('throughput', {}).get(level, {}).get('lookups_per_second'), False))
+    checks.append(('memory peak', results['memory']['peak_kb'], baseline.get('memory', {}).get('peak_kb'), True))
+    for name, current, previous, lower_is_better in checks:
+        if not previous:
+            continue
+        change = (current - previous) / previous
+        if (lower_is_better and change > threshold) or (not lower_is_better and -change > threshold):
+            regressions.append(f'{name}: {previous:.2f} -> {current:.2f} ({change:+.0%})')
+    return regressions
+
+
+def print_report(results: Dict[str, Any]) -> None:
+    print(f"\nEnd-to-end latency of an uncached lookup ({results['settings']['latency_ms']} ms stub latency)")
+    for relation, values in results['latency'].items():
+        print(f"  {relation:<28} p50 {values['p50_ms']:8.2f} ms   p95 {values['p95_ms']:8.2f} ms")
+    print('\nParse time per source page')
+    for source, values in results['parsing'].items():
+        print(f"  {source:<28} p50 {values['p50_ms']:8.2f} ms   p95 {values['p95_ms']:8.2f} ms"
+              f"   page {values['page_kb']:7.1f} KB")
+    print('\nThroughput (synonyms, antonyms and definitions lookups)')
+    for concurrency, values in results['throughput'].items():
+        print(f"  concurrency {concurrency:<16} {values['lookups_per_second']:8.2f} lookups/s")
+    memory = results['memory']
+    print('\nMemory')
+    print(f"  single lookup peak           {memory['single_lookup_peak_kb']:8.1f} KB")
+    print(f"  peak over {memory['cached_lookups']} lookups{'':<7} {memory['peak_kb']:8.1f} KB")
+    print(f"  retained by the caches       {memory['retained_cache_kb']:8.1f} KB")
+
+
+def main(arguments: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description='Benchmark WordHoard against recorded source pages.')
+    parser.add_argument('--iterations', type=int, default=20, help='samples per latency and parse measurement')
+    parser.add_argument('--concurrency', type=int, nargs='+', default=[1, 2, 4, 8])
+    parser.add_argument('--lookups', type=int, default=60, help='lookups per throughput and memory measurement')
+    parser.add_argument('--latency-ms', type=float, default=20.0, help='delay added to every stub response')
+    parser.add_argument('--padding-kb', type=int, default=0, help='generic markup added to every page')
+    parser.add_argument('--fixtures', default=None, help='directory with index.json and the fixture pages')
+    parser.add_argument('--json', dest='json_file', default=None, help='write the results to a JSON file')
+    parser.add_argument('--compare', dest='baseline_file', default=None, help='JSON results of an earlier run')
+    parser.add_argument('--threshold', type=float, default=0.25, help='relative change reported as a regression')
+    parsed = parser.parse_args(arguments)
+
+    store = FixtureStore(padding_kb=parsed.padding_kb) if parsed.fixtures is None \
+        else FixtureStore(directory=parsed.fixtures, padding_kb=parsed.padding_kb)
+    results: Dict[str, Any] = {'settings': {'iterations': parsed.iterations,
+                                            'lookups': parsed.lookups,
+                                            'latency_ms': parsed.latency_ms,
+                                            'padding_kb': parsed.padding_kb}}
+    results['parsing'] = benchmark_parsing(store, parsed.iterations)
+    with StubServer(store=store, latency_ms=parsed.latency_ms) as server, route_queries_to(server):
+        results['latency'] = benchmark_latency(parsed.iterations)
+        results['throughput'] = benchmark_throughput(parsed.concurrency, parsed.lookups)
+        results['memory'] = benchmark_memory(parsed.lookups)
+    clear_caches()
+    print_report(results)
+
+    if parsed.json_file:
+        with open(file=parsed.json_file, mode='w', encoding='utf-8') as outfile:
+            json.dump(results, outfile, indent=4)
+    if parsed.baseline_file:
+        with open(file=parsed.baseline_file, mode='r', encoding='utf-8') as infile:
+            regressions = compare(results, json.load(infile), parsed.threshold)
+        if regressions:
+            print('\nRegressions')
+            for regression in regressions:
+                print(f'  {regression}')
+            return 1
+        print('\nNo regressions were found.')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+
+"""
+This Python module serves recorded source pages from a local stub HTTP server,
+so that WordHoard can be benchmarked without contacting the online repositories.
+
+The pages are listed in fixtures/index.json, which maps a URL pattern to a fixture
+file. The placeholder {word} in a pattern matches the queried word, which is then
+substituted into the fixture file, so one fixture serves any number of words.
+"""
+__author__ = 'John Bumgarner'
+__date__ = 'October 19, 2026'
+__status__ = 'Quality Assurance'
+__license__ = 'MIT'
+__copyright__ = "Copyright (C) 2026 John Bumgarner"
+
+##################################################################################
+# “AS-IS” Clause
+#
+# Except as represented in this agreement, all work produced by Developer is
+# provided “AS IS”. Other than as provided in this agreement, Developer makes no
+# other warranties, express or implied, and hereby disclaims all implied warranties,
+# including any warranty of merchantability and warranty of fitness for a particular
+# purpose.
+##################################################################################
+
+##################################################################################
+# Date Completed: October 19, 2026
+# Author: John Bumgarner
+#
+# Date Last Revised:
+# Revised by:
+##################################################################################
+
+##################################################################################
+# Python imports required for basic operations
+##################################################################################
+# Standard library imports
+import os
+import re
+import html
+import json
+import time
+import threading
+from contextlib import contextmanager
+from urllib.parse import unquote_plus
+from typing import Dict, Iterator, List, Optional, Pattern, Tuple
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Third-party imports
+from requests.adapters import HTTPAdapter
+
+# Local or project-specific imports
+from wordhoard.utilities.request_html import Query
+
+FIXTURES_DIRECTORY = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+
+# The request header that carries the original URL to the stub server
+ORIGINAL_URL_HEADER = 'X-Fixture-Url'
+
+# Generic markup appended to the fixtures to emulate the weight of the live pages
+_PADDING_BLOCK = ('<div class="related-content"><ul>' +
+                  ''.join(f'<li><a href="/related/{number}">related entry {number}</a></li>' for number in range(10)) +
+                  '</ul></div>\n')
+
+
+class FixtureStore:
+    """
+        This class resolves a source URL to the fixture page that is served for it.
+
+        Parameters
+        ----------
+        directory : str, optional
+            The directory that contains index.json and the fixture files.
+        padding_kb : int, optional
+            Kilobytes of generic markup appended to every page.
+
+        Methods
+        -------
+        render(url: str) -> Optional[bytes]:
+            Returns the page for a URL or None when no fixture matches the URL.
+        urls(word: str) -> List[str]:
+            Returns the URLs that the fixtures serve for a word.
+    """
+
+    def __init__(self, directory: str = FIXTURES_DIRECTORY, padding_kb: int = 0):
+        with open(file=os.path.join(directory, 'index.json'), mode='r', encoding='utf-8') as infile:
+            index: Dict[str, str] = json.load(infile)
+        self._patterns: List[Tuple[str, Pattern, str]] = []
+        for url_pattern, file_name in index.items():
+            with open(file=os.path.join(directory, file_name), mode='r', encoding='utf-8') as infile:
+                template = infile.read()
+            if padding_kb:
+                padding = _PADDING_BLOCK * (padding_kb * 1024 // len(_PADDING_BLOCK) + 1)
+                template = template.replace('</body>', f'{padding}</body>')
+            regex_pattern = re.escape(url_pattern).replace(re.escape('{word}'), '(?P<word>[^/?&]+)')
+            self._patterns.append((url_pattern, re.compile(f'^{regex_pattern}$'), template))
+
+    def render(self, url: str) -> Optional[bytes]:
+        url = unquote_plus(url.replace('+', '%2B'))
+        for _, pattern, template in self._patterns:
+            match = pattern.match(url)
+            if match:
+                word = match.groupdict().get('word', '')
+                return template.replace('{word}', html.escape(word)).encode('utf-8')
+        return None
+
+    def urls(self, word: str) -> List[str]:
+        return [url_pattern.replace('{word}', word) for url_pattern, _, _ in self._patterns]
+
+
+class StubServer:
+    """
+        This class runs a threaded HTTP server on the loopback interface, which serves
+        the fixture pages for the URL passed in the X-Fixture-Url request header.
+
+        Usage Examples
+        ----------
+        >>> with StubServer(latency_ms=20) as server:
+        ...     with route_queries_to(server):
+        ...         Synonyms('good').find_synonyms()
+
+        Parameters
+        ----------
+        store : FixtureStore, optional
+            The fixtures to serve.
+        latency_ms : float, optional
+            Delay added to every response to emulate the network round trip.
+
+        Attributes
+        ----------
+        address : str
+            The base URL of the running server.
+        requests_served : int
+            The number of requests answered by the server.
+    """
+
+    def __init__(self, store: Optional[FixtureStore] = None, latency_ms: float = 0.0):
+        self._store = store or FixtureStore()
+        self._latency = latency_ms / 1000
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self.requests_served = 0
+
+    @property
+    def address(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f'http://{host}:{port}/'
+
+    def _build_handler(self):
+        stub = self
+
+        class FixtureHandler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def do_GET(self):
+                if stub._latency:
+                    time.sleep(stub._latency)
+                page = stub._store.render(self.headers.get(ORIGINAL_URL_HEADER, ''))
+                with stub._lock:
+                    stub.requests_served += 1
+                status_code = 200 if page is not None else 404
+                body = page if page is not None else b'<html><body><h1>Not Found</h1></body></html>'
+                self.send_response(status_code)
+                self.send_header('Content-Type', 'text/html; charset=utf-8')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        return FixtureHandler
+
+    def start(self) -> 'StubServer':
+        self._server = ThreadingHTTPServer(('127.0.0.1', 0), self._build_handler())
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def __enter__(self) -> 'StubServer':
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+
+class StubAdapter(HTTPAdapter):
+    """
+        This transport adapter sends every request to the stub server and passes
+        the original URL in the X-Fixture-Url request header.
+    """
+
+    def __init__(self, server_address: str, **kwargs):
+        super().__init__(**kwargs)
+        self._server_address = server_address
+
+    def send(self, request, **kwargs):
+        request.headers[ORIGINAL_URL_HEADER] = request.url
+        request.url = self._server_address
+        kwargs['proxies'] = None
+        return super().send(request, **kwargs)
+
+
+@contextmanager
+def route_queries_to(server: StubServer) -> Iterator[None]:
+    """
+    Routes the queries made by wordhoard.utilities.request_html.Query to the stub server.
+
+    :param server: the running stub server
+    :type server: StubServer
+    """
+    original_session_factory = Query.__dict__['_requests_retry_session']
+
+    def _stub_session(*args, **kwargs):
+        session = original_session_factory.__func__(*args, **kwargs)
+        adapter = StubAdapter(server.address, max_retries=0)
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        return session
+
+    Query._requests_retry_session = staticmethod(_stub_session)
+    try:
+        yield
+    finally:
+        Query._requests_retry_session = original_session_factory
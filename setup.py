@@ -18,6 +18,7 @@ setuptools.setup(
     package_data={'files': ['files/common_user_agents.pkl',
                             'files/common_english_homophones.pkl',
                             'files/no_homophones_english.pkl']},
+    entry_points={'console_scripts': ['wordhoard-cache=wordhoard.cache_manager:main']},
     license='LICENSE.txt',
     classifiers=["Development Status :: 5 - Production/Stable",
                  "Intended Audience :: Developers",
@@ -0,0 +1,146 @@
+"""
+This Python script is designed to perform unit testing of Wordhoard's
+asynchronous translation module.
+"""
+__author__ = 'John Bumgarner'
+__date__ = 'October 19, 2026'
+__status__ = 'Quality Assurance'
+__license__ = 'MIT'
+__copyright__ = "Copyright (C) 2021 John Bumgarner"
+
+##################################################################################
+# Date Completed: October 19, 2026
+# Author: John Bumgarner
+#
+# Date Last Revised:
+# Revised by:
+##################################################################################
+
+##################################################################################
+# “AS-IS” Clause
+#
+# Except as represented in this agreement, all work produced by Developer is
+# provided “AS IS”. Other than as provided in this agreement, Developer makes no
+# other warranties, express or implied, and hereby disclaims all implied warranties,
+# including any warranty of merchantability and warranty of fitness for a particular
+# purpose.
+##################################################################################
+
+##################################################################################
+# Python imports required for basic operations
+##################################################################################
+import time
+import asyncio
+import threading
+import unittest
+from urllib.parse import parse_qs, urlparse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from wordhoard.utilities import async_translation, google_translator, translation_cache
+from wordhoard.utilities.google_translator import Translator
+
+SPANISH_WORDS = {'casa': 'house', 'perro': 'dog', 'gato': 'cat', 'libro': 'book'}
+
+
+class SlowTranslationHandler(BaseHTTPRequestHandler):
+    lock = threading.Lock()
+    running = 0
+    max_running = 0
+
+    def do_GET(self):
+        with SlowTranslationHandler.lock:
+            SlowTranslationHandler.running += 1
+            SlowTranslationHandler.max_running = max(SlowTranslationHandler.max_running, SlowTranslationHandler.running)
+        time.sleep(0.2)
+        with SlowTranslationHandler.lock:
+            SlowTranslationHandler.running -= 1
+        query = parse_qs(urlparse(self.path).query)['q'][0]
+        translations = '\n'.join(SPANISH_WORDS.get(line, line) for line in query.split('\n'))
+        body = f'<html><body><div class="result-container">{translations}</div></body></html>'.encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class TestAsyncTranslationFunction(unittest.TestCase):
+
+    def setUp(self):
+        translation_cache.enable_translation_cache()
+        SlowTranslationHandler.max_running = 0
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), SlowTranslationHandler)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.batch_max_texts = google_translator.GOOGLE_BATCH_MAX_TEXTS
+        # a batch of a single word, so every word is a separate request
+        google_translator.GOOGLE_BATCH_MAX_TEXTS = 1
+
+    def tearDown(self):
+        google_translator.GOOGLE_BATCH_MAX_TEXTS = self.batch_max_texts
+        async_translation.configure_async_translation()
+        self.server.shutdown()
+        self.server.server_close()
+        translation_cache.enable_translation_cache()
+
+    def _translator(self, word=''):
+        translator = Translator(source_language='es', str_to_translate=word)
+        translator._url_to_query = f'http://127.0.0.1:{self.server.server_address[1]}/m'
+        return translator
+
+    def test_atranslate_word(self):
+        """
+        This test is designed to pass, because the translations of several words are
+        awaited concurrently without blocking the event loop
+        :return:
+        """
+        async def translate_words():
+            return await asyncio.gather(*(self._translator(word).atranslate_word() for word in ('casa', 'perro')))
+        started = time.monotonic()
+        self.assertEqual(asyncio.run(translate_words()), ['house', 'dog'])
+        self.assertLess(time.monotonic() - started, 0.39)
+
+    def test_atranslate_many_is_concurrent(self):
+        """
+        This test is designed to pass, because the batches of atranslate_many are
+        translated concurrently
+        :return:
+        """
+        started = time.monotonic()
+        translations = asyncio.run(self._translator().atranslate_many(list(SPANISH_WORDS)))
+        self.assertEqual(translations, SPANISH_WORDS)
+        self.assertLess(time.monotonic() - started, 0.79)
+        self.assertGreater(SlowTranslationHandler.max_running, 1)
+
+    def test_concurrency_is_bounded(self):
+        """
+        This test is designed to pass, because no more translation requests than the
+        configured maximum are made concurrently
+        :return:
+        """
+        async_translation.configure_async_translation(max_concurrency=2)
+        translations = asyncio.run(self._translator().atranslate_many(list(SPANISH_WORDS)))
+        self.assertEqual(translations, SPANISH_WORDS)
+        self.assertEqual(SlowTranslationHandler.max_running, 2)
+        with self.assertRaises(ValueError):
+            async_translation.configure_async_translation(max_concurrency=0)
+
+    def test_areverse_translate_many_uses_resolved_language(self):
+        """
+        This test is designed to pass, because the reverse translations of areverse_translate_many
+        are cached under the resolved language code, like those of reverse_translate_many, and an
+        unsupported language is not sent to the translation service
+        :return:
+        """
+        translations = asyncio.run(self._translator().areverse_translate_many(['house', 'dog'],
+                                                                              source_language='spanish'))
+        self.assertEqual(translations, {'house': 'house', 'dog': 'dog'})
+        self.assertEqual(translation_cache.cached_translation('google', 'en', 'es', 'house'), 'house')
+        self.assertIsNone(translation_cache.cached_translation('google', 'en', 'spanish', 'house'))
+        translations = asyncio.run(self._translator().areverse_translate_many(['house'], source_language='klingon'))
+        self.assertEqual(translations, {'house': None})
+        self.assertIsNone(translation_cache.cached_translation('google', 'en', 'klingon', 'house'))
+
+
+unittest.main()
@@ -0,0 +1,70 @@
+"""
+This Python script is designed to perform unit testing of Wordhoard's
+cache manager module.
+"""
+__author__ = 'John Bumgarner'
+__date__ = 'October 19, 2026'
+__status__ = 'Quality Assurance'
+__license__ = 'MIT'
+__copyright__ = "Copyright (C) 2021 John Bumgarner"
+
+##################################################################################
+# Date Completed: October 19, 2026
+# Author: John Bumgarner
+#
+# Date Last Revised:
+# Revised by:
+##################################################################################
+
+##################################################################################
+# “AS-IS” Clause
+#
+# Except as represented in this agreement, all work produced by Developer is
+# provided “AS IS”. Other than as provided in this agreement, Developer makes no
+# other warranties, express or implied, and hereby disclaims all implied warranties,
+# including any warranty of merchantability and warranty of fitness for a particular
+# purpose.
+##################################################################################
+
+##################################################################################
+# Python imports required for basic operations
+##################################################################################
+import unittest
+from unittest.mock import patch
+from wordhoard import cache_manager
+from wordhoard.utilities import caching
+from wordhoard.utilities.exceptions import QueryRequestException
+
+
+class _Lookup:
+    """
+    A relation class whose lookups fail for the word 'unreachable'.
+    """
+    looked_up = []
+
+    def __init__(self, search_string, **kwargs):
+        self._word = search_string
+
+    def find_synonyms(self):
+        _Lookup.looked_up.append(self._word)
+        if self._word == 'unreachable':
+            raise QueryRequestException('The repository could not be reached.')
+
+
+class TestCacheManagerFunction(unittest.TestCase):
+
+    def test_warm_continues_after_failed_lookups(self):
+        """
+        This test is designed to pass, because a failed lookup is reported and the
+        warming job continues with the other words
+        :return:
+        """
+        relations = {'synonyms': (_Lookup, 'find_synonyms', caching.cache_synonyms)}
+        with patch.dict(cache_manager._RELATIONS, relations, clear=True):
+            report = cache_manager.warm(words=['warm-first', 'unreachable', 'warm-last'], max_workers=2)
+        self.assertEqual(report.number_of_lookups, 3)
+        self.assertEqual(report.failures, {('synonyms', 'unreachable'): 'The repository could not be reached.'})
+        self.assertEqual(sorted(_Lookup.looked_up), ['unreachable', 'warm-first', 'warm-last'])
+
+
+unittest.main()
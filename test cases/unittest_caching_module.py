@@ -0,0 +1,175 @@
+"""
+This Python script is designed to perform unit testing of Wordhoard's
+caching module.
+"""
+__author__ = 'John Bumgarner'
+__date__ = 'October 19, 2026'
+__status__ = 'Quality Assurance'
+__license__ = 'MIT'
+__copyright__ = "Copyright (C) 2021 John Bumgarner"
+
+##################################################################################
+# Date Completed: October 19, 2026
+# Author: John Bumgarner
+#
+# Date Last Revised:
+# Revised by:
+##################################################################################
+
+##################################################################################
+# “AS-IS” Clause
+#
+# Except as represented in this agreement, all work produced by Developer is
+# provided “AS IS”. Other than as provided in this agreement, Developer makes no
+# other warranties, express or implied, and hereby disclaims all implied warranties,
+# including any warranty of merchantability and warranty of fitness for a particular
+# purpose.
+##################################################################################
+
+##################################################################################
+# Python imports required for basic operations
+##################################################################################
+import os
+import tempfile
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from wordhoard.utilities import caching
+
+
+class TestCachingFunction(unittest.TestCase):
+
+    def tearDown(self):
+        caching.enable_compact_storage(False)
+        caching.set_key_normalization()
+
+    def test_compact_storage_round_trip(self):
+        """
+        This test is designed to pass, because values cached in compact form are
+        returned unchanged and shared strings are interned only once
+        :return:
+        """
+        caching.enable_compact_storage(True)
+        caching.insert_word_cache_synonyms('compact-a', 'adjective', ['fine', 'good'])
+        caching.insert_word_cache_synonyms('compact-b', 'adjective', ['good', 'great'])
+        caching.insert_word_cache_synonyms('compact-a', 'adjective', ['good', 'nice'])
+        self.assertEqual(caching.cache_synonyms('compact-a'), (True, {'adjective': ['fine', 'good', 'nice']}))
+        self.assertEqual(caching.cache_synonyms('compact-b'), (True, {'adjective': ['good', 'great']}))
+        self.assertEqual(caching._vocabulary.count('good'), 1)
+
+    def test_compressed_values_round_trip(self):
+        """
+        This test is designed to pass, because a compressed blob decompresses to the original values
+        :return:
+        """
+        values = ['big', 'large', 'huge']
+        self.assertEqual(caching.decompress_values(caching.compress_values(values)), values)
+        self.assertEqual(caching.decompress_values(caching.compress_values([])), [])
+
+    def test_compressed_values_edge_cases(self):
+        """
+        This test is designed to pass, because empty strings, separator characters and
+        quotes in the values do not change the decompressed values
+        :return:
+        """
+        for values in ([''], ['', ''], ['a\x1fb', 'c'], ['\n', ',', '"quoted"', '[]'], ['mère', 'größe']):
+            self.assertEqual(caching.decompress_values(caching.compress_values(values)), values)
+
+    def test_export_import_round_trip(self):
+        """
+        This test is designed to pass, because cache entries exported to a file are loaded back unchanged
+        :return:
+        """
+        caching.insert_word_cache_antonyms('transfer', 'verb', ['keep'])
+        caching.insert_word_cache_hypernyms('transfer', ['move'])
+        for file_name in ('cache.jsonl', 'cache.db'):
+            with tempfile.TemporaryDirectory() as directory:
+                file_path = os.path.join(directory, file_name)
+                number_of_entries = caching.export_cache(file_path)
+                caching.temporary_dict_antonyms.pop('transfer')
+                caching.temporary_dict_hypernyms.pop('transfer')
+                self.assertEqual(caching.import_cache(file_path), number_of_entries)
+                self.assertEqual(caching.cache_antonyms('transfer'), (True, {'verb': ['keep']}))
+                self.assertEqual(caching.cache_hypernyms('transfer'), (True, ['move']))
+
+    def test_concurrent_merges(self):
+        """
+        This test is designed to pass, because concurrent merges for the same word
+        neither lose nor duplicate values, including values passed as sets
+        :return:
+        """
+        def merge(number):
+            caching.insert_word_cache_synonyms('concurrent', 'noun', {f'value-{number % 50}'})
+            caching.insert_word_cache_hyponyms('concurrent', [f'value-{number % 50}'])
+
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            list(executor.map(merge, range(2000)))
+        self.assertEqual(sorted(caching.cache_synonyms('concurrent')[1]['noun']),
+                         sorted(f'value-{number}' for number in range(50)))
+        self.assertEqual(len(caching.cache_hyponyms('concurrent')[1]), 50)
+
+    def test_cached_output_memoization(self):
+        """
+        This test is designed to pass, because the output for a cached word is built once per
+        output format, is rebuilt after a merge and cannot be changed by the caller
+        :return:
+        """
+        calls = []
+
+        def build_output(values):
+            calls.append(values)
+            return sorted(values)
+
+        caching.insert_word_cache_hypernyms('memo', ['tree', 'plant'])
+        first_output = caching.cached_output('hypernyms', 'memo', 'list', build_output)
+        first_output[1].append('changed')
+        self.assertEqual(caching.cached_output('hypernyms', 'memo', 'list', build_output), (True, ['plant', 'tree']))
+        self.assertEqual(len(calls), 1)
+        caching.insert_word_cache_hypernyms('memo', ['organism'])
+        self.assertEqual(caching.cached_output('hypernyms', 'memo', 'list', build_output),
+                         (True, ['organism', 'plant', 'tree']))
+        self.assertEqual(len(calls), 2)
+        self.assertEqual(caching.cached_output('hypernyms', 'missing', 'list', build_output), (False, None))
+
+    def test_cached_output_memo_is_bounded(self):
+        """
+        This test is designed to pass, because the memo keeps one output per output format
+        for a word in any casing and evicts the least recently used words
+        :return:
+        """
+        caching.insert_word_cache_hypernyms('bounded', ['tree'])
+        for display_word in ('bounded', 'Bounded', 'BOUNDED'):
+            output = caching.cached_output('hypernyms', 'bounded', 'dictionary',
+                                           lambda values: {display_word: values}, display_word=display_word)
+            self.assertEqual(output, (True, {display_word: ['tree']}))
+        self.assertEqual(len(caching._output_memo[('hypernyms', 'bounded')][1]), 1)
+
+        memo_size = caching.OUTPUT_MEMO_SIZE
+        caching.OUTPUT_MEMO_SIZE = 3
+        try:
+            for number in range(5):
+                caching.insert_word_cache_hypernyms(f'bounded-{number}', ['tree'])
+                caching.cached_output('hypernyms', f'bounded-{number}', 'list', sorted)
+            self.assertEqual(list(caching._output_memo),
+                             [('hypernyms', f'bounded-{number}') for number in range(2, 5)])
+        finally:
+            caching.OUTPUT_MEMO_SIZE = memo_size
+            caching.clear_output_memo()
+
+    def test_key_normalization(self):
+        """
+        This test is designed to pass, because different spellings of a search string
+        normalize to the same cache key
+        :return:
+        """
+        self.assertEqual(caching.normalize_key('Good'), caching.normalize_key('  good '))
+        self.assertEqual(caching.normalize_key('Ice   Cream'), 'ice cream')
+        self.assertEqual(caching.normalize_key('stories'), 'stories')
+        caching.set_key_normalization(unicode_form='NFKC', lemmatize=True)
+        self.assertEqual(caching.normalize_key('Stories'), 'story')
+        self.assertEqual(caching.normalize_key('glass'), 'glass')
+        self.assertEqual(caching.normalize_key('ﬁnes'), 'fine')
+        with self.assertRaises(ValueError):
+            caching.set_key_normalization(unicode_form='NFX')
+
+
+unittest.main()
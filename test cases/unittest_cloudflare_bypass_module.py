@@ -0,0 +1,121 @@
+"""
+This Python script is designed to perform unit testing of Wordhoard's
+Cloudflare bypass module.
+"""
+__author__ = 'John Bumgarner'
+__date__ = 'October 19, 2026'
+__status__ = 'Quality Assurance'
+__license__ = 'MIT'
+__copyright__ = "Copyright (C) 2021 John Bumgarner"
+
+##################################################################################
+# Date Completed: October 19, 2026
+# Author: John Bumgarner
+#
+# Date Last Revised:
+# Revised by:
+##################################################################################
+
+##################################################################################
+# “AS-IS” Clause
+#
+# Except as represented in this agreement, all work produced by Developer is
+# provided “AS IS”. Other than as provided in this agreement, Developer makes no
+# other warranties, express or implied, and hereby disclaims all implied warranties,
+# including any warranty of merchantability and warranty of fitness for a particular
+# purpose.
+##################################################################################
+
+##################################################################################
+# Python imports required for basic operations
+##################################################################################
+import tempfile
+import threading
+import unittest
+from unittest.mock import patch
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from wordhoard.utilities import cloudflare_bypass, transport
+from wordhoard.utilities.cloudflare_bypass import Cloudflare
+
+
+class ProtectedPageHandler(BaseHTTPRequestHandler):
+    requests_seen = []
+
+    def do_GET(self):
+        cookie = self.headers.get('Cookie', '')
+        ProtectedPageHandler.requests_seen.append((self.path, cookie))
+        if self.path == '/blocked':
+            self.send_response(403)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+        body = b'<html><body><p>page</p></body></html>'
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html')
+        if 'cf_clearance' not in cookie:
+            self.send_header('Set-Cookie', 'cf_clearance=token; Path=/; Max-Age=3600')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class TestCloudflareBypassFunction(unittest.TestCase):
+
+    def setUp(self):
+        ProtectedPageHandler.requests_seen = []
+        cloudflare_bypass.configure_cloudflare_bypass(max_attempts=3, backoff_factor=0)
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), ProtectedPageHandler)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.url = f'http://127.0.0.1:{self.server.server_address[1]}'
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+        cloudflare_bypass.clear_session_pool()
+        cloudflare_bypass.configure_cloudflare_bypass()
+
+    def test_clearance_is_reused(self):
+        """
+        This test is designed to pass, because the second request to the same host reuses the pooled
+        session and sends the clearance cookie received by the first request
+        :return:
+        """
+        self.assertIsNotNone(Cloudflare(f'{self.url}/first').bypass())
+        self.assertIsNotNone(Cloudflare(f'{self.url}/second').bypass())
+        self.assertEqual(ProtectedPageHandler.requests_seen, [('/first', ''), ('/second', 'cf_clearance=token')])
+
+    def test_bounded_retries(self):
+        """
+        This test is designed to pass, because a blocked URL is requested the configured number of
+        times with a new session for every attempt, after which None is returned
+        :return:
+        """
+        with patch.object(cloudflare_bypass, 'sleep') as sleep:
+            self.assertIsNone(Cloudflare(f'{self.url}/blocked').bypass())
+        self.assertEqual(len(ProtectedPageHandler.requests_seen), 3)
+        # the backoff only separates the attempts, so an exhausted bypass returns without waiting
+        self.assertEqual(sleep.call_count, 2)
+        self.assertEqual(cloudflare_bypass._session_pool, {})
+        with self.assertRaises(ValueError):
+            cloudflare_bypass.configure_cloudflare_bypass(max_attempts=0)
+
+    def test_no_bypass_in_replay_mode(self):
+        """
+        This test is designed to pass, because the replay transport mode makes no network
+        access, so a protected page is not requested again with cloudscraper
+        :return:
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            transport.set_transport('replay', directory)
+            try:
+                self.assertIsNone(Cloudflare(f'{self.url}/first').bypass())
+            finally:
+                transport.set_transport('live')
+        self.assertEqual(ProtectedPageHandler.requests_seen, [])
+        self.assertEqual(cloudflare_bypass._session_pool, {})
+
+
+unittest.main()
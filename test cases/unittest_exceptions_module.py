@@ -0,0 +1,89 @@
+"""
+This Python script is designed to perform unit testing of Wordhoard's
+exceptions raised by the query modules.
+"""
+__author__ = 'John Bumgarner'
+__date__ = 'October 19, 2026'
+__status__ = 'Quality Assurance'
+__license__ = 'MIT'
+__copyright__ = "Copyright (C) 2021 John Bumgarner"
+
+##################################################################################
+# Date Completed: October 19, 2026
+# Author: John Bumgarner
+#
+# Date Last Revised:
+# Revised by:
+##################################################################################
+
+##################################################################################
+# “AS-IS” Clause
+#
+# Except as represented in this agreement, all work produced by Developer is
+# provided “AS IS”. Other than as provided in this agreement, Developer makes no
+# other warranties, express or implied, and hereby disclaims all implied warranties,
+# including any warranty of merchantability and warranty of fitness for a particular
+# purpose.
+##################################################################################
+
+##################################################################################
+# Python imports required for basic operations
+##################################################################################
+import socket
+import unittest
+from wordhoard import Antonyms, Synonyms
+from wordhoard.utilities import request_policy
+from wordhoard.utilities.request_html import Query
+from wordhoard.utilities.exceptions import InvalidOutputFormatException, QueryRequestException
+
+
+def unused_port():
+    with socket.socket() as unbound_socket:
+        unbound_socket.bind(('127.0.0.1', 0))
+        return unbound_socket.getsockname()[1]
+
+
+class TestExceptionsFunction(unittest.TestCase):
+
+    def setUp(self):
+        request_policy.set_request_policy('127.0.0.1', connect_timeout=1, read_timeout=1, retries=0)
+
+    def tearDown(self):
+        request_policy.reset_request_policies()
+
+    def test_query_request_exception(self):
+        """
+        This test is designed to pass, because a connection error is raised as a QueryRequestException
+        instead of exiting the interpreter
+        :return:
+        """
+        url = f'http://127.0.0.1:{unused_port()}/page'
+        with self.assertRaises(QueryRequestException) as context:
+            Query(url_to_scrape=url).get_website_html()
+        self.assertIn(url, str(context.exception))
+        self.assertIsNotNone(context.exception.__cause__)
+
+    def test_failed_source_returns_none(self):
+        """
+        This test is designed to pass, because a source whose request fails is treated as a source
+        without results, so the other sources are still queried
+        :return:
+        """
+        synonym = Synonyms(search_string='unreachable')
+        unreachable_url = f'http://127.0.0.1:{unused_port()}/page'
+        synonym._request_http_response = lambda url: Query(url_to_scrape=unreachable_url).get_website_html()
+        self.assertIsNone(synonym._query_wordnet())
+
+    def test_invalid_output_format(self):
+        """
+        This test is designed to pass, because an invalid output format raises an
+        InvalidOutputFormatException instead of exiting the interpreter
+        :return:
+        """
+        with self.assertRaises(InvalidOutputFormatException):
+            Synonyms(search_string='mother', output_format='xml').find_synonyms()
+        with self.assertRaises(InvalidOutputFormatException):
+            Antonyms(search_string='mother', output_format='csv').find_antonyms()
+
+
+unittest.main()
@@ -0,0 +1,167 @@
+"""
+This Python script is designed to perform unit testing of Wordhoard's
+HTTP response cache module.
+"""
+__author__ = 'John Bumgarner'
+__date__ = 'October 19, 2026'
+__status__ = 'Quality Assurance'
+__license__ = 'MIT'
+__copyright__ = "Copyright (C) 2021 John Bumgarner"
+
+##################################################################################
+# Date Completed: October 19, 2026
+# Author: John Bumgarner
+#
+# Date Last Revised:
+# Revised by:
+##################################################################################
+
+##################################################################################
+# “AS-IS” Clause
+#
+# Except as represented in this agreement, all work produced by Developer is
+# provided “AS IS”. Other than as provided in this agreement, Developer makes no
+# other warranties, express or implied, and hereby disclaims all implied warranties,
+# including any warranty of merchantability and warranty of fitness for a particular
+# purpose.
+##################################################################################
+
+##################################################################################
+# Python imports required for basic operations
+##################################################################################
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from wordhoard.utilities import http_cache
+from wordhoard.utilities.request_html import Query
+
+ETAG = '"page-v1"'
+LAST_MODIFIED = 'Mon, 19 Oct 2026 08:00:00 GMT'
+
+
+class ValidatingHandler(BaseHTTPRequestHandler):
+    requests = []
+
+    def do_GET(self):
+        ValidatingHandler.requests.append((self.path, dict(self.headers)))
+        if self.path == '/missing':
+            self._send(404, b'<html><body><p>not found</p></body></html>')
+        elif self.path == '/challenge':
+            self._send(200, b'<html><head><title>Just a moment...</title></head><body></body></html>')
+        elif self.headers.get('If-None-Match') == ETAG:
+            self.send_response(304)
+            self.send_header('ETag', ETAG)
+            self.end_headers()
+        else:
+            self._send(200, f'<html><body><p>{self.path}</p></body></html>'.encode('utf-8'))
+
+    def _send(self, status_code, body):
+        self.send_response(status_code)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        if status_code == 200:
+            self.send_header('ETag', ETAG)
+            self.send_header('Last-Modified', LAST_MODIFIED)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class TestHttpCacheFunction(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(('127.0.0.1', 0), ValidatingHandler)
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+        cls.base_url = f'http://127.0.0.1:{cls.server.server_address[1]}'
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        ValidatingHandler.requests.clear()
+
+    def tearDown(self):
+        http_cache.disable_http_cache()
+
+    def test_conditional_request_returns_stored_page(self):
+        """
+        This test is designed to pass, because a stored page is revalidated with its
+        validators and the stored body is returned in place of the 304 response
+        :return:
+        """
+        http_cache.enable_http_cache()
+        url = f'{self.base_url}/browse/good'
+        first_response = Query(url_to_scrape=url).get_website_html()
+        second_response = Query(url_to_scrape=url).get_website_html()
+        self.assertEqual(len(ValidatingHandler.requests), 2)
+        self.assertNotIn('If-None-Match', ValidatingHandler.requests[0][1])
+        conditional_headers = ValidatingHandler.requests[1][1]
+        self.assertEqual(conditional_headers['If-None-Match'], ETAG)
+        self.assertEqual(conditional_headers['If-Modified-Since'], LAST_MODIFIED)
+        self.assertEqual(second_response.status_code, 200)
+        self.assertEqual(second_response.text, first_response.text)
+
+    def test_stored_page_without_revalidation(self):
+        """
+        This test is designed to pass, because a stored page is returned without a request
+        when revalidation is disabled
+        :return:
+        """
+        cache = http_cache.enable_http_cache(revalidate=False)
+        url = f'{self.base_url}/browse/mother'
+        first_response = Query(url_to_scrape=url).get_website_html()
+        self.assertIsNotNone(cache.lookup(url))
+        second_response = Query(url_to_scrape=url).get_website_html()
+        self.assertEqual(len(ValidatingHandler.requests), 1)
+        self.assertEqual(second_response.text, first_response.text)
+
+    def test_failed_response_is_not_stored(self):
+        """
+        This test is designed to pass, because a response with a status code other than
+        200 is not stored and the next request is not conditional
+        :return:
+        """
+        cache = http_cache.enable_http_cache()
+        url = f'{self.base_url}/missing'
+        self.assertEqual(Query(url_to_scrape=url).get_website_html().status_code, 404)
+        self.assertIsNone(cache.lookup(url))
+        Query(url_to_scrape=url).get_website_html()
+        self.assertEqual(len(ValidatingHandler.requests), 2)
+        self.assertNotIn('If-None-Match', ValidatingHandler.requests[1][1])
+
+    def test_challenge_page_is_not_stored(self):
+        """
+        This test is designed to pass, because a Cloudflare challenge page is not stored
+        although its status code is 200
+        :return:
+        """
+        cache = http_cache.enable_http_cache()
+        url = f'{self.base_url}/challenge'
+        self.assertEqual(Query(url_to_scrape=url).get_website_html().status_code, 200)
+        self.assertIsNone(cache.lookup(url))
+
+    def test_least_recently_used_page_is_evicted(self):
+        """
+        This test is designed to pass, because the in-memory cache keeps the configured number
+        of pages and evicts the least recently used page first
+        :return:
+        """
+        cache = http_cache.enable_http_cache(max_entries=2)
+        urls = [f'{self.base_url}/browse/{word}' for word in ('good', 'mother', 'house')]
+        Query(url_to_scrape=urls[0]).get_website_html()
+        Query(url_to_scrape=urls[1]).get_website_html()
+        self.assertIsNotNone(cache.lookup(urls[0]))
+        Query(url_to_scrape=urls[2]).get_website_html()
+        self.assertIsNone(cache.lookup(urls[1]))
+        self.assertIsNotNone(cache.lookup(urls[0]))
+        self.assertIsNotNone(cache.lookup(urls[2]))
+        with self.assertRaises(ValueError):
+            http_cache.enable_http_cache(max_entries=0)
+
+
+unittest.main()
@@ -0,0 +1,123 @@
+"""
+This Python script is designed to perform unit testing of Wordhoard's
+metrics module.
+"""
+__author__ = 'John Bumgarner'
+__date__ = 'October 19, 2026'
+__status__ = 'Quality Assurance'
+__license__ = 'MIT'
+__copyright__ = "Copyright (C) 2021 John Bumgarner"
+
+##################################################################################
+# Date Completed: October 19, 2026
+# Author: John Bumgarner
+#
+# Date Last Revised:
+# Revised by:
+##################################################################################
+
+##################################################################################
+# “AS-IS” Clause
+#
+# Except as represented in this agreement, all work produced by Developer is
+# provided “AS IS”. Other than as provided in this agreement, Developer makes no
+# other warranties, express or implied, and hereby disclaims all implied warranties,
+# including any warranty of merchantability and warranty of fitness for a particular
+# purpose.
+##################################################################################
+
+##################################################################################
+# Python imports required for basic operations
+##################################################################################
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from wordhoard.utilities import caching, metrics, protection_detector
+from wordhoard.utilities.request_html import Query
+
+
+class PageHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        body = b'<html><head><title>Just a moment...</title></head><body></body></html>'
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class TestMetricsFunction(unittest.TestCase):
+
+    def setUp(self):
+        metrics.reset_metrics()
+        metrics.enable_metrics()
+
+    def tearDown(self):
+        metrics.disable_metrics()
+        metrics.reset_metrics()
+
+    def test_query_metrics(self):
+        """
+        This test is designed to pass, because the request, the Cloudflare detection and the
+        outcome of a query are recorded with the relation and source of the query scope
+        :return:
+        """
+        server = ThreadingHTTPServer(('127.0.0.1', 0), PageHandler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        url = f'http://127.0.0.1:{server.server_address[1]}/browse/good'
+
+        def query_source():
+            response = Query(url_to_scrape=url).get_website_html()
+            protection_detector.detect_protection(response)
+            return None
+
+        try:
+            metrics.instrument_query('synonyms', 'stub', query_source)()
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        samples = metrics.snapshot()
+        labels = {'relation': 'synonyms', 'source': 'stub'}
+        self.assertEqual(samples['wordhoard_request_seconds'][0]['labels'], labels)
+        self.assertEqual(samples['wordhoard_request_seconds'][0]['count'], 1)
+        self.assertGreater(samples['wordhoard_response_bytes_total'][0]['value'], 0)
+        self.assertEqual(samples['wordhoard_cloudflare_detections_total'][0]['value'], 1)
+        self.assertEqual(samples['wordhoard_queries_total'][0]['labels'], {**labels, 'outcome': 'protected'})
+        self.assertIn('wordhoard_parse_seconds', samples)
+
+    def test_cache_metrics_and_observers(self):
+        """
+        This test is designed to pass, because cache hits and misses are passed to the
+        observers and exported in the Prometheus text exposition format
+        :return:
+        """
+        events = []
+        metrics.add_observer(events.append)
+        try:
+            caching.insert_word_cache_synonyms('metrics-word', 'noun', ['term'])
+            caching.cached_output('synonyms', 'metrics-word', 'list', list)
+            caching.cached_output('synonyms', 'metrics-missing', 'list', list)
+        finally:
+            metrics.remove_observer(events.append)
+
+        self.assertEqual([event.name for event in events],
+                         ['wordhoard_cache_hits_total', 'wordhoard_cache_misses_total'])
+        exposition = metrics.prometheus_text()
+        self.assertIn('# TYPE wordhoard_cache_hits_total counter', exposition)
+        self.assertIn('wordhoard_cache_hits_total{relation="synonyms"} 1', exposition)
+
+    def test_disabled_metrics(self):
+        """
+        This test is designed to pass, because nothing is recorded while metrics are disabled
+        :return:
+        """
+        metrics.disable_metrics()
+        metrics.record_backoff('synonyms')
+        self.assertEqual(metrics.snapshot(), {})
+
+
+unittest.main()
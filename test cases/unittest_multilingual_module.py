@@ -0,0 +1,121 @@
+"""
+This Python script is designed to perform unit testing of Wordhoard's
+multilingual lookup module.
+"""
+__author__ = 'John Bumgarner'
+__date__ = 'October 19, 2026'
+__status__ = 'Quality Assurance'
+__license__ = 'MIT'
+__copyright__ = "Copyright (C) 2021 John Bumgarner"
+
+##################################################################################
+# Date Completed: October 19, 2026
+# Author: John Bumgarner
+#
+# Date Last Revised:
+# Revised by:
+##################################################################################
+
+##################################################################################
+# “AS-IS” Clause
+#
+# Except as represented in this agreement, all work produced by Developer is
+# provided “AS IS”. Other than as provided in this agreement, Developer makes no
+# other warranties, express or implied, and hereby disclaims all implied warranties,
+# including any warranty of merchantability and warranty of fitness for a particular
+# purpose.
+##################################################################################
+
+##################################################################################
+# Python imports required for basic operations
+##################################################################################
+import json
+import threading
+import unittest
+from urllib.parse import parse_qs, urlparse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from wordhoard import Synonyms, Hypernyms
+from wordhoard.utilities import caching, translation_cache
+from wordhoard.utilities.google_translator import Translator
+
+TRANSLATIONS = {'es': {'abuela': 'grandmother'},
+                'en': {'grandma': 'abuelita', 'granny': 'yaya', 'nana': 'abuelita', 'grandmother': 'abuela',
+                       'parent': 'progenitor', 'relative': 'pariente'}}
+
+
+class TranslationHandler(BaseHTTPRequestHandler):
+    queries = []
+
+    def do_GET(self):
+        query = parse_qs(urlparse(self.path).query)
+        TranslationHandler.queries.append((query['sl'][0], query['q'][0]))
+        translations = TRANSLATIONS[query['sl'][0]]
+        lines = [translations.get(line, line) for line in query['q'][0].split('\n')]
+        body = f'<html><body><div class="result-container">{chr(10).join(lines)}</div></body></html>'.encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class TestMultilingualFunction(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        caching.insert_word_cache_synonyms('grandmother', 'noun', ['grandma', 'granny', 'nana'])
+        caching.insert_word_cache_hypernyms('grandmother', ['parent', 'relative'])
+
+    def setUp(self):
+        translation_cache.enable_translation_cache()
+        TranslationHandler.queries = []
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), TranslationHandler)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+        translation_cache.enable_translation_cache()
+
+    def _translator(self):
+        translator = Translator(source_language='es')
+        translator._url_to_query = f'http://127.0.0.1:{self.server.server_address[1]}/m'
+        return translator
+
+    def test_translated_synonyms(self):
+        """
+        This test is designed to pass, because the word is translated into English,
+        the English synonyms are looked up and translated back with a single request
+        :return:
+        """
+        synonyms = Synonyms('abuela', translator=self._translator()).find_synonyms()
+        self.assertEqual(synonyms, ['abuelita', 'yaya'])
+        self.assertEqual(TranslationHandler.queries, [('es', 'abuela'), ('en', 'grandma\ngranny\nnana')])
+
+    def test_translated_output_formats(self):
+        """
+        This test is designed to pass, because the dictionary and json outputs keep
+        their keys and the word of the lookup, and only their results are translated
+        :return:
+        """
+        hypernyms = Hypernyms('abuela', output_format='dictionary', translator=self._translator()).find_hypernyms()
+        self.assertEqual(hypernyms, {'abuela': ['progenitor', 'pariente']})
+        hypernyms = Hypernyms('abuela', output_format='json', translator=self._translator()).find_hypernyms()
+        self.assertEqual(json.loads(hypernyms)['hypernyms']['abuela'], ['progenitor', 'pariente'])
+        self.assertEqual(len(TranslationHandler.queries), 2)
+
+    def test_translated_stream(self):
+        """
+        This test is designed to pass, because the streamed results of a translated
+        lookup are translated back as well
+        :return:
+        """
+        results = list(Synonyms('abuela', translator=self._translator()).iter_synonyms())
+        self.assertEqual(len(results), 1)
+        self.assertEqual(results[0].output, ['abuelita', 'yaya'])
+
+
+unittest.main()
@@ -0,0 +1,110 @@
+"""
+This Python script is designed to perform unit testing of Wordhoard's
+phonetic homophones module.
+"""
+__author__ = 'John Bumgarner'
+__date__ = 'October 19, 2026'
+__status__ = 'Quality Assurance'
+__license__ = 'MIT'
+__copyright__ = "Copyright (C) 2021 John Bumgarner"
+
+##################################################################################
+# Date Completed: October 19, 2026
+# Author: John Bumgarner
+#
+# Date Last Revised:
+# Revised by:
+##################################################################################
+
+##################################################################################
+# “AS-IS” Clause
+#
+# Except as represented in this agreement, all work produced by Developer is
+# provided “AS IS”. Other than as provided in this agreement, Developer makes no
+# other warranties, express or implied, and hereby disclaims all implied warranties,
+# including any warranty of merchantability and warranty of fitness for a particular
+# purpose.
+##################################################################################
+
+##################################################################################
+# Python imports required for basic operations
+##################################################################################
+import unittest
+from wordhoard import Homophones
+from wordhoard.homophones import homophones_of_words, phonetic_homophones
+from wordhoard.utilities.phonetics import consonant_voicing, double_metaphone, vowel_sounds
+
+
+class TestPhoneticsFunction(unittest.TestCase):
+
+    def test_double_metaphone_keys(self):
+        """
+        This test is designed to pass, because words that sound alike have the same
+        Double Metaphone key and the alternate key covers a second pronunciation
+        :return:
+        """
+        self.assertEqual(double_metaphone('knight'), double_metaphone('night'))
+        self.assertEqual(double_metaphone('wright')[0], double_metaphone('rite')[0])
+        self.assertEqual(double_metaphone('flour'), double_metaphone('flower'))
+        self.assertEqual(double_metaphone('smith'), ('SM0', 'XMT'))
+        self.assertEqual(double_metaphone('schmidt'), ('XMT', 'SMT'))
+        self.assertEqual(double_metaphone(''), ('', ''))
+        self.assertEqual(double_metaphone('interposition'), ('ANTR', 'ANTR'))
+        self.assertNotEqual(double_metaphone('interposition', 12), double_metaphone('interpretation', 12))
+
+    def test_vowel_sounds_and_consonant_voicing(self):
+        """
+        This test is designed to pass, because the vowel sounds and the consonant voicing
+        separate words that Double Metaphone encodes alike
+        :return:
+        """
+        self.assertEqual(vowel_sounds('nite'), vowel_sounds('night'))
+        self.assertEqual(vowel_sounds('horse'), vowel_sounds('hoarse'))
+        self.assertNotEqual(vowel_sounds('hat'), vowel_sounds('hate'))
+        self.assertEqual(consonant_voicing('kwik'), consonant_voicing('kick'))
+        self.assertNotEqual(consonant_voicing('pig'), consonant_voicing('pick'))
+        self.assertNotEqual(consonant_voicing('provided'), consonant_voicing('profited'))
+        self.assertEqual(phonetic_homophones('tented'), ())
+
+    def test_curated_homophones_take_precedence(self):
+        """
+        This test is designed to pass, because a word in the curated list of common
+        English homophones is answered from that list
+        :return:
+        """
+        self.assertEqual(Homophones('horse').find_homophones(), ['horse is a homophone of hoarse'])
+
+    def test_search_word_is_normalized(self):
+        """
+        This test is designed to pass, because a mixed case search word is looked up
+        in lowercase in the curated and the phonetic indexes
+        :return:
+        """
+        self.assertEqual(Homophones('Horse').find_homophones(), ['horse is a homophone of hoarse'])
+        self.assertIn('nite may be a homophone of night', Homophones(' NITE ').find_homophones())
+        self.assertEqual(homophones_of_words(['Knight'], phonetic=False), {'knight': ['night']})
+
+    def test_phonetic_homophone_candidates(self):
+        """
+        This test is designed to pass, because a word that is not in the curated
+        lists gets the homophone candidates of the phonetic index
+        :return:
+        """
+        homophones = Homophones('nite').find_homophones()
+        self.assertIn('nite may be a homophone of night', homophones)
+        self.assertLessEqual(len(Homophones('nite', max_candidates=3).find_homophones()), 3)
+        self.assertIsNone(Homophones('nite', phonetic=False).find_homophones())
+
+    def test_homophones_of_words(self):
+        """
+        This test is designed to pass, because the homophones of the distinct words
+        of a text are found with one lookup per word
+        :return:
+        """
+        homophones = homophones_of_words('The knight saw the nite sky'.split())
+        self.assertEqual(homophones['knight'], ['night'])
+        self.assertIn('night', homophones['nite'])
+        self.assertEqual(homophones_of_words(['knight', 'nite'], phonetic=False), {'knight': ['night']})
+
+
+unittest.main()
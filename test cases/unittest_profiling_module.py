@@ -0,0 +1,75 @@
+"""
+This Python script is designed to perform unit testing of Wordhoard's
+profiling module.
+"""
+__author__ = 'John Bumgarner'
+__date__ = 'October 19, 2026'
+__status__ = 'Quality Assurance'
+__license__ = 'MIT'
+__copyright__ = "Copyright (C) 2021 John Bumgarner"
+
+##################################################################################
+# Date Completed: October 19, 2026
+# Author: John Bumgarner
+#
+# Date Last Revised:
+# Revised by:
+##################################################################################
+
+##################################################################################
+# “AS-IS” Clause
+#
+# Except as represented in this agreement, all work produced by Developer is
+# provided “AS IS”. Other than as provided in this agreement, Developer makes no
+# other warranties, express or implied, and hereby disclaims all implied warranties,
+# including any warranty of merchantability and warranty of fitness for a particular
+# purpose.
+##################################################################################
+
+##################################################################################
+# Python imports required for basic operations
+##################################################################################
+import os
+import time
+import tempfile
+import unittest
+from wordhoard.utilities import cleansing
+from wordhoard.utilities.profiling import SamplingProfiler, profile
+
+
+class TestProfilingFunction(unittest.TestCase):
+
+    def test_collapsed_stack_profile(self):
+        """
+        This test is designed to pass, because the time spent in the cleansing module is
+        attributed to the cleansing stage and written in the collapsed stack format
+        :return:
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            output = os.path.join(directory, 'profile.folded')
+            with profile(output, interval=0.001) as profiler:
+                finish = time.perf_counter() + 0.3
+                while time.perf_counter() < finish:
+                    cleansing.normalize_search_string('  Running   Dogs ', unicode_form='NFKC', lemmatize=True)
+
+            self.assertGreater(profiler.samples, 0)
+            self.assertGreater(profiler.stage_summary()['cleansing']['wall'], 0)
+            with open(file=output, mode='r', encoding='utf-8') as infile:
+                lines = infile.read().splitlines()
+            self.assertTrue(lines)
+            for line in lines:
+                stack, microseconds = line.rsplit(' ', 1)
+                self.assertGreater(int(microseconds), 0)
+                self.assertIn('wordhoard.', stack)
+            self.assertTrue(any('wordhoard.utilities.cleansing.normalize_search_string' in line for line in lines))
+
+    def test_invalid_clock(self):
+        """
+        This test is designed to pass, because only the wall and cpu clocks are accepted
+        :return:
+        """
+        with self.assertRaises(ValueError):
+            SamplingProfiler(clock='gpu')
+
+
+unittest.main()
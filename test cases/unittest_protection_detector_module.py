@@ -0,0 +1,71 @@
+"""
+This Python script is designed to perform unit testing of Wordhoard's
+response protection detector module.
+"""
+__author__ = 'John Bumgarner'
+__date__ = 'October 19, 2026'
+__status__ = 'Quality Assurance'
+__license__ = 'MIT'
+__copyright__ = "Copyright (C) 2021 John Bumgarner"
+
+##################################################################################
+# Date Completed: October 19, 2026
+# Author: John Bumgarner
+#
+# Date Last Revised:
+# Revised by:
+##################################################################################
+
+##################################################################################
+# “AS-IS” Clause
+#
+# Except as represented in this agreement, all work produced by Developer is
+# provided “AS IS”. Other than as provided in this agreement, Developer makes no
+# other warranties, express or implied, and hereby disclaims all implied warranties,
+# including any warranty of merchantability and warranty of fitness for a particular
+# purpose.
+##################################################################################
+
+##################################################################################
+# Python imports required for basic operations
+##################################################################################
+import unittest
+from requests.structures import CaseInsensitiveDict
+from wordhoard.utilities import protection_detector
+
+
+class TestProtectionDetectorFunction(unittest.TestCase):
+
+    def test_classify_response(self):
+        """
+        This test is designed to pass, because Cloudflare challenges, captchas and rate limits are
+        identified from the status code, the headers and the start of the body
+        :return:
+        """
+        no_headers = CaseInsensitiveDict()
+        self.assertEqual(protection_detector.classify_response(
+            200, no_headers, b'<html><head><title>Just a moment...</title></head></html>'), protection_detector.CLOUDFLARE)
+        self.assertEqual(protection_detector.classify_response(
+            403, no_headers, '<div id="challenge-body-text">checking</div>'), protection_detector.CLOUDFLARE)
+        self.assertEqual(protection_detector.classify_response(
+            403, CaseInsensitiveDict({'cf-mitigated': 'challenge'}), b''), protection_detector.CLOUDFLARE)
+        self.assertEqual(protection_detector.classify_response(
+            200, no_headers, b'<html><head><title>Are you a robot?</title></head></html>'), protection_detector.CAPTCHA)
+        self.assertEqual(protection_detector.classify_response(
+            200, no_headers, b'<div id="px-captcha"></div>'), protection_detector.CAPTCHA)
+        self.assertEqual(protection_detector.classify_response(429, no_headers, b''), protection_detector.RATE_LIMITED)
+        self.assertEqual(protection_detector.classify_response(
+            200, no_headers, b'<html><head><title>mother | Thesaurus</title></head></html>'), protection_detector.OK)
+
+    def test_bounded_scan(self):
+        """
+        This test is designed to pass, because only the first SCAN_BYTES bytes of the body are scanned,
+        so a marker deep inside a normal page is ignored
+        :return:
+        """
+        body = b'<html><body>' + b' ' * protection_detector.SCAN_BYTES + b'<div id="px-captcha"></div></body></html>'
+        self.assertEqual(protection_detector.classify_response(200, CaseInsensitiveDict(), body),
+                         protection_detector.OK)
+
+
+unittest.main()
@@ -0,0 +1,139 @@
+"""
+This Python script is designed to perform unit testing of Wordhoard's
+multi-source query runner module.
+"""
+__author__ = 'John Bumgarner'
+__date__ = 'October 19, 2026'
+__status__ = 'Quality Assurance'
+__license__ = 'MIT'
+__copyright__ = "Copyright (C) 2021 John Bumgarner"
+
+##################################################################################
+# Date Completed: October 19, 2026
+# Author: John Bumgarner
+#
+# Date Last Revised:
+# Revised by:
+##################################################################################
+
+##################################################################################
+# “AS-IS” Clause
+#
+# Except as represented in this agreement, all work produced by Developer is
+# provided “AS IS”. Other than as provided in this agreement, Developer makes no
+# other warranties, express or implied, and hereby disclaims all implied warranties,
+# including any warranty of merchantability and warranty of fitness for a particular
+# purpose.
+##################################################################################
+
+##################################################################################
+# Python imports required for basic operations
+##################################################################################
+import time
+import asyncio
+import unittest
+from wordhoard import Synonyms
+from wordhoard.utilities import caching, query_runner
+
+
+def source(results, delay):
+    def query():
+        time.sleep(delay)
+        return (results, 'adjective') if results else None
+    return query
+
+
+class TestQueryRunnerFunction(unittest.TestCase):
+
+    def test_deadline(self):
+        """
+        This test is designed to pass, because the results of the sources that finished before
+        the deadline are returned without waiting for the slow source, which is marked incomplete
+        :return:
+        """
+        tasks = {'fast': source(['fine'], 0), 'slow': source(['great'], 1.0)}
+        started = time.monotonic()
+        finished, incomplete = query_runner.run_query_tasks(tasks, deadline=0.2)
+        self.assertLess(time.monotonic() - started, 0.8)
+        self.assertEqual(finished, [(['fine'], 'adjective')])
+        self.assertEqual(incomplete, ['slow'])
+
+    def test_quorum_and_min_results(self):
+        """
+        This test is designed to pass, because the results are returned as soon as the quorum
+        of sources agree on a result or the minimum number of results is reached, and empty
+        sources do not count
+        :return:
+        """
+        tasks = {'empty': source([], 0), 'first': source(['fine'], 0.05),
+                 'second': source(['good', 'nice'], 0.1), 'slow': source(['great'], 1.0)}
+        agreeing_tasks = {'first': source(['fine'], 0), 'second': source(['good'], 0.05),
+                          'third': source(['Good', 'nice'], 0.1), 'slow': source(['good'], 1.0)}
+        finished, incomplete = query_runner.run_query_tasks(agreeing_tasks, quorum=2)
+        self.assertEqual(len(finished), 3)
+        self.assertEqual(incomplete, ['slow'])
+
+        # the sources return results, but no two sources agree on a result
+        finished, incomplete = query_runner.run_query_tasks(tasks, quorum=2)
+        self.assertEqual(len(finished), 4)
+        self.assertEqual(incomplete, [])
+
+        finished, incomplete = query_runner.run_query_tasks(tasks, min_results=3)
+        self.assertEqual(sorted(word for result in finished if result for word in result[0]), ['fine', 'good', 'nice'])
+        self.assertEqual(incomplete, ['slow'])
+
+        finished, incomplete = query_runner.run_query_tasks(tasks)
+        self.assertEqual(len(finished), 4)
+        self.assertEqual(incomplete, [])
+
+    def test_find_synonyms_with_deadline(self):
+        """
+        This test is designed to pass, because find_synonyms returns the synonyms of the sources
+        that finished before the deadline and lists the other sources in incomplete_sources
+        :return:
+        """
+        synonym = Synonyms(search_string='deadlineword', sources=['collins', 'wordnet'])
+        synonym._query_collins_dictionary = source(['fine', 'good'], 0)
+        synonym._query_wordnet = source(['great'], 1.0)
+        self.assertEqual(synonym.find_synonyms(deadline=0.2), ['fine', 'good'])
+        self.assertEqual(synonym.incomplete_sources, ['wordnet'])
+        caching.merge_word_cache('synonyms', 'deadlineword', ['fine'], pos_category='adjective')
+        self.assertEqual(synonym.find_synonyms(), ['fine'])
+        self.assertEqual(synonym.incomplete_sources, [])
+        with self.assertRaises(ValueError):
+            synonym.find_synonyms(deadline=0)
+
+    def test_iter_query_tasks(self):
+        """
+        This test is designed to pass, because the results are yielded in the order in which
+        the sources finish and the incomplete sources are returned when the generator stops
+        :return:
+        """
+        tasks = {'slow': source(['great'], 0.2), 'fast': source(['fine'], 0), 'late': source(['nice'], 1.0)}
+        stream = query_runner.iter_query_tasks(tasks, deadline=0.5)
+        self.assertEqual(next(stream), ('fast', (['fine'], 'adjective')))
+        self.assertEqual(next(stream), ('slow', (['great'], 'adjective')))
+        with self.assertRaises(StopIteration) as stop:
+            next(stream)
+        self.assertEqual(stop.exception.value, ['late'])
+
+    def test_iter_synonyms(self):
+        """
+        This test is designed to pass, because iter_synonyms yields the synonyms of every source
+        as soon as it finishes, followed by the merged synonyms, and aiter_synonyms yields the same
+        :return:
+        """
+        synonym = Synonyms(search_string='streamword', sources=['collins', 'wordnet'])
+        synonym._query_collins_dictionary = source(['good', 'fine'], 0)
+        synonym._query_wordnet = source(['great'], 0.1)
+        results = list(synonym.iter_synonyms())
+        self.assertEqual(results, [query_runner.StreamedResult('collins', ['fine', 'good'], False),
+                                   query_runner.StreamedResult('wordnet', ['great'], False),
+                                   query_runner.StreamedResult(None, ['fine', 'good', 'great'], True)])
+
+        async def collect():
+            return [result async for result in synonym.aiter_synonyms()]
+        self.assertEqual(asyncio.run(collect()), results)
+
+
+unittest.main()
@@ -0,0 +1,143 @@
+"""
+This Python script is designed to perform unit testing of Wordhoard's
+request policy module.
+"""
+__author__ = 'John Bumgarner'
+__date__ = 'October 19, 2026'
+__status__ = 'Quality Assurance'
+__license__ = 'MIT'
+__copyright__ = "Copyright (C) 2021 John Bumgarner"
+
+##################################################################################
+# Date Completed: October 19, 2026
+# Author: John Bumgarner
+#
+# Date Last Revised:
+# Revised by:
+##################################################################################
+
+##################################################################################
+# “AS-IS” Clause
+#
+# Except as represented in this agreement, all work produced by Developer is
+# provided “AS IS”. Other than as provided in this agreement, Developer makes no
+# other warranties, express or implied, and hereby disclaims all implied warranties,
+# including any warranty of merchantability and warranty of fitness for a particular
+# purpose.
+##################################################################################
+
+##################################################################################
+# Python imports required for basic operations
+##################################################################################
+import time
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from wordhoard.utilities import request_policy
+from wordhoard.utilities.exceptions import QueryRequestException
+from wordhoard.utilities.request_html import Query
+
+
+class PageHandler(BaseHTTPRequestHandler):
+
+    def do_GET(self):
+        body = b'<html><body>page</body></html>'
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class SlowPageHandler(PageHandler):
+
+    def do_GET(self):
+        time.sleep(0.5)
+        super().do_GET()
+
+
+class TestRequestPolicyFunction(unittest.TestCase):
+
+    def tearDown(self):
+        request_policy.configure_adaptive_timeouts(enabled=False)
+        request_policy.reset_request_policies()
+
+    def test_host_policies(self):
+        """
+        This test is designed to pass, because a host policy applies to the host and its subdomains,
+        the missing values are taken from the default policy and the other hosts use the default policy
+        :return:
+        """
+        request_policy.set_request_policy('thesaurus.com', read_timeout=10, retries=1)
+        policy = request_policy.request_policy('https://www.thesaurus.com/browse/mother')
+        self.assertEqual(policy, request_policy.RequestPolicy(30.0, 10, 1, 0.5))
+        self.assertEqual(request_policy.request_policy('https://www.collinsdictionary.com/'),
+                         request_policy.DEFAULT_POLICY)
+        self.assertEqual(request_policy.request_timeout('https://thesaurus.com/browse/mother'), (30.0, 10))
+        with self.assertRaises(ValueError):
+            request_policy.set_request_policy('thesaurus.com', read_timeout=0)
+
+    def test_adaptive_timeout(self):
+        """
+        This test is designed to pass, because the adaptive read timeout is the latency percentile times
+        the multiplier, bounded by the minimum and the read timeout of the policy
+        :return:
+        """
+        url = 'https://www.synonym.com/synonyms/mother'
+        request_policy.configure_adaptive_timeouts(enabled=True, percentile=0.9, multiplier=2.0,
+                                                   minimum=1.0, minimum_samples=5, window=10)
+        for seconds in (0.5, 0.6, 0.7, 0.8):
+            request_policy.record_latency(url, seconds)
+        self.assertEqual(request_policy.request_timeout(url), (30.0, 45.0))
+        for seconds in (0.9, 1.0, 1.1, 1.2, 1.3, 3.0):
+            request_policy.record_latency(url, seconds)
+        self.assertEqual(request_policy.latency_percentile(url), 1.3)
+        self.assertEqual(request_policy.request_timeout(url), (30.0, 2.6))
+        request_policy.set_request_policy('synonym.com', read_timeout=2.0)
+        self.assertEqual(request_policy.request_timeout(url), (30.0, 2.0))
+        for _ in range(10):
+            request_policy.record_latency(url, 0.1)
+        self.assertEqual(request_policy.request_timeout(url), (30.0, 1.0))
+
+    def test_query_records_latency(self):
+        """
+        This test is designed to pass, because every request made by the Query class adds its
+        latency to the rolling latency window of the requested host
+        :return:
+        """
+        server = ThreadingHTTPServer(('127.0.0.1', 0), PageHandler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        try:
+            url = f'http://127.0.0.1:{server.server_address[1]}/page'
+            request_policy.set_request_policy('127.0.0.1', connect_timeout=2, read_timeout=2, retries=0)
+            response = Query(url_to_scrape=url).get_website_html()
+            self.assertEqual(response.status_code, 200)
+            self.assertIsNotNone(request_policy.latency_percentile(url))
+        finally:
+            server.shutdown()
+            server.server_close()
+
+    def test_query_records_read_timeout_after_retries(self):
+        """
+        This test is designed to pass, because a request whose read retries run out on a read
+        timeout records the read timeout as its latency, so that the adaptive timeout grows again
+        :return:
+        """
+        server = ThreadingHTTPServer(('127.0.0.1', 0), SlowPageHandler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        try:
+            url = f'http://127.0.0.1:{server.server_address[1]}/page'
+            request_policy.set_request_policy('127.0.0.1', connect_timeout=2, read_timeout=0.1,
+                                              retries=1, backoff_factor=0)
+            with self.assertRaises(QueryRequestException):
+                Query(url_to_scrape=url).get_website_html()
+            self.assertEqual(request_policy.latency_percentile(url), 0.1)
+        finally:
+            server.shutdown()
+            server.server_close()
+
+
+unittest.main()
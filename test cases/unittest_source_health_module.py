@@ -0,0 +1,133 @@
+"""
+This Python script is designed to perform unit testing of Wordhoard's
+source health module.
+"""
+__author__ = 'John Bumgarner'
+__date__ = 'October 19, 2026'
+__status__ = 'Quality Assurance'
+__license__ = 'MIT'
+__copyright__ = "Copyright (C) 2021 John Bumgarner"
+
+##################################################################################
+# Date Completed: October 19, 2026
+# Author: John Bumgarner
+#
+# Date Last Revised:
+# Revised by:
+##################################################################################
+
+##################################################################################
+# “AS-IS” Clause
+#
+# Except as represented in this agreement, all work produced by Developer is
+# provided “AS IS”. Other than as provided in this agreement, Developer makes no
+# other warranties, express or implied, and hereby disclaims all implied warranties,
+# including any warranty of merchantability and warranty of fitness for a particular
+# purpose.
+##################################################################################
+
+##################################################################################
+# Python imports required for basic operations
+##################################################################################
+import time
+import unittest
+from wordhoard.utilities import metrics, source_health
+
+
+class TestSourceHealthFunction(unittest.TestCase):
+
+    def setUp(self):
+        source_health.reset_source_health()
+        source_health.configure_circuit_breaker(failure_threshold=3, reset_timeout=0.05)
+
+    def tearDown(self):
+        source_health.configure_circuit_breaker()
+        source_health.reset_source_health()
+
+    @staticmethod
+    def _failed_query(source):
+        with metrics.query_scope('synonyms', source) as scope:
+            scope.failed = True
+
+    def test_circuit_opens_and_recovers(self):
+        """
+        This test is designed to pass, because a source is skipped after three failed queries,
+        probed by a single query after the cool down period and closed by a successful probe
+        :return:
+        """
+        for _ in range(3):
+            self.assertTrue(metrics.source_available('synonyms', 'failing.com'))
+            self._failed_query('failing.com')
+        self.assertEqual(source_health.source_health('failing.com')['failing.com']['state'], 'open')
+        self.assertFalse(metrics.source_available('synonyms', 'failing.com'))
+
+        time.sleep(0.06)
+        self.assertTrue(metrics.source_available('synonyms', 'failing.com'))
+        self.assertFalse(metrics.source_available('synonyms', 'failing.com'))
+        with metrics.query_scope('synonyms', 'failing.com') as scope:
+            scope.results = 4
+        health = source_health.source_health('failing.com')['failing.com']
+        self.assertEqual(health['state'], 'closed')
+        self.assertEqual(health['queries'], 4)
+        self.assertEqual(health['failures'], 3)
+        self.assertTrue(metrics.source_available('synonyms', 'failing.com'))
+
+    def test_failed_probe_reopens_circuit(self):
+        """
+        This test is designed to pass, because a failed probe opens the circuit again
+        and an exception raised in a query counts as a failure
+        :return:
+        """
+        for _ in range(3):
+            self._failed_query('flaky.com')
+        time.sleep(0.06)
+        self.assertTrue(metrics.source_available('synonyms', 'flaky.com'))
+        with self.assertRaises(SystemExit):
+            with metrics.query_scope('synonyms', 'flaky.com'):
+                raise SystemExit(1)
+        self.assertEqual(source_health.source_health('flaky.com')['flaky.com']['state'], 'open')
+        self.assertFalse(metrics.source_available('synonyms', 'flaky.com'))
+
+    def test_abandoned_probe_expires(self):
+        """
+        This test is designed to pass, because a probe that never records its outcome, e.g. a
+        query cancelled at the deadline, expires after the cool down period and another probe
+        is let through
+        :return:
+        """
+        for _ in range(3):
+            self._failed_query('abandoned.com')
+        time.sleep(0.06)
+        self.assertTrue(metrics.source_available('synonyms', 'abandoned.com'))
+        self.assertFalse(metrics.source_available('synonyms', 'abandoned.com'))
+        time.sleep(0.06)
+        self.assertTrue(metrics.source_available('synonyms', 'abandoned.com'))
+        self.assertFalse(metrics.source_available('synonyms', 'abandoned.com'))
+        self.assertEqual(source_health.source_health('abandoned.com')['abandoned.com']['state'], 'half-open')
+
+    def test_slow_queries_and_disabled_breaker(self):
+        """
+        This test is designed to pass, because slow queries count as failures and
+        every source is queried when the circuit breaker is disabled
+        :return:
+        """
+        source_health.configure_circuit_breaker(failure_threshold=1, slow_query_seconds=0.01)
+        with metrics.query_scope('synonyms', 'slow.com') as scope:
+            time.sleep(0.02)
+            scope.results = 1
+        self.assertEqual(source_health.source_health('slow.com')['slow.com']['state'], 'open')
+        source_health.configure_circuit_breaker(enabled=False)
+        self.assertTrue(metrics.source_available('synonyms', 'slow.com'))
+
+    def test_invalid_configuration(self):
+        """
+        This test is designed to pass, because thresholds that can never be reached are rejected
+        :return:
+        """
+        with self.assertRaises(ValueError):
+            source_health.configure_circuit_breaker(failure_threshold=0)
+        with self.assertRaises(ValueError):
+            source_health.configure_circuit_breaker(error_rate_threshold=1.5)
+
+
+unittest.main()
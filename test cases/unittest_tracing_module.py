@@ -0,0 +1,138 @@
+"""
+This Python script is designed to perform unit testing of Wordhoard's
+tracing module.
+"""
+__author__ = 'John Bumgarner'
+__date__ = 'October 19, 2026'
+__status__ = 'Quality Assurance'
+__license__ = 'MIT'
+__copyright__ = "Copyright (C) 2021 John Bumgarner"
+
+##################################################################################
+# Date Completed: October 19, 2026
+# Author: John Bumgarner
+#
+# Date Last Revised:
+# Revised by:
+##################################################################################
+
+##################################################################################
+# “AS-IS” Clause
+#
+# Except as represented in this agreement, all work produced by Developer is
+# provided “AS IS”. Other than as provided in this agreement, Developer makes no
+# other warranties, express or implied, and hereby disclaims all implied warranties,
+# including any warranty of merchantability and warranty of fitness for a particular
+# purpose.
+##################################################################################
+
+##################################################################################
+# Python imports required for basic operations
+##################################################################################
+import threading
+import unittest
+import contextvars
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from wordhoard.utilities import metrics, tracing
+from wordhoard.utilities.request_html import Query
+
+
+class PageHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        body = b'<html><body><p>page</p></body></html>'
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class RecordingSpan:
+    def __init__(self, name, parent, attributes):
+        self.name = name
+        self.parent = parent
+        self.attributes = dict(attributes or {})
+
+    def set_attribute(self, key, value):
+        self.attributes[key] = value
+
+
+class RecordingTracer:
+    """
+    A minimal stand-in for an OpenTelemetry tracer, which keeps the active span in a context variable.
+    """
+    def __init__(self):
+        self.spans = []
+        self._active = contextvars.ContextVar('active_span', default=None)
+
+    @contextmanager
+    def start_as_current_span(self, name, attributes=None):
+        parent = self._active.get()
+        recorded_span = RecordingSpan(name, parent.name if parent else None, attributes)
+        self.spans.append(recorded_span)
+        token = self._active.set(recorded_span)
+        try:
+            yield recorded_span
+        finally:
+            self._active.reset(token)
+
+
+class TestTracingFunction(unittest.TestCase):
+
+    def setUp(self):
+        self._original_tracer = tracing._tracer
+
+    def tearDown(self):
+        tracing._tracer = self._original_tracer
+
+    def test_spans_are_propagated_to_the_thread_pool(self):
+        """
+        This test is designed to pass, because the spans created in a thread pool worker
+        are children of the span that was active when the query task was created
+        :return:
+        """
+        tracer = RecordingTracer()
+        tracing._tracer = tracer
+        server = ThreadingHTTPServer(('127.0.0.1', 0), PageHandler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        url = f'http://127.0.0.1:{server.server_address[1]}/browse/good'
+
+        def query_source():
+            response = Query(url_to_scrape=url).get_website_html()
+            tracing.make_soup(markup=response.text, features='lxml')
+            return ['page'], 'noun'
+
+        try:
+            with tracing.span('find_synonyms'):
+                task = metrics.instrument_query('synonyms', 'stub', query_source)
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                self.assertEqual(executor.submit(task).result(), (['page'], 'noun'))
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        parents = {recorded_span.name: recorded_span.parent for recorded_span in tracer.spans}
+        self.assertEqual(parents['wordhoard.query'], 'find_synonyms')
+        self.assertEqual(parents['wordhoard.http_request'], 'wordhoard.query')
+        self.assertEqual(parents['wordhoard.soup'], 'wordhoard.query')
+        attributes = {recorded_span.name: recorded_span.attributes for recorded_span in tracer.spans}
+        self.assertEqual(attributes['wordhoard.query']['outcome'], 'found')
+        self.assertEqual(attributes['wordhoard.http_request']['http.status_code'], 200)
+
+    def test_spans_without_opentelemetry(self):
+        """
+        This test is designed to pass, because spans are no-ops without a tracer
+        :return:
+        """
+        tracing._tracer = None
+        with tracing.span('wordhoard.test', attribute=1) as noop_span:
+            noop_span.set_attribute('key', 'value')
+        self.assertEqual(tracing.make_soup(markup='<p>word</p>').p.text, 'word')
+
+
+unittest.main()
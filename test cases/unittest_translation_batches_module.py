@@ -0,0 +1,137 @@
+"""
+This Python script is designed to perform unit testing of Wordhoard's
+translation batches module.
+"""
+__author__ = 'John Bumgarner'
+__date__ = 'October 19, 2026'
+__status__ = 'Quality Assurance'
+__license__ = 'MIT'
+__copyright__ = "Copyright (C) 2021 John Bumgarner"
+
+##################################################################################
+# Date Completed: October 19, 2026
+# Author: John Bumgarner
+#
+# Date Last Revised:
+# Revised by:
+##################################################################################
+
+##################################################################################
+# “AS-IS” Clause
+#
+# Except as represented in this agreement, all work produced by Developer is
+# provided “AS IS”. Other than as provided in this agreement, Developer makes no
+# other warranties, express or implied, and hereby disclaims all implied warranties,
+# including any warranty of merchantability and warranty of fitness for a particular
+# purpose.
+##################################################################################
+
+##################################################################################
+# Python imports required for basic operations
+##################################################################################
+import threading
+import unittest
+from urllib.parse import parse_qs, urlparse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from wordhoard.utilities import translation_batches, translation_cache
+from wordhoard.utilities.google_translator import Translator
+
+SPANISH_WORDS = {'casa': 'house', 'perro': 'dog', 'gato': 'cat', 'libro': 'book'}
+
+
+class TranslationHandler(BaseHTTPRequestHandler):
+    queries = []
+    merge_lines = False
+
+    def do_GET(self):
+        query = parse_qs(urlparse(self.path).query)['q'][0]
+        TranslationHandler.queries.append(query)
+        translations = [SPANISH_WORDS.get(line, line) for line in query.split('\n')]
+        separator = ' ' if TranslationHandler.merge_lines else '\n'
+        body = f'<html><body><div class="result-container">{separator.join(translations)}</div></body></html>'
+        body = body.encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class TestTranslationBatchesFunction(unittest.TestCase):
+
+    def setUp(self):
+        translation_cache.enable_translation_cache()
+        TranslationHandler.queries = []
+        TranslationHandler.merge_lines = False
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), TranslationHandler)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+        translation_cache.enable_translation_cache()
+
+    def _translator(self):
+        translator = Translator(source_language='es')
+        translator._url_to_query = f'http://127.0.0.1:{self.server.server_address[1]}/m'
+        return translator
+
+    def test_pack_batches_respects_limits(self):
+        """
+        This test is designed to pass, because every batch stays within the maximum
+        number of texts and the maximum size in bytes
+        :return:
+        """
+        batches = translation_batches.pack_batches(['aaaa', 'bbbb', 'cccc', 'dddd', 'eeee'], max_texts=2, max_bytes=100)
+        self.assertEqual(batches, [['aaaa', 'bbbb'], ['cccc', 'dddd'], ['eeee']])
+        batches = translation_batches.pack_batches(['aaaa', 'bbbb', 'cccc', 'x' * 20], max_texts=10, max_bytes=9)
+        self.assertEqual(batches, [['aaaa', 'bbbb'], ['cccc'], ['x' * 20]])
+
+    def test_split_batch_translation_rejects_mismatched_lines(self):
+        """
+        This test is designed to pass, because a translation whose lines do not match
+        the words of the batch cannot be mapped back to the words
+        :return:
+        """
+        self.assertEqual(translation_batches.split_batch_translation('house\ndog', ['casa', 'perro']), ['house', 'dog'])
+        self.assertIsNone(translation_batches.split_batch_translation('house dog', ['casa', 'perro']))
+        self.assertIsNone(translation_batches.split_batch_translation(None, ['casa']))
+
+    def test_translate_many_uses_one_request(self):
+        """
+        This test is designed to pass, because the words are translated with a single
+        request and the translations are mapped back to the words
+        :return:
+        """
+        translations = self._translator().translate_many(['casa', 'perro', 'gato', 'casa'])
+        self.assertEqual(translations, {'casa': 'house', 'perro': 'dog', 'gato': 'cat'})
+        self.assertEqual(TranslationHandler.queries, ['casa\nperro\ngato'])
+
+    def test_translate_many_skips_cached_words(self):
+        """
+        This test is designed to pass, because the words in the translation cache
+        are not sent to the translation service again
+        :return:
+        """
+        translator = self._translator()
+        translator.translate_many(['casa', 'perro'])
+        translations = translator.translate_many(['casa', 'perro', 'libro'])
+        self.assertEqual(translations, {'casa': 'house', 'perro': 'dog', 'libro': 'book'})
+        self.assertEqual(TranslationHandler.queries, ['casa\nperro', 'libro'])
+
+    def test_translate_many_falls_back_to_single_words(self):
+        """
+        This test is designed to pass, because the words are translated one by one
+        when the translation service does not preserve the lines of a batch
+        :return:
+        """
+        TranslationHandler.merge_lines = True
+        translations = self._translator().translate_many(['casa', 'perro'])
+        self.assertEqual(translations, {'casa': 'house', 'perro': 'dog'})
+        self.assertEqual(TranslationHandler.queries, ['casa\nperro', 'casa', 'perro'])
+
+
+unittest.main()
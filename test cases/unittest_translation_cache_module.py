@@ -0,0 +1,135 @@
+"""
+This Python script is designed to perform unit testing of Wordhoard's
+translation cache module.
+"""
+__author__ = 'John Bumgarner'
+__date__ = 'October 19, 2026'
+__status__ = 'Quality Assurance'
+__license__ = 'MIT'
+__copyright__ = "Copyright (C) 2021 John Bumgarner"
+
+##################################################################################
+# Date Completed: October 19, 2026
+# Author: John Bumgarner
+#
+# Date Last Revised:
+# Revised by:
+##################################################################################
+
+##################################################################################
+# “AS-IS” Clause
+#
+# Except as represented in this agreement, all work produced by Developer is
+# provided “AS IS”. Other than as provided in this agreement, Developer makes no
+# other warranties, express or implied, and hereby disclaims all implied warranties,
+# including any warranty of merchantability and warranty of fitness for a particular
+# purpose.
+##################################################################################
+
+##################################################################################
+# Python imports required for basic operations
+##################################################################################
+import os
+import tempfile
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from wordhoard.utilities import translation_cache
+from wordhoard.utilities.google_translator import Translator
+
+
+class TranslationHandler(BaseHTTPRequestHandler):
+    requests_seen = 0
+
+    def do_GET(self):
+        TranslationHandler.requests_seen += 1
+        body = b'<html><body><div class="result-container">house</div></body></html>'
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class TestTranslationCacheFunction(unittest.TestCase):
+
+    def tearDown(self):
+        translation_cache.enable_translation_cache()
+
+    def test_translator_uses_cache(self):
+        """
+        This test is designed to pass, because the second translation of the same word
+        is answered from the translation cache without a request to the translation service
+        :return:
+        """
+        translation_cache.enable_translation_cache()
+        TranslationHandler.requests_seen = 0
+        server = ThreadingHTTPServer(('127.0.0.1', 0), TranslationHandler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        try:
+            for _ in range(2):
+                translator = Translator(source_language='es', str_to_translate='casa')
+                translator._url_to_query = f'http://127.0.0.1:{server.server_address[1]}/m'
+                self.assertEqual(translator.translate_word(), 'house')
+        finally:
+            server.shutdown()
+            server.server_close()
+        self.assertEqual(TranslationHandler.requests_seen, 1)
+
+    def test_reverse_translation_uses_resolved_language(self):
+        """
+        This test is designed to pass, because a reverse translation is cached under the resolved
+        language code, so the aliases and the spellings of a language share a cache entry
+        :return:
+        """
+        translation_cache.enable_translation_cache()
+        TranslationHandler.requests_seen = 0
+        server = ThreadingHTTPServer(('127.0.0.1', 0), TranslationHandler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        try:
+            for language in ('chinese', 'zh-CN', 'ZH-cn'):
+                translator = Translator(source_language=language, str_to_translate='home')
+                translator._url_to_query = f'http://127.0.0.1:{server.server_address[1]}/m'
+                self.assertEqual(translator.reverse_translate(), 'house')
+        finally:
+            server.shutdown()
+            server.server_close()
+        self.assertEqual(TranslationHandler.requests_seen, 1)
+        self.assertEqual(translation_cache.cached_translation('google', 'en', 'zh-CN', 'home'), 'house')
+
+    def test_persistent_cache(self):
+        """
+        This test is designed to pass, because the translations stored in a SQLite file
+        are found by a new translation cache that uses the same file
+        :return:
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            file_path = os.path.join(directory, 'translations.db')
+            translation_cache.enable_translation_cache(file_path=file_path)
+            translation_cache.cache_translation('deepl', 'ES', 'en-us', 'perro ', 'dog')
+            translation_cache.cache_translation('deepl', 'es', 'en-us', 'gato', None)
+            translation_cache.enable_translation_cache(file_path=file_path)
+            self.assertEqual(translation_cache.cached_translation('deepl', 'es', 'EN-US', 'perro'), 'dog')
+            self.assertIsNone(translation_cache.cached_translation('deepl', 'es', 'en-us', 'gato'))
+            translation_cache.disable_translation_cache()
+            self.assertIsNone(translation_cache.cached_translation('deepl', 'es', 'en-us', 'perro'))
+
+    def test_least_recently_used_eviction(self):
+        """
+        This test is designed to pass, because the least recently used translation is evicted
+        when the in memory cache is full
+        :return:
+        """
+        cache = translation_cache.TranslationCache(max_entries=2)
+        cache.store('google', 'es', 'en', 'uno', 'one')
+        cache.store('google', 'es', 'en', 'dos', 'two')
+        self.assertEqual(cache.lookup('google', 'es', 'en', 'uno'), 'one')
+        cache.store('google', 'es', 'en', 'tres', 'three')
+        self.assertIsNone(cache.lookup('google', 'es', 'en', 'dos'))
+        self.assertEqual(len(cache), 2)
+
+
+unittest.main()
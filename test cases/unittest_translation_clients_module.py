@@ -0,0 +1,121 @@
+"""
+This Python script is designed to perform unit testing of Wordhoard's
+translation clients module.
+"""
+__author__ = 'John Bumgarner'
+__date__ = 'October 19, 2026'
+__status__ = 'Quality Assurance'
+__license__ = 'MIT'
+__copyright__ = "Copyright (C) 2021 John Bumgarner"
+
+##################################################################################
+# Date Completed: October 19, 2026
+# Author: John Bumgarner
+#
+# Date Last Revised:
+# Revised by:
+##################################################################################
+
+##################################################################################
+# “AS-IS” Clause
+#
+# Except as represented in this agreement, all work produced by Developer is
+# provided “AS IS”. Other than as provided in this agreement, Developer makes no
+# other warranties, express or implied, and hereby disclaims all implied warranties,
+# including any warranty of merchantability and warranty of fitness for a particular
+# purpose.
+##################################################################################
+
+##################################################################################
+# Python imports required for basic operations
+##################################################################################
+import tempfile
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from wordhoard.utilities import transport, translation_cache, translation_clients
+from wordhoard.utilities.google_translator import Translator
+
+
+class TranslationHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    client_ports = set()
+
+    def do_GET(self):
+        TranslationHandler.client_ports.add(self.client_address[1])
+        body = b'<html><body><div class="result-container">house</div></body></html>'
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class TestTranslationClientsFunction(unittest.TestCase):
+
+    def tearDown(self):
+        transport.set_transport('live')
+        translation_clients.close_translation_clients()
+        translation_cache.enable_translation_cache()
+
+    def test_session_is_shared(self):
+        """
+        This test is designed to pass, because every request to a translation service
+        uses the same session, regardless of the Translator instance
+        :return:
+        """
+        session = translation_clients.translation_session('google')
+        self.assertIs(translation_clients.translation_session('google'), session)
+        self.assertIsNot(translation_clients.translation_session('mymemory'), session)
+
+    def test_session_follows_transport(self):
+        """
+        This test is designed to pass, because the session is rebuilt when the
+        transport mode changes, so it uses the adapter of the new transport
+        :return:
+        """
+        session = translation_clients.translation_session('google')
+        with tempfile.TemporaryDirectory() as directory:
+            transport.set_transport('record', directory)
+            recording_session = translation_clients.translation_session('google')
+            self.assertIsNot(recording_session, session)
+            self.assertIsInstance(recording_session.get_adapter('https://translate.google.com'),
+                                  transport.RecordingAdapter)
+
+    def test_connection_is_reused(self):
+        """
+        This test is designed to pass, because the translations of several Translator
+        instances are sent over a single kept-alive connection
+        :return:
+        """
+        translation_cache.disable_translation_cache()
+        TranslationHandler.client_ports = set()
+        server = ThreadingHTTPServer(('127.0.0.1', 0), TranslationHandler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        try:
+            for word in ('casa', 'hogar', 'vivienda'):
+                translator = Translator(source_language='es', str_to_translate=word)
+                translator._url_to_query = f'http://127.0.0.1:{server.server_address[1]}/m'
+                self.assertEqual(translator.translate_word(), 'house')
+        finally:
+            translation_clients.close_translation_clients()
+            server.shutdown()
+            server.server_close()
+        self.assertEqual(len(TranslationHandler.client_ports), 1)
+
+    def test_deepl_client_is_shared(self):
+        """
+        This test is designed to pass, because the DeepL client of an authentication key
+        is created once and an empty authentication key is rejected
+        :return:
+        """
+        client = translation_clients.deepl_client('0123456789:fx')
+        self.assertIs(translation_clients.deepl_client('0123456789:fx'), client)
+        with self.assertRaises(ValueError):
+            translation_clients.deepl_client('')
+
+
+unittest.main()
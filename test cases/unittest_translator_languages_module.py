@@ -0,0 +1,85 @@
+"""
+This Python script is designed to perform unit testing of Wordhoard's
+translator languages module.
+"""
+__author__ = 'John Bumgarner'
+__date__ = 'October 19, 2026'
+__status__ = 'Quality Assurance'
+__license__ = 'MIT'
+__copyright__ = "Copyright (C) 2021 John Bumgarner"
+
+##################################################################################
+# Date Completed: October 19, 2026
+# Author: John Bumgarner
+#
+# Date Last Revised:
+# Revised by:
+##################################################################################
+
+##################################################################################
+# “AS-IS” Clause
+#
+# Except as represented in this agreement, all work produced by Developer is
+# provided “AS IS”. Other than as provided in this agreement, Developer makes no
+# other warranties, express or implied, and hereby disclaims all implied warranties,
+# including any warranty of merchantability and warranty of fitness for a particular
+# purpose.
+##################################################################################
+
+##################################################################################
+# Python imports required for basic operations
+##################################################################################
+import unittest
+from wordhoard.utilities.translator_languages import language_index
+from wordhoard.utilities.google_translator import Translator
+
+
+class TestTranslatorLanguagesFunction(unittest.TestCase):
+
+    def test_lookup_by_code_and_name(self):
+        """
+        This test is designed to pass, because a supported language is found
+        case-insensitively by its code and by its name
+        :return:
+        """
+        google_languages = language_index('google')
+        self.assertEqual(google_languages.resolve('es'), 'es')
+        self.assertEqual(google_languages.resolve('Spanish'), 'es')
+        self.assertEqual(google_languages.resolve('ZH-cn'), 'zh-CN')
+        self.assertEqual(google_languages.name('zh-tw'), 'chinese (traditional)')
+        self.assertIsNone(google_languages.resolve('klingon'))
+
+    def test_lookup_by_alias(self):
+        """
+        This test is designed to pass, because the common aliases of a language
+        resolve to the code used by the translation service
+        :return:
+        """
+        self.assertEqual(language_index('google').resolve('he'), 'iw')
+        self.assertEqual(language_index('mymemory').resolve('iw'), 'he')
+        self.assertEqual(language_index('google').resolve('simplified chinese'), 'zh-CN')
+        self.assertEqual(language_index('deepl').resolve('slovak'), 'sk')
+
+    def test_index_is_cached_and_immutable(self):
+        """
+        This test is designed to pass, because the index of a translation service
+        is built once and its languages cannot be modified
+        :return:
+        """
+        self.assertIs(language_index('deepl'), language_index('deepl'))
+        with self.assertRaises(TypeError):
+            language_index('deepl').languages['xx'] = 'unknown'
+        with self.assertRaises(ValueError):
+            language_index('babelfish')
+
+    def test_translator_accepts_language_names(self):
+        """
+        This test is designed to pass, because the translator resolves the name of
+        the source language to the code sent to the translation service
+        :return:
+        """
+        self.assertEqual(Translator(source_language='Spanish')._google_supported_languages(), 'es')
+        self.assertIsNone(Translator(source_language='klingon')._google_supported_languages())
+
+
+unittest.main()
@@ -0,0 +1,93 @@
+"""
+This Python script is designed to perform unit testing of Wordhoard's
+record and replay transport module.
+"""
+__author__ = 'John Bumgarner'
+__date__ = 'October 19, 2026'
+__status__ = 'Quality Assurance'
+__license__ = 'MIT'
+__copyright__ = "Copyright (C) 2021 John Bumgarner"
+
+##################################################################################
+# Date Completed: October 19, 2026
+# Author: John Bumgarner
+#
+# Date Last Revised:
+# Revised by:
+##################################################################################
+
+##################################################################################
+# “AS-IS” Clause
+#
+# Except as represented in this agreement, all work produced by Developer is
+# provided “AS IS”. Other than as provided in this agreement, Developer makes no
+# other warranties, express or implied, and hereby disclaims all implied warranties,
+# including any warranty of merchantability and warranty of fitness for a particular
+# purpose.
+##################################################################################
+
+##################################################################################
+# Python imports required for basic operations
+##################################################################################
+import tempfile
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from wordhoard.utilities import transport
+from wordhoard.utilities.request_html import Query
+
+
+class PageHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        body = f'<html><body><p>{self.path}</p></body></html>'.encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class TestTransportFunction(unittest.TestCase):
+
+    def tearDown(self):
+        transport.set_transport('live')
+
+    def test_record_and_replay(self):
+        """
+        This test is designed to pass, because a recorded response is replayed unchanged
+        after the server has stopped, and an unrecorded request is answered with a 404
+        :return:
+        """
+        server = ThreadingHTTPServer(('127.0.0.1', 0), PageHandler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        url = f'http://127.0.0.1:{server.server_address[1]}/browse/good'
+        with tempfile.TemporaryDirectory() as directory:
+            transport.set_transport('record', directory)
+            recorded_response = Query(url_to_scrape=url).get_website_html()
+            server.shutdown()
+            server.server_close()
+
+            transport.set_transport('replay', directory)
+            replayed_response = Query(url_to_scrape=url).get_website_html()
+            self.assertEqual(replayed_response.status_code, 200)
+            self.assertEqual(replayed_response.text, recorded_response.text)
+            self.assertEqual(replayed_response.headers[transport.REPLAY_HEADER], 'hit')
+
+            missing_response = Query(url_to_scrape=f'{url}/missing').get_website_html()
+            self.assertEqual(missing_response.status_code, 404)
+
+    def test_invalid_transport(self):
+        """
+        This test is designed to pass, because unknown modes and missing archive directories are rejected
+        :return:
+        """
+        with self.assertRaises(ValueError):
+            transport.set_transport('offline')
+        with self.assertRaises(ValueError):
+            transport.set_transport('replay')
+
+
+unittest.main()
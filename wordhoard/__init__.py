@@ -34,7 +34,11 @@ from .hypernyms import Hypernyms
 from .homophones import Homophones
 from .dictionary import Definitions
 from .utilities import wordhoard_logger
+from .utilities.profiling import profile, profile_from_environment
 
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 wordhoard_logger.enable_logging(logger)
+
+# Profiles the whole process when the environment variable WORDHOARD_PROFILE is set
+profile_from_environment()
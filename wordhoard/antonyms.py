@@ -32,15 +32,12 @@ __copyright__ = "Copyright (C) 2020 John Bumgarner"
 # Python imports required for basic operations
 ##################################################################################
 # Standard library imports
-import sys
 import json
 import logging
 import traceback
 import re as regex
 from collections.abc import Sized
-from concurrent.futures.thread import BrokenThreadPool
-from concurrent.futures import ThreadPoolExecutor, as_completed, BrokenExecutor
-from typing import Dict, List, Optional, Set, Tuple, Union
+from typing import AsyncIterator, Callable, Dict, Iterator, List, Optional, Set, Tuple, Union
 
 # Third-party imports
 import bs4
@@ -50,10 +47,11 @@ from backoff import on_exception, expo
 from ratelimit import limits, RateLimitException
 
 # Local or project-specific imports
+from wordhoard.utilities import protection_detector, tracing, transport
 from wordhoard.utilities.request_html import Query
 from wordhoard.utilities.colorized_text import colorized_text
-from wordhoard.utilities import caching, cleansing, word_verification
-from wordhoard.utilities.cloudflare_checker import CloudflareVerification
+from wordhoard.utilities.exceptions import InvalidOutputFormatException, QueryRequestException
+from wordhoard.utilities import caching, cleansing, metrics, multilingual, query_runner, word_verification
 
 logger = logging.getLogger(__name__)
 
@@ -79,10 +77,12 @@ class PartOfSpeech:
         """
         Helper method to handle common exceptions in query methods.
         """
+        metrics.record_query_error()
         logger.error('An error occurred in the following code segment:')
         logger.error(''.join(traceback.format_tb(error.__traceback__)))
 
     @staticmethod
+    @tracing.traced()
     def part_of_speech_category_thesaurus_com(soup: BeautifulSoup) -> str:
         """
         Extracts the part of speech category from the HTML response of Thesaurus.com.
@@ -111,6 +111,7 @@ class PartOfSpeech:
         return part_of_speech_category
 
     @staticmethod
+    @tracing.traced()
     def part_of_speech_category_wordhippo(soup: BeautifulSoup) -> str:
         """
         Extracts the part of speech category from the HTML response of WordHippo.
@@ -154,10 +155,12 @@ class ParseWords:
         """
         Helper method to handle common exceptions in query methods.
         """
+        metrics.record_query_error()
         logger.error('An error occurred in the following code segment:')
         logger.error(''.join(traceback.format_tb(error.__traceback__)))
 
     @staticmethod
+    @tracing.traced()
     def parse_google_com(soup: BeautifulSoup, word: str) -> list:
         """
         Parses synonyms from the HTML response of Thesaurus.com.
@@ -184,6 +187,7 @@ class ParseWords:
         return antonyms_list
 
     @staticmethod
+    @tracing.traced()
     def parse_thesaurus_com(soup: BeautifulSoup) -> list:
         """
         Parses synonyms from the HTML response of Thesaurus.com.
@@ -218,6 +222,7 @@ class ParseWords:
         return antonyms_list
 
     @staticmethod
+    @tracing.traced()
     def parse_wordhippo(soup: BeautifulSoup) -> list:
         """
         Parses synonyms from the HTML response of Wordhippo.
@@ -267,13 +272,20 @@ class Antonyms:
             User agent string for HTTP requests.
         proxies : dict, optional
             Dictionary of proxies for Python Requests.
+        translator : BatchTranslator, optional
+            A Google, MyMemory or DeepL Translator for a word that is not English. The word is
+            translated into English for the lookup and the antonyms are translated back.
 
         Attributes
         ----------
         _proxies : Optional[Dict[str, str]]
             Proxies to use with Python Requests.
+        _translator : Optional[BatchTranslator]
+            The translator of the language of the word, or None for an English word.
+        _search_string : str
+            The word as provided, which is used in the output.
         _word : str
-            The word to find antonyms for.
+            The normalized word to find antonyms for, which is used for the cache and the queries.
          _sources : Optional[List[str]]
             The sources to search for antonyms.
         _user_agent : Optional[str]
@@ -284,20 +296,32 @@ class Antonyms:
             Set of valid output formats.
         _rate_limit_status : bool
             Status indicating whether rate limit is reached.
+        incomplete_sources : List[str]
+            The sources that had not finished when the last find_antonyms() call returned.
 
         Methods
         -------
-        find_antonyms() -> Union[List[Sized], Dict[str, List[str]], str]:
+        find_antonyms(deadline: Optional[float] = None, quorum: Optional[int] = None,
+                      min_results: Optional[int] = None) -> Union[List[Sized], Dict[str, List[str]], str]:
             Finds antonyms for the specified word.
+        iter_antonyms(deadline: Optional[float] = None, quorum: Optional[int] = None,
+                      min_results: Optional[int] = None) -> Iterator[query_runner.StreamedResult]:
+            Yields the antonyms of every source as its query finishes, followed by the merged antonyms.
+        aiter_antonyms(deadline: Optional[float] = None, quorum: Optional[int] = None,
+                       min_results: Optional[int] = None) -> AsyncIterator[query_runner.StreamedResult]:
+            The asynchronous iterator variant of iter_antonyms.
         _validate_word() -> bool:
             Validates the syntax of the word.
-        _check_cache() -> Tuple[bool, Union[Dict[str, List[str]], None]]:
-            Checks if antonyms are cached.
+        _check_cache() -> Tuple[bool, Union[List[str], Dict[str, Dict[str, Union[str, List[str]]]], str, None]]:
+            Returns the output for cached antonyms, which is built once per output format.
+        _cached_query_output(cached_antonyms: Dict[str, List[str]]) -> Union[list, dict, str]:
+            Builds the output for cached antonyms.
         _update_cache(pos_category: str, antonyms: Union[List[str], Set[str]]) -> None:
             Updates the cache with new antonyms.
         _request_http_response(url: str) -> requests.models.Response:
             Makes an HTTP request and returns the response.
-        _run_query_tasks_in_parallel() -> List[tuple[List[str], str]]:
+        _run_query_tasks_in_parallel(deadline: Optional[float] = None, quorum: Optional[int] = None,
+                                     min_results: Optional[int] = None) -> List[tuple[List[str], str]]:
             Runs query tasks in parallel using a ThreadPool.
         _query_output(self, antonyms: list, part_of_speech: Union[set[str], str]) -> Union[list, dict, str]:
             Process the output format based on the specified format.
@@ -318,10 +342,13 @@ class Antonyms:
                  max_number_of_requests: int = 30,
                  rate_limit_timeout_period: int = 60,
                  user_agent: Optional[str] = None,
-                 proxies: Optional[Dict[str, str]] = None):
+                 proxies: Optional[Dict[str, str]] = None,
+                 translator: Optional[multilingual.BatchTranslator] = None):
 
         self._proxies = proxies
-        self._word = search_string
+        self._translator = translator
+        self._search_string = search_string
+        self._word = caching.normalize_key(search_string)
         self._user_agent = user_agent
         self._output_format = output_format
         self._valid_output_formats = {'dictionary', 'list', 'json'}
@@ -329,6 +356,7 @@ class Antonyms:
 
         rate_limit_status = False
         self._rate_limit_status = rate_limit_status
+        self.incomplete_sources: List[str] = []
 
         # Retries the requests after a certain time period has elapsed
         handler = on_exception(wait_gen=expo,
@@ -337,7 +365,9 @@ class Antonyms:
                                on_backoff=self._backoff_handler)
         # Establishes a rate limit for making requests to the antonyms repositories
         limiter = limits(calls=max_number_of_requests, period=rate_limit_timeout_period)
-        self._run_query_tasks_in_parallel = handler(limiter(self._run_query_tasks_in_parallel))
+        # Replayed requests do not reach the online repositories, so they are not rate limited
+        if transport.replay_enabled() is False:
+            self._query_tasks = handler(limiter(self._query_tasks))
 
     def _backoff_handler(self, details) -> None:
         """
@@ -360,10 +390,12 @@ class Antonyms:
         - Displays colorized text messages to indicate the backoff status.
         - Logs an info message when the rate limit is initially reached.
         - Sets the `_rate_limit_status` attribute to True when the rate limit is first encountered.
+        - Records the backoff in the WordHoard metrics.
 
         :returns: None
         :rtype: NoneType
         """
+        metrics.record_backoff('antonyms')
         if self._rate_limit_status is False:
             colorized_text(text='The antonyms query rate limit was reached. The querying process is '
                                 'entering a temporary hibernation mode.', color='red')
@@ -388,13 +420,20 @@ class Antonyms:
             logger.error(f'Please verify that the word {self._word} is spelled correctly.')
         return valid_word
 
-    def _check_cache(self) -> Tuple[bool, Union[Dict[str, List[str]], None]]:
-        check_cache = caching.cache_antonyms(self._word)
+    def _check_cache(self) -> Tuple[bool, Union[List[str], Dict[str, Dict[str, Union[str, List[str]]]], str, None]]:
+        check_cache = caching.cached_output('antonyms', self._word, self._output_format, self._cached_query_output,
+                                            display_word=self._search_string)
         return check_cache
 
+    def _cached_query_output(self, cached_antonyms: Dict[str, List[str]]) -> Union[list, dict, str]:
+        part_of_speech = list(cached_antonyms.keys())[0]
+        antonyms = cleansing.flatten_multidimensional_list(list(cached_antonyms.values()))
+        return self._query_output(antonyms, part_of_speech)
+
     def _update_cache(self, pos_category: str, antonyms: Union[List[str], Set[str]]) -> None:
         caching.insert_word_cache_antonyms(self._word, pos_category, antonyms)
 
+    @tracing.traced()
     def _request_http_response(self, url: str) -> requests.models.Response:
         """
         This function queries the requested online repository and returns the
@@ -415,12 +454,13 @@ class Antonyms:
             response = Query(url_to_scrape=url, user_agent=self._user_agent, proxies=self._proxies).get_website_html()
         return response
 
-    def _run_query_tasks_in_parallel(self) -> List[tuple[List[str], str]]:
+    def _query_tasks(self) -> Dict[str, Callable[[], Union[Tuple[List[str], str], None]]]:
         """
-        Runs the query tasks in parallel using a ThreadPool.
+        Returns the query tasks of the requested sources. The sources with an
+        open circuit breaker are left out.
 
-        :return: list
-        :rtype: nested list
+        :return: The query tasks by source name.
+        :rtype: Dict[str, Callable[[], Union[Tuple[List[str], str], None]]]
         """
         sources: list = []
         if self._sources is None:
@@ -438,21 +478,36 @@ class Antonyms:
                            'thesaurus.com': self._query_thesaurus_com,
                            'wordhippo': self._query_wordhippo}
 
-        tasks = [v for k, v in primary_sources.items() if k in sources]
-
-        with ThreadPoolExecutor(max_workers=5) as executor:
-            running_tasks = []
-            finished_tasks = []
-            try:
-                for task in tasks:
-                    submitted_task = executor.submit(task)
-                    running_tasks.append(submitted_task)
-                for finished_task in as_completed(running_tasks):
-                    finished_tasks.append(finished_task.result())
-            except (BrokenExecutor, BrokenThreadPool, TimeoutError) as error:
-                self._handle_query_exceptions(error)
-            return finished_tasks
+        # the sources with an open circuit breaker are skipped
+        tasks = {k: metrics.instrument_query('antonyms', k, v) for k, v in primary_sources.items()
+                 if k in sources and metrics.source_available('antonyms', k)}
+
+        return tasks
 
+    def _run_query_tasks_in_parallel(self,
+                                     deadline: Optional[float] = None,
+                                     quorum: Optional[int] = None,
+                                     min_results: Optional[int] = None) -> List[tuple[List[str], str]]:
+        """
+        Runs the query tasks in parallel using a ThreadPool. The sources that have not
+        finished when the results are returned are stored in incomplete_sources.
+
+        :param deadline: The seconds after which the results of the finished sources are returned.
+        :type deadline: Optional[float]
+        :param quorum: The number of sources that agree on a result after which their results are returned.
+        :type quorum: Optional[int]
+        :param min_results: The number of distinct results after which they are returned.
+        :type min_results: Optional[int]
+        :return: list
+        :rtype: nested list
+        """
+        finished_tasks, self.incomplete_sources = query_runner.run_query_tasks(self._query_tasks(),
+                                                                               deadline=deadline,
+                                                                               quorum=quorum,
+                                                                               min_results=min_results)
+        return finished_tasks
+
+    @tracing.traced()
     def _query_output(self, antonyms: list, part_of_speech: Union[set[str], str]) -> Union[list, dict, str]:
         """
             Process the output format based on the specified format.
@@ -474,27 +529,41 @@ class Antonyms:
         if self._output_format == 'list':
             processed_output = sorted({word.lower() for word in antonyms})
         elif self._output_format == 'dictionary':
-            processed_output = {self._word: {'part_of_speech': ''.join(part_of_speech),
+            processed_output = {self._search_string: {'part_of_speech': ''.join(part_of_speech),
                                              'antonyms': sorted(set(antonyms))}}
         elif self._output_format == 'json':
-            processed_output = json.dumps({self._word:
+            processed_output = json.dumps({self._search_string:
                                                {'part_of_speech': ''.join(part_of_speech),
                                                 'antonyms': sorted(set(antonyms), key=len)}}, indent=4, ensure_ascii=False)
         return processed_output
 
-    def find_antonyms(self) -> Union[List[Sized], Dict[str, List[str]], str]:
+    @tracing.traced()
+    @multilingual.translated
+    def find_antonyms(self,
+                      deadline: Optional[float] = None,
+                      quorum: Optional[int] = None,
+                      min_results: Optional[int] = None) -> Union[List[Sized], Dict[str, List[str]], str]:
         """
         This function queries multiple online repositories to discover antonyms
         associated with the specific word provided to the Class Antonyms.
         The antonyms are deduplicated and sorted alphabetically.
 
+        :param deadline: Seconds after which the results of the sources that have finished are
+                         returned. The sources that had not finished are listed in incomplete_sources.
+        :type deadline: Optional[float]
+        :param quorum: Returns as soon as this number of sources agree on a result.
+        :type quorum: Optional[int]
+        :param min_results: Returns as soon as this number of distinct results has been gathered.
+        :type min_results: Optional[int]
         :returns: antonyms with parts of speech
         :rtype: Union[List[Sized], Dict[str, List[str]], str]
+        :raises InvalidOutputFormatException: When the output format is not dictionary, list or json.
         """
+        query_runner.validate_limits(deadline, quorum, min_results)
+        self.incomplete_sources = []
         if self._output_format not in self._valid_output_formats:
-            colorized_text(text=f'The provided output type --> {self._output_format} <-- is not one of the '
-                                f'acceptable types: dictionary, list or json.', color='red')
-            sys.exit(1)
+            raise InvalidOutputFormatException(f'The provided output type --> {self._output_format} <-- is not one of '
+                                               f'the acceptable types: dictionary, list or json.')
         else:
             valid_word = self._validate_word()
             if valid_word is False:
@@ -503,28 +572,78 @@ class Antonyms:
             elif valid_word is True:
                 check_cache = self._check_cache()
                 if check_cache[0] is True:
-                    part_of_speech = list(check_cache[1].keys())[0]
-                    antonyms = cleansing.flatten_multidimensional_list(list(check_cache[1].values()))
-                    return self._query_output(antonyms, part_of_speech)
+                    return check_cache[1]
                 elif check_cache[0] is False:
-                    query_results = self._run_query_tasks_in_parallel()
-                    part_of_speech = {x[1] for x in query_results if x and x is not None}
-                    antonyms = ([x[0] for x in query_results if x and x is not None])
-                    # flatten antonyms list
-                    antonyms_results = cleansing.flatten_multidimensional_list(sorted(antonyms))
-                    # remove excess white spaces from the strings in the list
-                    antonyms_results = cleansing.normalize_space(sorted(antonyms_results))
-                    if not antonyms_results:
-                        colorized_text(text=f'No antonyms were found for the word: {self._word} \n'
-                                       f'Please verify that the word is spelled correctly.', color='blue')
-                    else:
-                        return self._query_output(antonyms_results, part_of_speech)
+                    query_results = self._run_query_tasks_in_parallel(deadline=deadline,
+                                                                      quorum=quorum,
+                                                                      min_results=min_results)
+                    return self._merged_query_output(query_results)
+
+    def _merged_query_output(self, query_results: List[Union[Tuple[List[str], str], None]]) -> Union[list, dict, str, None]:
+        return query_runner.merged_query_output(query_results, self._query_output, 'antonyms', self._word)
+
+    @multilingual.translated_stream
+    def iter_antonyms(self,
+                      deadline: Optional[float] = None,
+                      quorum: Optional[int] = None,
+                      min_results: Optional[int] = None) -> Iterator[query_runner.StreamedResult]:
+        """
+        This function queries the same online repositories as find_antonyms, but it yields the
+        antonyms of every source as soon as its query finishes. The last yielded result is
+        the merged result of all the sources, which is also the result of find_antonyms.
+        A cached word yields only the merged result.
+
+        :param deadline: Seconds after which the results of the sources that have finished are
+                         merged. The sources that had not finished are listed in incomplete_sources.
+        :type deadline: Optional[float]
+        :param quorum: Stops as soon as this number of sources agree on a result.
+        :type quorum: Optional[int]
+        :param min_results: Stops as soon as this number of distinct results has been gathered.
+        :type min_results: Optional[int]
+        :returns: the output of every source, followed by the merged output with final set to True
+        :rtype: Iterator[query_runner.StreamedResult]
+        :raises InvalidOutputFormatException: When the output format is not dictionary, list or json.
+        """
+        query_runner.validate_limits(deadline, quorum, min_results)
+        self.incomplete_sources = []
+        if self._output_format not in self._valid_output_formats:
+            raise InvalidOutputFormatException(f'The provided output type --> {self._output_format} <-- is not one of '
+                                               f'the acceptable types: dictionary, list or json.')
+        if self._validate_word() is False:
+            colorized_text(text=f'Please verify that the word {self._word} is spelled correctly.', color='magenta')
+            return
+        self.incomplete_sources = yield from query_runner.stream_query_output(self._query_tasks,
+                                                                              self._check_cache,
+                                                                              self._query_output,
+                                                                              self._merged_query_output,
+                                                                              deadline=deadline,
+                                                                              quorum=quorum,
+                                                                              min_results=min_results)
+
+    def aiter_antonyms(self,
+                       deadline: Optional[float] = None,
+                       quorum: Optional[int] = None,
+                       min_results: Optional[int] = None) -> AsyncIterator[query_runner.StreamedResult]:
+        """
+        The asynchronous iterator variant of iter_antonyms, for use with async for.
+
+        :param deadline: Seconds after which the results of the sources that have finished are merged.
+        :type deadline: Optional[float]
+        :param quorum: Stops as soon as this number of sources agree on a result.
+        :type quorum: Optional[int]
+        :param min_results: Stops as soon as this number of distinct results has been gathered.
+        :type min_results: Optional[int]
+        :returns: the output of every source, followed by the merged output with final set to True
+        :rtype: AsyncIterator[query_runner.StreamedResult]
+        """
+        return query_runner.iterate_async(self.iter_antonyms(deadline=deadline, quorum=quorum, min_results=min_results))
 
     @staticmethod
     def _handle_query_exceptions(error):
         """
         Helper method to handle common exceptions in query methods.
         """
+        metrics.record_query_error()
         logger.error('An error occurred in the following code segment:')
         logger.error(''.join(traceback.format_tb(error.__traceback__)))
 
@@ -548,7 +667,7 @@ class Antonyms:
                 logger.info(f'Google had no antonym reference for the word {self._word}')
                 return None
             else:
-                soup_object = BeautifulSoup(markup=response.text, features="lxml")
+                soup_object = tracing.make_soup(markup=response.text, features="lxml")
                 antonyms_list = ParseWords.parse_google_com(soup= soup_object, word=self._word)
                 if antonyms_list:
                     self._update_cache(pos_category='noun', antonyms=sorted(antonyms_list))
@@ -556,7 +675,7 @@ class Antonyms:
                 else:
                     logger.info(f'Google had no antonym reference for the word {self._word}')
                     return None
-        except (bs4.FeatureNotFound, AttributeError, IndexError, KeyError, TypeError) as error:
+        except (bs4.FeatureNotFound, AttributeError, IndexError, KeyError, TypeError, QueryRequestException) as error:
             self._handle_query_exceptions(error)
 
     def _query_thesaurus_com(self) -> Union[Tuple[List[str], str], None]:
@@ -580,9 +699,10 @@ class Antonyms:
                 logger.info(f'Thesaurus.com had no antonym reference for the word {self._word}')
                 return None
             else:
-                soup_object = BeautifulSoup(markup=response.text, features="lxml")
-                cloudflare_protection = CloudflareVerification(url='https://www.thesaurus.com', soup=soup_object).cloudflare_protected_url()
+                protection = protection_detector.detect_protection(response)
+                cloudflare_protection = protection != protection_detector.OK
                 if cloudflare_protection is False:
+                    soup_object = tracing.make_soup(markup=response.text, features="lxml")
                     antonym_button_tag = soup_object.find(name='button', attrs={'data-linkmodule': 'antonym-module'})
                     if antonym_button_tag:
                         antonyms_list = ParseWords.parse_thesaurus_com(soup=soup_object)
@@ -595,7 +715,7 @@ class Antonyms:
                 elif cloudflare_protection is True:
                     return None
 
-        except (bs4.FeatureNotFound, AttributeError, IndexError, KeyError, TypeError) as error:
+        except (bs4.FeatureNotFound, AttributeError, IndexError, KeyError, TypeError, QueryRequestException) as error:
             self._handle_query_exceptions(error)
 
     def _query_wordhippo(self) -> Union[Tuple[List[str], str], None]:
@@ -619,9 +739,10 @@ class Antonyms:
                 logger.info(f'Wordhippo.com had no antonym reference for the word {self._word}')
                 return None
             else:
-                soup_object = BeautifulSoup(markup=response.text, features="lxml")
-                cloudflare_protection = CloudflareVerification(url='https://www.wordhippo.com', soup=soup_object).cloudflare_protected_url()
+                protection = protection_detector.detect_protection(response)
+                cloudflare_protection = protection != protection_detector.OK
                 if cloudflare_protection is False:
+                    soup_object = tracing.make_soup(markup=response.text, features="lxml")
                     pattern = regex.compile(pattern=r'We do not currently know of any antonyms for')
                     if soup_object.find(text=pattern):
                         logger.info(f'Wordhippo.com had no antonym reference for the word {self._word}')
@@ -633,5 +754,5 @@ class Antonyms:
                         return antonyms_list, part_of_speech_category
                 elif cloudflare_protection is True:
                     return None
-        except (bs4.FeatureNotFound, AttributeError, IndexError, KeyError, TypeError) as error:
+        except (bs4.FeatureNotFound, AttributeError, IndexError, KeyError, TypeError, QueryRequestException) as error:
             self._handle_query_exceptions(error)
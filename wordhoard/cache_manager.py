@@ -0,0 +1,246 @@
+#!/usr/bin/env python3
+
+"""
+This Python module is designed to move the WordHoard caches between processes.
+It provides functions and a command line interface to export the caches to a
+portable file, to import them back and to warm the caches ahead of time from a
+list of words.
+"""
+__author__ = 'John Bumgarner'
+__date__ = 'October 19, 2026'
+__status__ = 'Production'
+__license__ = 'MIT'
+__copyright__ = "Copyright (C) 2026 John Bumgarner"
+
+##################################################################################
+# Date Completed: October 19, 2026
+# Author: John Bumgarner
+#
+# Date Last Revised:
+# Revised by:
+##################################################################################
+
+##################################################################################
+# “AS-IS” Clause
+#
+# Except as represented in this agreement, all work produced by Developer is
+# provided “AS IS”. Other than as provided in this agreement, Developer makes no
+# other warranties, express or implied, and hereby disclaims all implied warranties,
+# including any warranty of merchantability and warranty of fitness for a particular
+# purpose.
+##################################################################################
+
+##################################################################################
+# Python imports required for basic operations
+##################################################################################
+# Standard library imports
+import sys
+import logging
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+# Third-party imports
+from ratelimit import limits, sleep_and_retry
+
+# Local or project-specific imports
+from wordhoard.antonyms import Antonyms
+from wordhoard.synonyms import Synonyms
+from wordhoard.hyponyms import Hyponyms
+from wordhoard.hypernyms import Hypernyms
+from wordhoard.dictionary import Definitions
+from wordhoard.utilities import caching
+from wordhoard.utilities.colorized_text import colorized_text
+
+logger = logging.getLogger(__name__)
+
+# relation name -> (query class, query method, cache lookup function)
+_RELATIONS = {'antonyms': (Antonyms, 'find_antonyms', caching.cache_antonyms),
+              'synonyms': (Synonyms, 'find_synonyms', caching.cache_synonyms),
+              'definitions': (Definitions, 'find_definitions', caching.cache_definition),
+              'hypernyms': (Hypernyms, 'find_hypernyms', caching.cache_hypernyms),
+              'hyponyms': (Hyponyms, 'find_hyponyms', caching.cache_hyponyms)}
+
+
+class WarmingReport(NamedTuple):
+    """
+        The outcome of a cache warming job.
+
+        Attributes
+        ----------
+        number_of_lookups : int
+            The number of lookups that were performed, including the failed lookups.
+        failures : Dict[Tuple[str, str], str]
+            The error message of every failed lookup by (relation, word).
+    """
+    number_of_lookups: int
+    failures: Dict[Tuple[str, str], str]
+
+
+def export_cache(file_path: str, file_format: Optional[str] = None) -> int:
+    """
+    Writes the contents of all the relation caches to a portable file.
+
+    :param file_path: The path of the file to write. Files ending in .jsonl are written as JSON Lines,
+                      files ending in .db, .sqlite or .sqlite3 are written as SQLite databases.
+    :type file_path: str
+    :param file_format: 'jsonl' or 'sqlite'. Overrides the format implied by the file extension.
+    :type file_format: Optional[str]
+    :return: The number of exported entries.
+    :rtype: int
+    """
+    return caching.export_cache(file_path=file_path, file_format=file_format)
+
+
+def import_cache(file_path: str, file_format: Optional[str] = None) -> int:
+    """
+    Loads a file written by export_cache into the relation caches.
+
+    :param file_path: The path of the file to read.
+    :type file_path: str
+    :param file_format: 'jsonl' or 'sqlite'. Overrides the format implied by the file extension.
+    :type file_format: Optional[str]
+    :return: The number of imported entries.
+    :rtype: int
+    """
+    return caching.import_cache(file_path=file_path, file_format=file_format)
+
+
+def warm(words: Iterable[str],
+         relations: Optional[List[str]] = None,
+         max_number_of_requests: int = 30,
+         rate_limit_timeout_period: int = 60,
+         user_agent: Optional[str] = None,
+         proxies: Optional[Dict[str, str]] = None,
+         max_workers: int = 1) -> WarmingReport:
+    """
+    Fills the relation caches ahead of time for a list of words.
+
+    Words that are already cached for a relation, or that normalize to a word that was
+    already looked up, are skipped. The lookups share a single rate limit, which pauses
+    the job until the rate limit period resets instead of dropping words. A failed lookup
+    is logged and reported, and the job continues with the other lookups.
+
+    :param words: The words to look up.
+    :type words: Iterable[str]
+    :param relations: The relations to warm. Defaults to all relations, which are
+                      antonyms, synonyms, definitions, hypernyms and hyponyms.
+    :type relations: Optional[List[str]]
+    :param max_number_of_requests: Maximum number of lookups within the rate limit period.
+    :type max_number_of_requests: int
+    :param rate_limit_timeout_period: The rate limit period in seconds.
+    :type rate_limit_timeout_period: int
+    :param user_agent: User agent string for HTTP requests.
+    :type user_agent: Optional[str]
+    :param proxies: Dictionary of proxies for Python Requests.
+    :type proxies: Optional[Dict[str, str]]
+    :param max_workers: The number of lookups performed concurrently.
+    :type max_workers: int
+    :return: The number of lookups that were performed and the failed lookups.
+    :rtype: WarmingReport
+    :raises ValueError: When an unknown relation is requested.
+    """
+    relations = relations or list(_RELATIONS)
+    unknown_relations = [relation for relation in relations if relation not in _RELATIONS]
+    if unknown_relations:
+        raise ValueError(f'Unknown relations: {", ".join(unknown_relations)}. '
+                         f'Acceptable relations: {", ".join(_RELATIONS)}.')
+
+    @sleep_and_retry
+    @limits(calls=max_number_of_requests, period=rate_limit_timeout_period)
+    def _lookup(relation: str, word: str) -> None:
+        query_class, query_method, _ = _RELATIONS[relation]
+        query = query_class(search_string=word,
+                            max_number_of_requests=max_number_of_requests,
+                            rate_limit_timeout_period=rate_limit_timeout_period,
+                            user_agent=user_agent,
+                            proxies=proxies)
+        getattr(query, query_method)()
+
+    pending_lookups = {}
+    for word in words:
+        word = caching.normalize_key(word)
+        if not word:
+            continue
+        for relation in relations:
+            cache_lookup = _RELATIONS[relation][2]
+            if cache_lookup(word)[0] is True:
+                continue
+            pending_lookups[(relation, word)] = None
+
+    failures: Dict[Tuple[str, str], str] = {}
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+        running_lookups = {executor.submit(_lookup, relation, word): (relation, word)
+                           for relation, word in pending_lookups}
+        for future, (relation, word) in running_lookups.items():
+            try:
+                future.result()
+            except Exception as error:
+                logger.error(f'The cache warming lookup of the {relation} of {word} failed: {error!r}')
+                failures[(relation, word)] = str(error) or type(error).__name__
+    number_of_lookups = len(pending_lookups)
+    logger.info(f'The cache warming job performed {number_of_lookups} lookups, {len(failures)} of which failed.')
+    return WarmingReport(number_of_lookups=number_of_lookups, failures=failures)
+
+
+def main(arguments: Optional[List[str]] = None) -> int:
+    """
+    Command line interface for warming the WordHoard caches and converting cache files.
+
+    Usage Examples
+    ----------
+    wordhoard-cache warm words.txt --relations synonyms antonyms --output cache.db
+    wordhoard-cache warm more_words.txt --input cache.db --output cache.db
+    wordhoard-cache convert cache.db cache.jsonl
+
+    :param arguments: The command line arguments. Defaults to sys.argv.
+    :type arguments: Optional[List[str]]
+    :return: exit status
+    :rtype: int
+    """
+    parser = argparse.ArgumentParser(prog='wordhoard-cache',
+                                     description='Warm the WordHoard caches and convert cache files.')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    warm_parser = subparsers.add_parser('warm', help='fill the caches from a file with one word per line')
+    warm_parser.add_argument('word_list', help='file with one word per line')
+    warm_parser.add_argument('--relations', nargs='+', choices=list(_RELATIONS), default=None)
+    warm_parser.add_argument('--input', dest='input_file', default=None,
+                             help='cache file to load before warming')
+    warm_parser.add_argument('--output', dest='output_file', default=None,
+                             help='cache file to write after warming')
+    warm_parser.add_argument('--max-number-of-requests', type=int, default=30)
+    warm_parser.add_argument('--rate-limit-timeout-period', type=int, default=60)
+    warm_parser.add_argument('--max-workers', type=int, default=1)
+
+    convert_parser = subparsers.add_parser('convert', help='convert a cache file to another file format')
+    convert_parser.add_argument('input_file')
+    convert_parser.add_argument('output_file')
+
+    parsed = parser.parse_args(arguments)
+
+    if parsed.command == 'warm':
+        if parsed.input_file:
+            import_cache(file_path=parsed.input_file)
+        with open(file=parsed.word_list, mode='r', encoding='utf-8') as infile:
+            report = warm(words=infile,
+                          relations=parsed.relations,
+                          max_number_of_requests=parsed.max_number_of_requests,
+                          rate_limit_timeout_period=parsed.rate_limit_timeout_period,
+                          max_workers=parsed.max_workers)
+        colorized_text(text=f'{report.number_of_lookups} lookups were performed.', color='green')
+        for (relation, word), message in report.failures.items():
+            colorized_text(text=f'The lookup of the {relation} of {word} failed: {message}', color='red')
+        if parsed.output_file:
+            number_of_entries = export_cache(file_path=parsed.output_file)
+            colorized_text(text=f'{number_of_entries} cache entries were exported to {parsed.output_file}.',
+                           color='green')
+    elif parsed.command == 'convert':
+        import_cache(file_path=parsed.input_file)
+        number_of_entries = export_cache(file_path=parsed.output_file)
+        colorized_text(text=f'{number_of_entries} cache entries were written to {parsed.output_file}.', color='green')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
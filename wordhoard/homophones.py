@@ -2,7 +2,11 @@
 
 """
 This Python module is designed to query internal repositories for the
-homophones associated with the given word.
+homophones associated with the given word. The curated list of common English
+homophones is answered first. The homophone candidates of the other words come
+from a phonetic index, which maps the Double Metaphone key, the vowel sounds and
+the consonant voicing of every bundled English word to the words that are
+pronounced alike.
 """
 __author__ = 'John Bumgarner'
 __date__ = 'June 11, 2021'
@@ -33,21 +37,27 @@ __copyright__ = "Copyright (C) 2021 John Bumgarner"
 ##################################################################################
 # Standard library imports
 import os
-import sys
 import pickle
 import logging
+import threading
 import traceback
-from typing import List, Union
+from itertools import islice
+from typing import Dict, Iterable, List, Optional, Set, Tuple, Union
 
 # Local or project-specific imports
 from wordhoard.utilities import word_verification
+from wordhoard.utilities.phonetics import consonant_voicing, double_metaphone, vowel_sounds
 from wordhoard.utilities.colorized_text import colorized_text
+from wordhoard.utilities.exceptions import PickleFileException
 
 logger = logging.getLogger(__name__)
 
 # Define module-level variables to store loaded data
 _known_homophones_list = []
 _no_homophones_list = []
+# The curated homophones by word and the words with no known homophones, for constant time lookups
+_known_homophones_index: Dict[str, Set[str]] = {}
+_no_homophones_set: Set[str] = set()
 
 class PickleLoader:
     """
@@ -84,6 +94,25 @@ class PickleLoader:
         except (FileNotFoundError, OSError) as error:
             PickleLoader.handle_pickle_load_error(_file_no_known_homophones, error)
 
+        PickleLoader.index_homophones()
+
+    @staticmethod
+    def index_homophones() -> None:
+        """
+            Indexes the loaded homophones by word, so a word is looked up in constant time.
+
+            :returns: None
+            :rtype: NoneType
+        """
+        global _known_homophones_index, _no_homophones_set
+        known_homophones_index: Dict[str, Set[str]] = {}
+        for homophones in _known_homophones_list:
+            for word in homophones:
+                known_homophones_index.setdefault(word, set()).update(homophone for homophone in homophones
+                                                                      if homophone != word)
+        _known_homophones_index = known_homophones_index
+        _no_homophones_set = set(_no_homophones_list)
+
     @staticmethod
     def handle_pickle_load_error(file_path: str, error: Exception) -> None:
         """
@@ -95,16 +124,120 @@ class PickleLoader:
             :arg type error: Exception
             :returns: None
             :rtype; NoneType
+            :raises PickleFileException: Always, with the original error as its cause.
         """
         if isinstance(error, FileNotFoundError):
             logger.error(f'The pickle file {file_path} was not found. Aborting operation.')
         else:
             logger.error(f"An OS error occurred when trying to open the pickle file {file_path}")
         logger.error(''.join(traceback.format_tb(error.__traceback__)))
-        sys.exit(1)
+        raise PickleFileException(f'The pickle file {file_path} could not be loaded.') from error
 
 PickleLoader.load_pickle_files()
 
+
+##################################################################################
+# module level phonetic index of the bundled English words
+##################################################################################
+# A Double Metaphone key, the vowel sounds and the consonant voicing of a word
+PhoneticKey = Tuple[str, Tuple[str, ...], str]
+
+# The length of the Double Metaphone keys in the phonetic index, which is long enough
+# to tell long words apart
+PHONETIC_KEY_LENGTH = 12
+
+_phonetic_index_lock = threading.Lock()
+_phonetic_index: Optional[Dict[PhoneticKey, Tuple[str, ...]]] = None
+
+def phonetic_key(word: str) -> PhoneticKey:
+    """
+    Returns the key of a word in the phonetic index, which is its primary Double Metaphone
+    key, its vowel sounds and the voicing of its consonants.
+
+    :param word: The word to encode.
+    :type word: str
+    :return: The phonetic key.
+    :rtype: PhoneticKey
+    """
+    return double_metaphone(word, PHONETIC_KEY_LENGTH)[0], vowel_sounds(word), consonant_voicing(word)
+
+def phonetic_index() -> Dict[PhoneticKey, Tuple[str, ...]]:
+    """
+    Returns the phonetic index, which maps the primary and the alternate Double Metaphone keys
+    of the bundled English words, together with their vowel sounds and consonant voicing, to
+    the words with that key.
+    The words of a key are ranked when the index is built: the words whose primary key matches
+    come before the words whose alternate key matches, and shorter words come first.
+    The index is built on first use.
+
+    :return: The ranked words by phonetic key.
+    :rtype: Dict[PhoneticKey, Tuple[str, ...]]
+    """
+    global _phonetic_index
+    if _phonetic_index is not None:
+        return _phonetic_index
+    with _phonetic_index_lock:
+        if _phonetic_index is None:
+            ranked_words_by_key: Dict[PhoneticKey, List[Tuple[bool, int, str]]] = {}
+            for word in _no_homophones_set.union(_known_homophones_index):
+                primary_key, alternate_key = double_metaphone(word, PHONETIC_KEY_LENGTH)
+                sounds, voicing = vowel_sounds(word), consonant_voicing(word)
+                for key in {primary_key, alternate_key}:
+                    if key:
+                        ranked_words_by_key.setdefault((key, sounds, voicing), []).append(
+                            (key != primary_key, len(word), word))
+            _phonetic_index = {key: tuple(word for _, _, word in sorted(ranked_words))
+                               for key, ranked_words in ranked_words_by_key.items()}
+            logger.info(f'The phonetic index of {len(_no_homophones_set) + len(_known_homophones_index)} '
+                        f'words was built with {len(_phonetic_index)} keys.')
+        return _phonetic_index
+
+def phonetic_homophones(word: str, max_candidates: int = 10) -> Tuple[str, ...]:
+    """
+    Returns the homophone candidates of a word, which are the bundled English words with the
+    same primary Double Metaphone key, vowel sounds and consonant voicing, in the order of the index.
+
+    :param word: The word to find homophone candidates for.
+    :type word: str
+    :param max_candidates: The maximum number of candidates.
+    :type max_candidates: int
+    :return: The homophone candidates.
+    :rtype: Tuple[str, ...]
+    """
+    key = phonetic_key(word)
+    if not key[0]:
+        return ()
+    candidates = (candidate for candidate in phonetic_index().get(key, ()) if candidate != word)
+    return tuple(islice(candidates, max_candidates))
+
+def homophones_of_words(words: Iterable[str], phonetic: bool = True) -> Dict[str, List[str]]:
+    """
+    Finds the homophones of many words, e.g. the tokens of a document, with a constant time
+    lookup per distinct word. The curated homophones take precedence over the phonetic
+    candidates, and the words with no known homophones have no phonetic candidates.
+
+    :param words: The words to find homophones for.
+    :type words: Iterable[str]
+    :param phonetic: False returns only the curated homophones.
+    :type phonetic: bool
+    :return: The homophones by word, for the words that have homophones.
+    :rtype: Dict[str, List[str]]
+    """
+    homophones_by_word: Dict[str, List[str]] = {}
+    seen_words: Set[str] = set()
+    for word in words:
+        word = ' '.join(word.lower().split())
+        if not word or word in seen_words:
+            continue
+        seen_words.add(word)
+        if word in _known_homophones_index:
+            homophones_by_word[word] = sorted(_known_homophones_index[word])
+        elif phonetic and word not in _no_homophones_set:
+            candidates = phonetic_homophones(word)
+            if candidates:
+                homophones_by_word[word] = list(candidates)
+    return homophones_by_word
+
 class Homophones:
     """
         Purpose
@@ -120,12 +253,19 @@ class Homophones:
         Parameters
         ----------
         :param search_string: string containing the variable to obtain homophones for
+        :param phonetic: False answers only from the curated list of common English homophones
+        :param max_candidates: the maximum number of phonetic homophone candidates
         """
 
     def __init__(self,
-                 search_string: str = ''):
+                 search_string: str = '',
+                 phonetic: bool = True,
+                 max_candidates: int = 10):
 
-        self._word = search_string
+        self._search_string = search_string
+        self._word = ' '.join(search_string.lower().split())
+        self._phonetic = phonetic
+        self._max_candidates = max_candidates
 
     def _validate_word(self) -> bool:
         """
@@ -149,12 +289,7 @@ class Homophones:
         :return: list of homophones
         :rtype: list
         """
-        homophones_list = []
-        for homophones in _known_homophones_list:
-            if any(word == self._word for word in homophones):
-                homophones_list.extend(
-                    f'{self._word} is a homophone of {word}' for word in homophones if word != self._word)
-        return list(set(homophones_list))
+        return [f'{self._word} is a homophone of {word}' for word in _known_homophones_index.get(self._word, ())]
 
     def _english_words_without_homophones(self) -> bool:
         """
@@ -164,12 +299,24 @@ class Homophones:
         :return: True or False
         :rtype: bool
         """
-        return self._word in _no_homophones_list
+        return self._word in _no_homophones_set
+
+    def _phonetic_homophones(self) -> List[str]:
+        """
+        This function looks up the homophone candidates of the word
+        in the phonetic index of the bundled English words.
+
+        :return: list of homophone candidates
+        :rtype: list
+        """
+        return [f'{self._word} may be a homophone of {word}'
+                for word in phonetic_homophones(self._word, self._max_candidates)]
 
     def find_homophones(self) -> Union[List[str], None]:
         """
         This function queries multiple lists to find English language homophones associated
-        with the specific word provided to the Class Homophones.
+        with the specific word provided to the Class Homophones. A word that is not in the
+        lists gets the homophone candidates of the phonetic index.
 
         :return: list of homophones
         :rtype: Union[List[str]
@@ -179,6 +326,9 @@ class Homophones:
             if known_english_homophones:
                 return known_english_homophones
             elif self._english_words_without_homophones() is False:
+                phonetic_homophone_candidates = self._phonetic_homophones() if self._phonetic else []
+                if phonetic_homophone_candidates:
+                    return phonetic_homophone_candidates
                 colorized_text(text=f'No homophones for the word - {self._word}', color='magenta')
                 return None
         return None
@@ -32,7 +32,6 @@ __copyright__ = "Copyright (C) 2021 John Bumgarner"
 # Python imports required for basic operations
 ##################################################################################
 # Standard library imports
-import sys
 import json
 import logging
 import traceback
@@ -46,10 +45,11 @@ from backoff import on_exception, expo
 from ratelimit import limits, RateLimitException
 
 # Local or project-specific imports
+from wordhoard.utilities import protection_detector, tracing, transport
 from wordhoard.utilities.request_html import Query
 from wordhoard.utilities.colorized_text import colorized_text
-from wordhoard.utilities import caching, cleansing, word_verification
-from wordhoard.utilities.cloudflare_checker import CloudflareVerification
+from wordhoard.utilities.exceptions import InvalidOutputFormatException, QueryRequestException
+from wordhoard.utilities import caching, cleansing, metrics, multilingual, word_verification
 
 logger = logging.getLogger(__name__)
 
@@ -78,10 +78,12 @@ class SoupParser:
         """
         Helper method to handle common exceptions in query methods.
         """
+        metrics.record_query_error()
         logger.error('An error occurred in the following code segment:')
         logger.error(''.join(traceback.format_tb(error.__traceback__)))
 
     @staticmethod
+    @tracing.traced()
     def get_number_of_pages(soup: BeautifulSoup) -> int:
         """
         This function determines the number of pages that contain hypernyms and hyperonyms for a specific word.
@@ -110,6 +112,7 @@ class SoupParser:
         return number_of_pages
 
     @staticmethod
+    @tracing.traced()
     def get_hypernyms(soup: BeautifulSoup) -> List[str]:
         """
          Parses hypernyms and hyperonyms from the HTML response of classicthesaurus_com.
@@ -167,13 +170,20 @@ class Hypernyms:
             User agent string for HTTP requests.
         proxies : dict, optional
             Dictionary of proxies for Python Requests.
+        translator : BatchTranslator, optional
+            A Google, MyMemory or DeepL Translator for a word that is not English. The word is
+            translated into English for the lookup and the hypernyms are translated back.
 
         Attributes
         ----------
         _proxies : Optional[Dict[str, str]]
             Proxies to use with Python Requests.
+        _translator : Optional[BatchTranslator]
+            The translator of the language of the word, or None for an English word.
+        _search_string : str
+            The word as provided, which is used in the output.
         _word : str
-            The word to find hypernyms for.
+            The normalized word to find hypernyms for, which is used for the cache and the queries.
         _user_agent : Optional[str]
             User agent for HTTP requests.
         _output_format : str
@@ -189,8 +199,8 @@ class Hypernyms:
             Finds hypernyms for the specified word.
         _validate_word() -> bool:
             Validates the syntax of the word.
-        _check_cache() -> Tuple[bool, Union[Dict[str, List[str]], None]]:
-            Checks if hypernyms are cached.
+        _check_cache() -> Tuple[bool, Union[List[str], Dict[str, List[str]], str, None]]:
+            Returns the output for cached hypernyms, which is built once per output format.
         _update_cache(self, hypernym: List[str]) -> None:
             Updates the cache with new hypernyms.
         _request_http_response(url: str) -> requests.models.Response:
@@ -209,10 +219,13 @@ class Hypernyms:
                  max_number_of_requests: int = 30,
                  rate_limit_timeout_period: int = 60,
                  user_agent: Optional[str] = None,
-                 proxies: Optional[Dict[str, str]] = None):
+                 proxies: Optional[Dict[str, str]] = None,
+                 translator: Optional[multilingual.BatchTranslator] = None):
 
         self._proxies = proxies
-        self._word = search_string
+        self._translator = translator
+        self._search_string = search_string
+        self._word = caching.normalize_key(search_string)
         self._user_agent = user_agent
         self._output_format = output_format
         self._valid_output_formats = {'dictionary', 'list', 'json'}
@@ -227,7 +240,9 @@ class Hypernyms:
                                on_backoff=self._backoff_handler)
         # Establishes a rate limit for making requests to the hypernym repositories
         limiter = limits(calls=max_number_of_requests, period=rate_limit_timeout_period)
-        self.find_hypernyms = handler(limiter(self.find_hypernyms))
+        # Replayed requests do not reach the online repositories, so they are not rate limited
+        if transport.replay_enabled() is False:
+            self.find_hypernyms = handler(limiter(self.find_hypernyms))
 
     def _backoff_handler(self, details) -> None:
         """
@@ -250,10 +265,12 @@ class Hypernyms:
         - Displays colorized text messages to indicate the backoff status.
         - Logs an info message when the rate limit is initially reached.
         - Sets the `_rate_limit_status` attribute to True when the rate limit is first encountered.
+        - Records the backoff in the WordHoard metrics.
 
         :returns: None
         :rtype: NoneType
         """
+        metrics.record_backoff('hypernyms')
         if self._rate_limit_status is False:
             colorized_text(text='The hypernym query rate limit was reached. The querying process is '
                                 'entering a temporary hibernation mode.', color='red')
@@ -278,13 +295,15 @@ class Hypernyms:
             logger.error(f'Please verify that the word {self._word} is spelled correctly.')
         return valid_word
 
-    def _check_cache(self)-> Tuple[bool, Union[List[str], None]]:
-        check_cache = caching.cache_hypernyms(self._word)
+    def _check_cache(self) -> Tuple[bool, Union[List[str], Dict[str, List[str]], str, None]]:
+        check_cache = caching.cached_output('hypernyms', self._word, self._output_format, self._query_output,
+                                            display_word=self._search_string)
         return check_cache
 
     def _update_cache(self, hypernym: List[str]) -> None:
         caching.insert_word_cache_hypernyms(self._word, hypernym)
 
+    @tracing.traced()
     def _query_output(self, hypernyms: list) -> Union[list, dict, str]:
         """
             Process the output format based on the specified format.
@@ -302,12 +321,13 @@ class Hypernyms:
         if self._output_format == 'list':
             processed_output = sorted(hypernyms)
         elif self._output_format == 'dictionary':
-            processed_output = {self._word: sorted(hypernyms)}
+            processed_output = {self._search_string: sorted(hypernyms)}
         elif self._output_format == 'json':
-            processed_output = json.dumps({'hypernyms': {self._word: sorted(hypernyms)}},
+            processed_output = json.dumps({'hypernyms': {self._search_string: sorted(hypernyms)}},
                                           indent=4, ensure_ascii=False)
         return processed_output
 
+    @tracing.traced()
     def _request_http_response(self, url: str) -> requests.models.Response:
         """
         This function queries the requested online repository and returns the
@@ -333,9 +353,12 @@ class Hypernyms:
         """
         Helper method to handle common exceptions in query methods.
         """
+        metrics.record_query_error()
         logger.error('An error occurred in the following code segment:')
         logger.error(''.join(traceback.format_tb(error.__traceback__)))
 
+    @tracing.traced()
+    @multilingual.translated
     def find_hypernyms(self) -> Union[List[str], Dict[str, List[str]], str, None]:
         """
         This function queries classicthesaurus_com for hypernyms associated
@@ -345,6 +368,7 @@ class Hypernyms:
         :rtype: Union[List[str], Dict[str, List[str]], str, None]
 
         :raises:
+            - InvalidOutputFormatException: When the output format is not dictionary, list or json.
             - AttributeError: When an attribute reference or assignment fails.
             - IndexError: When a sequence subscript is out of range.
             - KeyError: When a mapping key is not found in the set of existing keys.
@@ -353,9 +377,8 @@ class Hypernyms:
         """
         hypernyms: list = []
         if self._output_format not in self._valid_output_formats:
-            colorized_text(text=f'The provided output type --> {self._output_format} <-- is not one of the '
-                           f'acceptable types: dictionary, list or json.', color='red')
-            sys.exit(1)
+            raise InvalidOutputFormatException(f'The provided output type --> {self._output_format} <-- is not one of '
+                                               f'the acceptable types: dictionary, list or json.')
         else:
             valid_word = self._validate_word()
             if valid_word is False:
@@ -363,37 +386,40 @@ class Hypernyms:
             elif valid_word is True:
                 check_cache = self._check_cache()
                 if check_cache[0] is True:
-                    hypernym = cleansing.flatten_multidimensional_list(list(check_cache[1]))
-                    return self._query_output(hypernym)
+                    return check_cache[1]
                 elif check_cache[0] is False:
-                    try:
-                        response = self._request_http_response(url=f'https://www.classicthesaurus.com'
-                                                               f'/{self._word}/broader')
-                        if response.status_code == 404:
-                            logger.info(f'Classic Thesaurus had no hypernyms reference for the word {self._word}')
-                            return None
-                        else:
-                            soup_object = BeautifulSoup(markup=response.text, features="lxml")
-                            cloudflare_protection = CloudflareVerification(url='https://www.classicthesaurus.com',
-                                                                           soup=soup_object).cloudflare_protected_url()
-                            if cloudflare_protection is False:
-                                hypernym = SoupParser.get_hypernyms(soup=soup_object)
-                                if 'no hypernyms found' in hypernym:
-                                    colorized_text(text=f'No hypernyms were found for the word: {self._word} \n'
-                                                   f'Please verify that the word is spelled correctly.', color='blue')
-                                else:
-                                    number_of_pages = SoupParser.get_number_of_pages(soup=soup_object)
-                                    if number_of_pages >= 2:
-                                        for page in range(2, number_of_pages):
-                                            sub_html = self._request_http_response(
-                                                url=f'https://www.classicthesaurus.com/{self._word}/broader/{page}')
-                                            sub_soup = BeautifulSoup(markup=sub_html.text, features='lxml')
-                                            additional_hypernym = SoupParser.get_hypernyms(soup=sub_soup)
-                                            if additional_hypernym:
-                                                hypernyms.append(additional_hypernym)
-                                    self._update_cache(sorted(cleansing.flatten_multidimensional_list(hypernyms)))
-                                    return self._query_output(cleansing.flatten_multidimensional_list(hypernyms))
-                            elif cloudflare_protection is True:
+                    if metrics.source_available('hypernyms', 'classicthesaurus') is False:
+                        return None
+                    with metrics.query_scope('hypernyms', 'classicthesaurus') as scope:
+                        try:
+                            response = self._request_http_response(url=f'https://www.classicthesaurus.com'
+                                                                   f'/{self._word}/broader')
+                            if response.status_code == 404:
+                                logger.info(f'Classic Thesaurus had no hypernyms reference for the word {self._word}')
                                 return None
-                    except (bs4.FeatureNotFound, AttributeError, IndexError, KeyError, TypeError) as error:
-                        self._handle_query_exceptions(error)
+                            else:
+                                protection = protection_detector.detect_protection(response)
+                                cloudflare_protection = protection != protection_detector.OK
+                                if cloudflare_protection is False:
+                                    soup_object = tracing.make_soup(markup=response.text, features="lxml")
+                                    hypernym = SoupParser.get_hypernyms(soup=soup_object)
+                                    if 'no hypernyms found' in hypernym:
+                                        colorized_text(text=f'No hypernyms were found for the word: {self._word} \n'
+                                                       f'Please verify that the word is spelled correctly.', color='blue')
+                                    else:
+                                        number_of_pages = SoupParser.get_number_of_pages(soup=soup_object)
+                                        if number_of_pages >= 2:
+                                            for page in range(2, number_of_pages):
+                                                sub_html = self._request_http_response(
+                                                    url=f'https://www.classicthesaurus.com/{self._word}/broader/{page}')
+                                                sub_soup = tracing.make_soup(markup=sub_html.text, features='lxml')
+                                                additional_hypernym = SoupParser.get_hypernyms(soup=sub_soup)
+                                                if additional_hypernym:
+                                                    hypernyms.append(additional_hypernym)
+                                        scope.results = len(cleansing.flatten_multidimensional_list(hypernyms))
+                                        self._update_cache(sorted(cleansing.flatten_multidimensional_list(hypernyms)))
+                                        return self._query_output(cleansing.flatten_multidimensional_list(hypernyms))
+                                elif cloudflare_protection is True:
+                                    return None
+                        except (bs4.FeatureNotFound, AttributeError, IndexError, KeyError, TypeError, QueryRequestException) as error:
+                            self._handle_query_exceptions(error)
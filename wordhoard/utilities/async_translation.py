@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+
+"""
+This Python module runs the translations of the asynchronous translator methods. The
+translation requests are made by the same rate limited methods as the synchronous
+translations, in a shared thread pool, so the event loop is never blocked and the number
+of concurrent translation requests is bounded by the size of the pool, regardless of
+the number of words that are translated concurrently.
+"""
+__author__ = 'John Bumgarner'
+__date__ = 'October 19, 2026'
+__status__ = 'Production'
+__license__ = 'MIT'
+__copyright__ = "Copyright (C) 2026 John Bumgarner"
+
+##################################################################################
+# “AS-IS” Clause
+#
+# Except as represented in this agreement, all work produced by Developer is
+# provided “AS IS”. Other than as provided in this agreement, Developer makes no
+# other warranties, express or implied, and hereby disclaims all implied warranties,
+# including any warranty of merchantability and warranty of fitness for a particular
+# purpose.
+##################################################################################
+
+##################################################################################
+# Date Completed: October 19, 2026
+# Author: John Bumgarner
+#
+# Date Last Revised:
+# Revised by:
+##################################################################################
+
+
+##################################################################################
+# Python imports required for basic operations
+##################################################################################
+# Standard library imports
+import asyncio
+import logging
+import threading
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+_max_concurrency = 8
+_executor_lock = threading.Lock()
+_executor: Optional[ThreadPoolExecutor] = None
+
+
+def configure_async_translation(max_concurrency: int = 8) -> None:
+    """
+    Configures the number of translation requests that the asynchronous translator methods
+    make concurrently.
+
+    :param max_concurrency: The maximum number of concurrent translation requests.
+    :type max_concurrency: int
+    :return: None
+    :raises ValueError: When the maximum number of concurrent requests is not positive.
+    """
+    global _max_concurrency, _executor
+    if max_concurrency < 1:
+        raise ValueError(f'The maximum number of concurrent translation requests must be positive, not {max_concurrency}.')
+    with _executor_lock:
+        previous_executor, _executor = _executor, None
+        _max_concurrency = max_concurrency
+    if previous_executor is not None:
+        # the running translations finish in the background
+        previous_executor.shutdown(wait=False)
+
+def _translation_executor() -> ThreadPoolExecutor:
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=_max_concurrency, thread_name_prefix='wordhoard-translation')
+        return _executor
+
+async def run_translation(function: Callable[..., Any], *args: Any) -> Any:
+    """
+    Runs a blocking translation function in the translation thread pool and waits for it
+    without blocking the event loop. The context, which holds the active trace span, is
+    propagated to the thread.
+
+    :param function: The translation function.
+    :type function: Callable[..., Any]
+    :param args: The arguments of the translation function.
+    :return: The result of the translation function.
+    :rtype: Any
+    """
+    loop = asyncio.get_running_loop()
+    context = contextvars.copy_context()
+    return await loop.run_in_executor(_translation_executor(), context.run, function, *args)
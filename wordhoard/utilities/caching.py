@@ -31,7 +31,238 @@ __copyright__ = "Copyright (C) 2020 John Bumgarner"
 ##################################################################################
 # Python imports required for basic operations
 ##################################################################################
-from typing import List, Dict, Optional, Tuple, Set
+import os
+import json
+import zlib
+import sqlite3
+import threading
+from array import array
+from collections import OrderedDict
+from typing import Any, Callable, Iterable, Iterator, List, Dict, Optional, Tuple, Set, Union
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+from wordhoard.utilities import cleansing, metrics
+
+##################################################################################
+# cache key normalization
+#
+# The relation classes normalize the search string before the cache lookup and
+# the URL construction, so that "Good", "good " and "good" share a cache entry.
+# Case folding and whitespace collapsing are always applied.
+##################################################################################
+_key_unicode_form: Optional[str] = None
+_key_lemmatization = False
+
+def set_key_normalization(unicode_form: Optional[str] = None, lemmatize: bool = False) -> None:
+    """
+    Configures the optional steps of the cache key normalization.
+
+    :param unicode_form: Unicode normalization form applied to the keys: NFC, NFD, NFKC or NFKD.
+                         No Unicode normalization is applied when None.
+    :type unicode_form: Optional[str]
+    :param lemmatize: Remove simple plural and third-person inflections, such as "stories" -> "story".
+    :type lemmatize: bool
+    :return: None
+    :raises ValueError: When the Unicode normalization form is unknown.
+    """
+    global _key_unicode_form, _key_lemmatization
+    if unicode_form is not None and unicode_form not in {'NFC', 'NFD', 'NFKC', 'NFKD'}:
+        raise ValueError(f'Unknown Unicode normalization form: {unicode_form}. '
+                         f'Acceptable forms: NFC, NFD, NFKC or NFKD.')
+    _key_unicode_form = unicode_form
+    _key_lemmatization = lemmatize
+
+def normalize_key(word: str) -> str:
+    """
+    Normalizes a search string into the form used for cache keys and queries.
+
+    :param word: The search string.
+    :type word: str
+    :return: The normalized search string.
+    :rtype: str
+    """
+    return cleansing.normalize_search_string(word, unicode_form=_key_unicode_form, lemmatize=_key_lemmatization)
+
+##################################################################################
+# cache locking
+#
+# The caches are shared by the query threads of every relation class. Writers
+# hold a lock that is selected from a fixed set of lock stripes by the hash of
+# the cached word, so that writers for different words rarely contend. Cached
+# values are never modified in place: a merge builds the new value and then
+# replaces the stored one, which lets readers access the caches without a lock.
+##################################################################################
+_NUMBER_OF_LOCK_STRIPES = 64
+_lock_stripes: List[threading.RLock] = [threading.RLock() for _ in range(_NUMBER_OF_LOCK_STRIPES)]
+_vocabulary_lock = threading.Lock()
+
+def _lock_for(word: str) -> threading.RLock:
+    """
+    Returns the lock stripe that guards the cache entries for a word.
+    """
+    return _lock_stripes[hash(word) % _NUMBER_OF_LOCK_STRIPES]
+
+def _deduplicate(*collections_of_values: Iterable[str]) -> List[str]:
+    """
+    Concatenates collections of values and removes duplicates, keeping the first occurrence of each value.
+    """
+    return list(dict.fromkeys(value for values in collections_of_values for value in values))
+
+##################################################################################
+# compact storage for cached values
+#
+# When compact storage is enabled every cached string is interned once in a
+# global vocabulary table and the cache values are stored as arrays of integer
+# ids into that table. Synonyms and antonyms are heavily shared between
+# headwords, so this removes most of the duplicated string objects.
+##################################################################################
+_compact_storage: bool = False
+_vocabulary: List[str] = []
+_vocabulary_index: Dict[str, int] = {}
+
+# codec markers prefixed to compressed blobs
+_CODEC_ZLIB = b'z'
+_CODEC_ZSTD = b's'
+
+def _intern_values(values: Iterable[str]) -> array:
+    """
+    Converts a collection of strings into an array of vocabulary ids.
+
+    :param values: The strings to intern.
+    :type values: Iterable[str]
+    :return: An array of unsigned integer ids.
+    :rtype: array
+    """
+    ids = array('I')
+    with _vocabulary_lock:
+        for value in values:
+            index = _vocabulary_index.get(value)
+            if index is None:
+                index = len(_vocabulary)
+                _vocabulary.append(value)
+                _vocabulary_index[value] = index
+            ids.append(index)
+    return ids
+
+def _pack(values: Union[List[str], Set[str]]) -> Union[List[str], Set[str], array]:
+    """
+    Converts cache values into their storage representation.
+    """
+    if _compact_storage:
+        return _intern_values(values)
+    return values
+
+def _unpack(values: Union[List[str], Set[str], array]) -> Union[List[str], Set[str]]:
+    """
+    Converts stored cache values back into a list of strings.
+    """
+    if isinstance(values, array):
+        return [_vocabulary[index] for index in values]
+    return values
+
+def _unpack_entry(entry: Dict[str, Union[List[str], Set[str], array]]) -> Dict[str, Union[List[str], Set[str]]]:
+    """
+    Converts a stored part-of-speech mapping back into lists of strings.
+    """
+    return {pos_category: _unpack(values) for pos_category, values in entry.items()}
+
+def enable_compact_storage(enabled: bool = True) -> None:
+    """
+    Enables or disables the compact storage of cached values.
+
+    Values that are already cached are converted to the new representation.
+
+    :param enabled: True to store values as interned id arrays, False to store plain lists.
+    :type enabled: bool
+    :return: None
+    """
+    global _compact_storage
+    for lock in _lock_stripes:
+        lock.acquire()
+    try:
+        _compact_storage = enabled
+        for cache in (temporary_dict_antonyms, temporary_dict_synonyms, temporary_dict_definition):
+            for word, entry in list(cache.items()):
+                cache[word] = {pos_category: _pack(list(_unpack(values))) for pos_category, values in entry.items()}
+        for cache in (temporary_dict_hypernyms, temporary_dict_hyponyms):
+            for word, values in list(cache.items()):
+                cache[word] = _pack(list(_unpack(values)))
+    finally:
+        for lock in _lock_stripes:
+            lock.release()
+    # every stored entry was replaced, so all the memoized outputs are stale
+    clear_output_memo()
+
+def compact_storage_enabled() -> bool:
+    """
+    Returns the status of the compact storage option.
+
+    :return: True if compact storage is enabled, False otherwise.
+    :rtype: bool
+    """
+    return _compact_storage
+
+def compress_values(values: Iterable[str]) -> bytes:
+    """
+    Compresses a collection of cached strings into a single blob.
+
+    The strings are encoded as a JSON array, so any string round-trips. The blob is compressed with zstd when the zstandard package is installed,
+    otherwise with zlib. The codec is recorded in the first byte of the blob.
+
+    :param values: The strings to compress.
+    :type values: Iterable[str]
+    :return: The compressed blob.
+    :rtype: bytes
+    """
+    payload = json.dumps(list(values), ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+    if zstandard is not None:
+        return _CODEC_ZSTD + zstandard.ZstdCompressor(level=9).compress(payload)
+    return _CODEC_ZLIB + zlib.compress(payload, 9)
+
+def decompress_values(blob: bytes) -> List[str]:
+    """
+    Decompresses a blob created by compress_values.
+
+    :param blob: The compressed blob.
+    :type blob: bytes
+    :return: The decompressed strings.
+    :rtype: List[str]
+    :raises ValueError: When the blob was compressed with an unavailable or unknown codec.
+    """
+    codec, data = blob[:1], blob[1:]
+    if codec == _CODEC_ZSTD:
+        if zstandard is None:
+            raise ValueError('The zstandard package is required to decompress this cache value.')
+        payload = zstandard.ZstdDecompressor().decompress(data)
+    elif codec == _CODEC_ZLIB:
+        payload = zlib.decompress(data)
+    else:
+        raise ValueError('Unknown cache value codec.')
+    return json.loads(payload.decode('utf-8'))
+
+def _merge_pos_values(cache: Dict[str, Dict[str, Union[List[str], array]]],
+                      word: str,
+                      pos_category: str,
+                      values: Iterable[str]) -> None:
+    """
+    Atomically merges values into the part-of-speech category of a cached word.
+    """
+    with _lock_for(word):
+        entry = cache.get(word, {})
+        merged_values = _deduplicate(_unpack(entry.get(pos_category, [])), values)
+        cache[word] = {**entry, pos_category: _pack(merged_values)}
+
+def _merge_values(cache: Dict[str, Union[List[str], array]], word: str, values: Iterable[str]) -> None:
+    """
+    Atomically merges values into a cached word. The merged values are stored sorted,
+    so that lookups can return them without sorting them again.
+    """
+    with _lock_for(word):
+        cache[word] = _pack(sorted(_deduplicate(_unpack(cache.get(word, [])), values)))
 
 ##################################################################################
 # in memory temporary cache for antonyms
@@ -47,8 +278,10 @@ def cache_antonyms(word:  str) -> Tuple[bool, Optional[str]]:
     :return: A tuple indicating success (True if antonyms are cached, False otherwise) and the cached antonyms if found.
     :rtype: Tuple[bool, Optional[str]]
     """
-    success = (retrieved := temporary_dict_antonyms.get(word)) is not None
-    return success, retrieved
+    retrieved = temporary_dict_antonyms.get(word)
+    if retrieved is None:
+        return False, None
+    return True, _unpack_entry(retrieved)
 
 def insert_word_cache_antonyms(word: str, pos_category: str, antonyms: Set[str]) -> None:
     """
@@ -62,16 +295,7 @@ def insert_word_cache_antonyms(word: str, pos_category: str, antonyms: Set[str])
     :type antonyms: Set[str]
     :return: None
     """
-    if word not in temporary_dict_antonyms:
-        # Initialize the dictionary for the word with the given part of speech category
-        temporary_dict_antonyms[word] = {pos_category: antonyms}
-    elif pos_category in temporary_dict_antonyms[word]:
-        # Deduplicate and update the existing antonyms list
-        deduplicated_values = set(antonyms) - set(temporary_dict_antonyms[word][pos_category])
-        temporary_dict_antonyms[word][pos_category] += list(deduplicated_values)
-    else:
-        # Initialize the list for the part of speech category
-        temporary_dict_antonyms[word][pos_category] = antonyms
+    _merge_pos_values(temporary_dict_antonyms, word, pos_category, antonyms)
 
 
 ##################################################################################
@@ -88,8 +312,10 @@ def cache_synonyms(word:  str) -> Tuple[bool, Optional[str]]:
     :return: A tuple indicating success (True if synonyms are cached, False otherwise) and the cached synonyms if found.
     :rtype: Tuple[bool, Optional[str]]
     """
-    success = (retrieved := temporary_dict_synonyms.get(word)) is not None
-    return success, retrieved
+    retrieved = temporary_dict_synonyms.get(word)
+    if retrieved is None:
+        return False, None
+    return True, _unpack_entry(retrieved)
 
 def insert_word_cache_synonyms(word: str, pos_category: str, synonyms: Set[str]) -> None:
     """
@@ -103,16 +329,7 @@ def insert_word_cache_synonyms(word: str, pos_category: str, synonyms: Set[str])
     :type synonyms: Set[str]
     :return: None
     """
-    if word not in temporary_dict_synonyms:
-        # Initialize the dictionary for the word with the given part of speech category
-        temporary_dict_synonyms[word] = {pos_category: synonyms}
-    elif word in temporary_dict_synonyms and pos_category in temporary_dict_synonyms[word]:
-        # Deduplicate and update the existing synonyms list
-        deduplicated_values = set(synonyms) - set(temporary_dict_synonyms[word][pos_category])
-        temporary_dict_synonyms[word][pos_category] += list(deduplicated_values)
-    else:
-        # Initialize the list for the part of speech category
-        temporary_dict_synonyms[word][pos_category] = synonyms
+    _merge_pos_values(temporary_dict_synonyms, word, pos_category, synonyms)
 
 ##################################################################################
 # in memory temporary cache for definitions
@@ -128,8 +345,10 @@ def cache_definition(word:  str) -> Tuple[bool, Optional[str]]:
     :return: A tuple indicating success (True if definitions are cached, False otherwise) and the cached definitions if found.
     :rtype: Tuple[bool, Optional[str]]
     """
-    success = (retrieved := temporary_dict_definition.get(word)) is not None
-    return success, retrieved
+    retrieved = temporary_dict_definition.get(word)
+    if retrieved is None:
+        return False, None
+    return True, _unpack_entry(retrieved)
 
 def insert_word_cache_definition(word: str, pos_category: str, definitions: Set[str]) -> None:
     """
@@ -143,16 +362,7 @@ def insert_word_cache_definition(word: str, pos_category: str, definitions: Set[
     :type definitions: Set[str]
     :return: None
     """
-    if word not in temporary_dict_definition:
-        # Initialize the dictionary for the word with the given part of speech category
-        temporary_dict_definition[word] = {pos_category: definitions}
-    elif word in temporary_dict_definition and pos_category in temporary_dict_definition[word]:
-        # Deduplicate and update the existing definitions list
-        deduplicated_values = set(definitions) - set(temporary_dict_definition[word][pos_category])
-        temporary_dict_definition[word][pos_category] += list(deduplicated_values)
-    else:
-        # Initialize the list for the part of speech category
-        temporary_dict_definition[word][pos_category] = definitions
+    _merge_pos_values(temporary_dict_definition, word, pos_category, definitions)
 
 ##################################################################################
 # in memory temporary cache for hypernyms
@@ -169,11 +379,11 @@ def cache_hypernyms(word: str) -> Tuple[bool, Optional[List[str]]]:
     :rtype: Tuple[bool, Optional[List[str]]]
     """
     try:
-        values = temporary_dict_hypernyms[word]
+        values = _unpack(temporary_dict_hypernyms[word])
     except KeyError:
         return False, None
     else:
-        return True, sorted(set(values))
+        return True, list(values)
 
 def insert_word_cache_hypernyms(word: str, values: List[str]) -> None:
     """
@@ -185,11 +395,7 @@ def insert_word_cache_hypernyms(word: str, values: List[str]) -> None:
     :type values: List[str]
     :return: None
     """
-    if word in temporary_dict_hypernyms:
-        deduplicated_values = set(values) - set(temporary_dict_hypernyms.get(word))
-        temporary_dict_hypernyms[word].extend(deduplicated_values)
-    else:
-        temporary_dict_hypernyms[word] = values
+    _merge_values(temporary_dict_hypernyms, word, values)
 
 
 ##################################################################################
@@ -207,11 +413,11 @@ def cache_hyponyms(word: str) -> Tuple[bool, Optional[List[str]]]:
     :rtype: Tuple[bool, Optional[List[str]]]
     """
     try:
-        values = temporary_dict_hyponyms[word]
+        values = _unpack(temporary_dict_hyponyms[word])
     except KeyError:
         return False, None
     else:
-        return True, sorted(set(values))
+        return True, list(values)
 
 def insert_word_cache_hyponyms(word: str, values: List[str]) -> None:
     """
@@ -223,8 +429,230 @@ def insert_word_cache_hyponyms(word: str, values: List[str]) -> None:
     :type values: List[str]
     :return: None
     """
-    if word in temporary_dict_hyponyms:
-        deduplicated_values = set(values) - set(temporary_dict_hyponyms.get(word))
-        temporary_dict_hyponyms[word].extend(deduplicated_values)
+    _merge_values(temporary_dict_hyponyms, word, values)
+
+
+##################################################################################
+# memoized query output
+#
+# The output returned for a cached word is built once per output format and kept
+# next to the cache entry it was built from. Cache merges replace the stored entry
+# instead of modifying it, so a memoized output is only reused while the entry it
+# was built from is still the stored one, and becomes stale on the next merge.
+# The memo is keyed by the normalized word and keeps the output of the last display
+# form of the word for every output format. The least recently used words are
+# evicted when the memo holds more than OUTPUT_MEMO_SIZE words.
+##################################################################################
+OUTPUT_MEMO_SIZE = 4096
+_output_memo: 'OrderedDict[Tuple[str, str], Tuple[Any, Dict[str, Tuple[str, Any]]]]' = OrderedDict()
+_output_memo_lock = threading.Lock()
+
+def _detached(output: Any) -> Any:
+    """
+    Returns a copy of a memoized output, which the caller can modify without changing the memoized output.
+    """
+    if isinstance(output, list):
+        return list(output)
+    if isinstance(output, dict):
+        return {key: _detached(value) for key, value in output.items()}
+    return output
+
+def clear_output_memo() -> None:
+    """
+    Removes all the memoized query outputs.
+
+    :return: None
+    """
+    with _output_memo_lock:
+        _output_memo.clear()
+
+def cached_output(relation: str,
+                  word: str,
+                  output_format: str,
+                  build_output: Callable[[Any], Any],
+                  display_word: Optional[str] = None) -> Tuple[bool, Any]:
+    """
+    Returns the query output for a cached word, building it only when the cache entry
+    has changed since the output was last built for the output format and display word.
+
+    :param relation: antonyms, synonyms, definitions, hypernyms or hyponyms
+    :type relation: str
+    :param word: The cached word.
+    :type word: str
+    :param output_format: The output format of the query output.
+    :type output_format: str
+    :param build_output: Builds the query output from the cached values of the word.
+    :type build_output: Callable[[Any], Any]
+    :param display_word: The form of the word shown in the output. Defaults to the cached word.
+    :type display_word: Optional[str]
+    :return: A tuple indicating success (True if the word is cached, False otherwise) and the query output.
+    :rtype: Tuple[bool, Any]
+    """
+    entry = _RELATION_CACHES[relation].get(word)
+    metrics.record_cache_lookup(relation, hit=entry is not None)
+    if entry is None:
+        return False, None
+    memo_key = (relation, word)
+    display_word = display_word or word
+    with _output_memo_lock:
+        memo = _output_memo.get(memo_key)
+        if memo is not None:
+            _output_memo.move_to_end(memo_key)
+    if memo is None or memo[0] is not entry:
+        memo = (entry, {})
+    memoized_output = memo[1].get(output_format)
+    if memoized_output is None or memoized_output[0] != display_word:
+        if isinstance(entry, dict):
+            cached_values = _unpack_entry(entry)
+        else:
+            cached_values = list(_unpack(entry))
+        memoized_output = (display_word, build_output(cached_values))
+        memo = (entry, {**memo[1], output_format: memoized_output})
+        with _output_memo_lock:
+            _output_memo[memo_key] = memo
+            _output_memo.move_to_end(memo_key)
+            while len(_output_memo) > OUTPUT_MEMO_SIZE:
+                _output_memo.popitem(last=False)
+    return True, _detached(memoized_output[1])
+
+
+##################################################################################
+# cache export and import
+#
+# The caches can be written to a portable file and loaded back into another
+# process. Two file formats are supported:
+#
+# - jsonl: one JSON object per cached entry
+# - sqlite: one table row per cached entry, with the values stored as a
+#           compressed blob (see compress_values)
+##################################################################################
+_RELATION_CACHES = {'antonyms': temporary_dict_antonyms,
+                    'synonyms': temporary_dict_synonyms,
+                    'definitions': temporary_dict_definition,
+                    'hypernyms': temporary_dict_hypernyms,
+                    'hyponyms': temporary_dict_hyponyms}
+
+_FILE_FORMATS = {'.jsonl': 'jsonl', '.json': 'jsonl', '.db': 'sqlite', '.sqlite': 'sqlite', '.sqlite3': 'sqlite'}
+
+def _resolve_file_format(file_path: str, file_format: Optional[str]) -> str:
+    """
+    Determines the file format from the requested format or the file extension.
+
+    :raises ValueError: When the file format is not supported.
+    """
+    if file_format is None:
+        file_format = _FILE_FORMATS.get(os.path.splitext(file_path)[1].lower())
+    if file_format not in {'jsonl', 'sqlite'}:
+        raise ValueError(f'The cache file format for {file_path} is not supported. '
+                         f'Acceptable formats: jsonl or sqlite.')
+    return file_format
+
+def _iterate_cache_entries() -> Iterator[Tuple[str, str, Optional[str], List[str]]]:
+    """
+    Yields every cached entry as a (relation, word, part_of_speech, values) tuple.
+    """
+    for relation, cache in _RELATION_CACHES.items():
+        for word, entry in list(cache.items()):
+            if isinstance(entry, dict):
+                for pos_category, values in list(entry.items()):
+                    yield relation, word, pos_category, list(_unpack(values))
+            else:
+                yield relation, word, None, list(_unpack(entry))
+
+def merge_word_cache(relation: str, word: str, values: Iterable[str], pos_category: Optional[str] = None) -> None:
+    """
+    Atomically merges values into the cache of a relation. Values that are already cached
+    for the word are not duplicated.
+
+    :param relation: antonyms, synonyms, definitions, hypernyms or hyponyms
+    :type relation: str
+    :param word: The word to insert or update the cache for.
+    :type word: str
+    :param values: The values to merge.
+    :type values: Iterable[str]
+    :param pos_category: The part-of-speech category of the values. Not used for hypernyms and hyponyms.
+    :type pos_category: Optional[str]
+    :return: None
+    :raises ValueError: When the relation is unknown.
+    """
+    cache = _RELATION_CACHES.get(relation)
+    if cache is None:
+        raise ValueError(f'Unknown relation: {relation}')
+    if relation in {'hypernyms', 'hyponyms'}:
+        _merge_values(cache, word, values)
     else:
-        temporary_dict_hyponyms[word] = values
+        _merge_pos_values(cache, word, pos_category, values)
+
+def export_cache(file_path: str, file_format: Optional[str] = None) -> int:
+    """
+    Writes the contents of all the relation caches to a portable file.
+
+    :param file_path: The path of the file to write.
+    :type file_path: str
+    :param file_format: 'jsonl' or 'sqlite'. Defaults to the format implied by the file extension.
+    :type file_format: Optional[str]
+    :return: The number of exported entries.
+    :rtype: int
+    """
+    file_format = _resolve_file_format(file_path, file_format)
+    number_of_entries = 0
+    if file_format == 'jsonl':
+        with open(file=file_path, mode='w', encoding='utf-8') as outfile:
+            for relation, word, pos_category, values in _iterate_cache_entries():
+                outfile.write(json.dumps({'relation': relation,
+                                          'word': word,
+                                          'part_of_speech': pos_category,
+                                          'values': values}, ensure_ascii=False))
+                outfile.write('\n')
+                number_of_entries += 1
+    elif file_format == 'sqlite':
+        connection = sqlite3.connect(file_path)
+        try:
+            with connection:
+                connection.execute('CREATE TABLE IF NOT EXISTS cache_entries ('
+                                   'relation TEXT NOT NULL, '
+                                   'word TEXT NOT NULL, '
+                                   'part_of_speech TEXT NOT NULL, '
+                                   'word_values BLOB NOT NULL, '
+                                   'PRIMARY KEY (relation, word, part_of_speech))')
+                for relation, word, pos_category, values in _iterate_cache_entries():
+                    # NULL is not unique in a primary key, so entries without a
+                    # part of speech category are stored with an empty string
+                    connection.execute('INSERT OR REPLACE INTO cache_entries VALUES (?, ?, ?, ?)',
+                                       (relation, word, pos_category or '', compress_values(values)))
+                    number_of_entries += 1
+        finally:
+            connection.close()
+    return number_of_entries
+
+def import_cache(file_path: str, file_format: Optional[str] = None) -> int:
+    """
+    Loads a file written by export_cache and merges its entries into the relation caches.
+
+    :param file_path: The path of the file to read.
+    :type file_path: str
+    :param file_format: 'jsonl' or 'sqlite'. Defaults to the format implied by the file extension.
+    :type file_format: Optional[str]
+    :return: The number of imported entries.
+    :rtype: int
+    """
+    file_format = _resolve_file_format(file_path, file_format)
+    number_of_entries = 0
+    if file_format == 'jsonl':
+        with open(file=file_path, mode='r', encoding='utf-8') as infile:
+            for line in infile:
+                if not line.strip():
+                    continue
+                entry = json.loads(line)
+                merge_word_cache(entry['relation'], entry['word'], entry['values'], entry.get('part_of_speech'))
+                number_of_entries += 1
+    elif file_format == 'sqlite':
+        connection = sqlite3.connect(file_path)
+        try:
+            rows = connection.execute('SELECT relation, word, part_of_speech, word_values FROM cache_entries')
+            for relation, word, pos_category, blob in rows:
+                merge_word_cache(relation, word, decompress_values(blob), pos_category)
+                number_of_entries += 1
+        finally:
+            connection.close()
+    return number_of_entries
@@ -26,7 +26,16 @@ __copyright__ = "Copyright (C) 2020 John Bumgarner"
 # Date Revised: March 04, 2023
 # Revised by: John Bumgarner
 ##################################################################################
-from typing import List, Union
+import unicodedata
+from typing import List, Optional, Union
+
+# Simple plural and third-person inflections and their replacements, in the order they are tried
+_INFLECTION_SUFFIXES = (('sses', 'ss'), ('shes', 'sh'), ('ches', 'ch'), ('xes', 'x'), ('zes', 'z'),
+                        ('ies', 'y'), ('s', ''))
+
+# Word endings and words that look like inflections, but usually are not
+_UNINFLECTED_ENDINGS = ('ss', 'us', 'is', 'ous', 'ics', 'ws')
+_UNINFLECTED_WORDS = frozenset({'series', 'species', 'lens', 'gas', 'yes', 'this', 'has', 'was', 'does', 'goes'})
 
 def normalize_space(list_of_words: List) -> List:
     """
@@ -62,3 +71,41 @@ def flatten_multidimensional_list(list_of_lists: Union[List[str], List[List[str]
         return flattened_list
     else:
         return list_of_lists
+
+def remove_simple_inflection(word: str) -> str:
+    """
+    This function removes a simple plural or third-person inflection from
+    the last word of a string, such as "boxes" -> "box" or "stories" -> "story".
+    Irregular forms are returned unchanged.
+
+    :param word: word or multi-word term
+    :return: str
+    """
+    *leading_words, last_word = word.split(' ')
+    if last_word in _UNINFLECTED_WORDS or last_word.endswith(_UNINFLECTED_ENDINGS):
+        return word
+    for suffix, replacement in _INFLECTION_SUFFIXES:
+        if last_word.endswith(suffix):
+            stem = last_word[:-len(suffix)] + replacement
+            if len(stem) >= 3:
+                last_word = stem
+            break
+    return ' '.join([*leading_words, last_word])
+
+def normalize_search_string(search_string: str, unicode_form: Optional[str] = None, lemmatize: bool = False) -> str:
+    """
+    This function normalizes a search string, so that different spellings of the same
+    query, such as "Good", "good " and "good", have the same form.
+
+    :param search_string: the string to normalize
+    :param unicode_form: optional Unicode normalization form: NFC, NFD, NFKC or NFKD
+    :param lemmatize: remove simple inflections from the last word of the string
+    :return: str
+    """
+    normalized_string = search_string
+    if unicode_form is not None:
+        normalized_string = unicodedata.normalize(unicode_form, normalized_string)
+    normalized_string = remove_excess_whitespace(normalized_string.casefold())
+    if lemmatize and normalized_string:
+        normalized_string = remove_simple_inflection(normalized_string)
+    return normalized_string
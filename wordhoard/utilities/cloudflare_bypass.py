@@ -24,7 +24,7 @@ __copyright__ = 'Copyright (C) 2023 John Bumgarner'
 # Date Completed: February 25, 2023
 # Author: John Bumgarner
 #
-# Date Revised: May 04, 2024
+# Date Revised: October 19, 2026
 # Revised by: John Bumgarner
 ##################################################################################
 
@@ -32,68 +32,173 @@ __copyright__ = 'Copyright (C) 2023 John Bumgarner'
 # Python imports required for basic operations
 ##################################################################################
 # Standard library imports
+import time
+import random
 import logging
+import threading
+import traceback
 from time import sleep
-from typing import Union
-from random import randint
+from urllib.parse import urlparse
+from typing import Dict, Tuple, Union
 
 # Third-party imports
+import requests
 import cloudscraper
 from bs4 import BeautifulSoup
 from cloudscraper.exceptions import CloudflareChallengeError
 
+# Local or project-specific imports
+from wordhoard.utilities import metrics, request_policy, tracing, transport
+
 logger = logging.getLogger(__name__)
 
-SCRAPE_COUNT = 0
+# The name of the cookie that holds the Cloudflare clearance of a session
+CLEARANCE_COOKIE = 'cf_clearance'
+
+# The status codes of a response that was blocked by Cloudflare
+_BLOCKED_STATUS_CODES = {403, 502, 520, 521}
+
+##################################################################################
+# module level pool of cloudscraper sessions, one session per host
+##################################################################################
+_max_attempts = 3
+_backoff_factor = 2.0
+_max_backoff = 10.0
+_session_ttl = 1800.0
+_pool_lock = threading.Lock()
+_session_pool: Dict[str, Tuple[cloudscraper.CloudScraper, float]] = {}
+
+def configure_cloudflare_bypass(max_attempts: int = 3,
+                                backoff_factor: float = 2.0,
+                                max_backoff: float = 10.0,
+                                session_ttl: float = 1800.0) -> None:
+    """
+    Configures the retries of the Cloudflare bypass and the lifetime of the pooled sessions.
+
+    :param max_attempts: The number of requests made for a protected URL.
+    :type max_attempts: int
+    :param backoff_factor: The base of the exponential backoff between the attempts in seconds.
+    :type backoff_factor: float
+    :param max_backoff: The longest backoff between two attempts in seconds.
+    :type max_backoff: float
+    :param session_ttl: The seconds a session is reused when its clearance cookie has no expiry date.
+    :type session_ttl: float
+    :return: None
+    :raises ValueError: When a value is not positive or the backoff factor is negative.
+    """
+    global _max_attempts, _backoff_factor, _max_backoff, _session_ttl
+    if max_attempts < 1 or backoff_factor < 0 or max_backoff < 0 or session_ttl <= 0:
+        raise ValueError('The attempts and the session lifetime must be positive and the backoffs must not be negative.')
+    _max_attempts = max_attempts
+    _backoff_factor = backoff_factor
+    _max_backoff = max_backoff
+    _session_ttl = session_ttl
+
+def _clearance_expired(scraper: cloudscraper.CloudScraper, created_at: float, now: float) -> bool:
+    for cookie in scraper.cookies:
+        if cookie.name == CLEARANCE_COOKIE and cookie.expires is not None:
+            return cookie.expires <= time.time()
+    return now - created_at >= _session_ttl
+
+def _pooled_scraper(host: str) -> cloudscraper.CloudScraper:
+    """
+    Returns the pooled session of a host. A new session is created when the host has no session
+    or when the clearance of its session has expired.
+    """
+    now = time.monotonic()
+    with _pool_lock:
+        pooled = _session_pool.get(host)
+        if pooled is not None and not _clearance_expired(pooled[0], pooled[1], now):
+            return pooled[0]
+        if pooled is not None:
+            logger.info(f'The Cloudflare clearance of the session for {host} has expired.')
+            pooled[0].close()
+        scraper = cloudscraper.create_scraper(delay=20, browser={'browser': 'chrome',
+                                                                 'platform': 'ios',
+                                                                 'mobile': True})
+        _session_pool[host] = (scraper, now)
+        return scraper
+
+def _discard_scraper(host: str, scraper: cloudscraper.CloudScraper) -> None:
+    with _pool_lock:
+        pooled = _session_pool.get(host)
+        if pooled is not None and pooled[0] is scraper:
+            del _session_pool[host]
+    scraper.close()
+
+def clear_session_pool() -> None:
+    """
+    Closes all the pooled cloudscraper sessions, which discards their Cloudflare clearances.
+
+    :return: None
+    """
+    with _pool_lock:
+        pooled_sessions = list(_session_pool.values())
+        _session_pool.clear()
+    for scraper, _ in pooled_sessions:
+        scraper.close()
+
 
 class Cloudflare:
     """
     This Class is used to bypass the Cloudflare's DDoS mitigation protection for a specific website.
+    The cloudscraper sessions are pooled by host, so the clearance of a solved challenge is reused
+    by the following requests to the same host until it expires.
     """
     def __init__(self, url):
         self._url: str = url
+        self._host: str = urlparse(url).netloc
 
+    def _backoff(self, attempt: int) -> None:
+        # full jitter exponential backoff, bounded by the maximum backoff
+        sleep(random.uniform(0, min(_max_backoff, _backoff_factor * 2 ** attempt)))
+
+    @tracing.traced()
     def bypass(self) -> Union[BeautifulSoup, None]:
         """
         This function attempts to bypass the Cloudflare's DDoS mitigation protection for a specific website.
+        A blocked request is retried with a new session, up to the configured number of attempts.
+        No bypass is attempted in the replay transport mode, because the cloudscraper requests
+        are not archived and replaying must not access the network.
 
         :return: BeautifulSoup object
         """
-        global SCRAPE_COUNT
-        SCRAPE_COUNT += 1
-        scraper = cloudscraper.create_scraper(delay=20, browser={'browser': 'chrome',
-                                                                 'platform': 'ios',
-                                                                 'mobile': True})
-        response = scraper.get(self._url)
-        if response.status_code == 403:
-            if SCRAPE_COUNT != 10:
+        if transport.replay_enabled():
+            logger.info(f'The Cloudflare bypass for {self._url} was skipped in the replay transport mode.')
+            return None
+        for attempt in range(_max_attempts):
+            scraper = _pooled_scraper(self._host)
+            request_started = time.perf_counter()
+            try:
+                response = scraper.get(self._url, timeout=request_policy.request_timeout(self._url))
+            except (CloudflareChallengeError, requests.RequestException) as error:
+                logger.error(f'The Cloudflare bypass for {self._url} failed on attempt {attempt + 1}.')
+                logger.error(''.join(traceback.format_tb(error.__traceback__)))
+                _discard_scraper(self._host, scraper)
+                if attempt < _max_attempts - 1:
+                    self._backoff(attempt)
+                continue
+            metrics.record_request(self._url, time.perf_counter() - request_started,
+                                   len(response.content), response.status_code)
+            if response.status_code in _BLOCKED_STATUS_CODES:
+                logger.info('-' * 80)
                 logger.info("The requested URL is protected by Cloudflare's DDoS mitigation service.")
                 logger.info(f'Requested URL: {self._url}')
                 logger.info(f'Status Code: {response.status_code}')
-                sleep(randint(1, 10))
-                Cloudflare(self._url).bypass()
-            else:
-                return None
-        elif response.status_code in (502, 520, 521):
-            logger.info('-' * 80)
-            logger.info('Cloudflare DDoS mitigation service protection bypass started.')
-            logger.info(f'Requested URL: {self._url}')
-            logger.info(f'Status Code: {response.status_code}')
-            logger.info('-' * 80)
-            scraper.close()
-            sleep(randint(1, 10))
-            Cloudflare(self._url).bypass()
-        elif response.status_code == 200:
-            try:
+                logger.info('-' * 80)
+                # the clearance of the session was refused, so the next attempt solves the challenge again
+                _discard_scraper(self._host, scraper)
+                if attempt < _max_attempts - 1:
+                    self._backoff(attempt)
+            elif response.status_code == 200:
                 logger.info('-' * 80)
                 logger.info('Cloudflare DDoS mitigation service protection bypass successful.')
                 logger.info(f'Requested URL: {self._url}')
                 logger.info('-' * 80)
-                soup = BeautifulSoup(response.content, 'lxml')
-                if isinstance(soup, BeautifulSoup):
-                    scraper.close()
-                    return soup
-                elif not isinstance(soup, BeautifulSoup):
-                    return None
-            except CloudflareChallengeError:
-                pass
+                soup = tracing.make_soup(markup=response.content, features='lxml')
+                return soup if isinstance(soup, BeautifulSoup) else None
+            else:
+                logger.info(f'The Cloudflare bypass for {self._url} returned the status code {response.status_code}.')
+                return None
+        logger.info(f'The Cloudflare bypass for {self._url} failed after {_max_attempts} attempts.')
+        return None
@@ -3,10 +3,13 @@
 """
 This Python script is used to verify that the webpage being queried is
 either protected or not protected by Cloudflare's DDoS mitigation services.
+
+The CloudflareVerification class is deprecated. WordHoard classifies the responses
+of the online repositories with wordhoard.utilities.protection_detector.
 """
 __author__ = 'John Bumgarner'
 __date__ = 'January 07, 2022'
-__status__ = 'Production'
+__status__ = 'Deprecated'
 __license__ = 'MIT'
 __copyright__ = 'Copyright (C) 2022 John Bumgarner'
 
@@ -24,22 +27,31 @@ __copyright__ = 'Copyright (C) 2022 John Bumgarner'
 # Date Completed: January 08, 2022
 # Author: John Bumgarner
 #
-# Date Revised: May 25, 2024
+# Date Revised: October 19, 2026
 # Revised by: John Bumgarner
 ##################################################################################
 
 ##################################################################################
 # Python imports required for basic operations
 ##################################################################################
+# Standard library imports
+import warnings
+
+# Third-party imports
 from bs4 import BeautifulSoup
 
 class CloudflareVerification:
     """
     This Class is used to query a webpage to determine if it is protected by
     Cloudflare's DDoS mitigation services.
+
+    Deprecated: use wordhoard.utilities.protection_detector.detect_protection instead.
     """
 
     def __init__(self, url, soup):
+        warnings.warn('CloudflareVerification is deprecated, use '
+                      'wordhoard.utilities.protection_detector.detect_protection instead.',
+                      DeprecationWarning, stacklevel=2)
         self._url: str = url
         self._raw_soup: BeautifulSoup = soup
 
@@ -32,13 +32,11 @@ __copyright__ = "Copyright (C) 2021 John Bumgarner"
 # Python imports required for basic operations
 ##################################################################################
 # Standard library imports
-import ast
 import logging
 import traceback
-from typing import Union
+from typing import Dict, List, Optional, Union
 
 # Third-party imports
-import deepl
 from backoff import on_exception, expo
 from ratelimit import limits, RateLimitException
 from deepl.exceptions import AuthorizationException
@@ -46,12 +44,16 @@ from deepl.exceptions import QuotaExceededException
 from deepl.exceptions import TooManyRequestsException
 
 # Local or project-specific imports
+from wordhoard.utilities import async_translation, translation_batches, translation_cache, translation_clients
 from wordhoard.utilities.colorized_text import colorized_text
-from wordhoard.utilities.translator_languages import Languages
-from wordhoard.utilities.exceptions import LanguageNotSupportedException
+from wordhoard.utilities.translator_languages import language_index
 
 logger = logging.getLogger(__name__)
 
+# The DeepL API accepts at most 50 texts and a request body of 128 KiB per request
+DEEP_BATCH_MAX_TEXTS = 50
+DEEP_BATCH_MAX_BYTES = 120 * 1024
+
 
 class Translator:
     """
@@ -78,8 +80,16 @@ class Translator:
             _handle_custom_exceptions: Handles custom exceptions specific to DeepL translation service.
             _deep_translate: Translates text from the source language to American English using DeepL service.
             _deep_translate_reverse: Translates text from American English to the source language using DeepL service.
-            translate_word: Translates text from the source language to American English, handling unsupported languages.
+            _deep_translate_batch: Translates a list of words from the source language to American English.
+            _deep_translate_reverse_batch: Translates a list of words from American English to the source language.
+            translate_word: Translates text from the source language to American English, using the translation cache.
             reverse_translate: Translates text from American English to the source language.
+            translate_many: Translates many words from the source language to American English in batched requests.
+            reverse_translate_many: Translates many words from American English to the source language in batched requests.
+            atranslate_word: The asynchronous variant of translate_word.
+            areverse_translate: The asynchronous variant of reverse_translate.
+            atranslate_many: The asynchronous variant of translate_many, which translates the batches concurrently.
+            areverse_translate_many: The asynchronous variant of reverse_translate_many.
 
         Note:
             This class relies on the `deepl` module for translation functionality. Ensure that the module is installed
@@ -107,8 +117,10 @@ class Translator:
                                on_backoff=self._backoff_handler)
         # Establishes a rate limit for making requests to the Deep translation service
         limiter = limits(calls=max_number_of_requests, period=rate_limit_timeout_period)
-        self.translate_word = handler(limiter(self.translate_word))
-        self.reverse_translate = handler(limiter(self.reverse_translate))
+        self._deep_translate = handler(limiter(self._deep_translate))
+        self._deep_translate_reverse = handler(limiter(self._deep_translate_reverse))
+        self._deep_translate_batch = handler(limiter(self._deep_translate_batch))
+        self._deep_translate_reverse_batch = handler(limiter(self._deep_translate_reverse_batch))
 
     def _backoff_handler(self, details) -> None:
         """
@@ -146,29 +158,21 @@ class Translator:
             colorized_text(text=f"Backing off {details['wait']:.1f} seconds afters {details['tries']} tries.",
                            color='blue')
 
-    def _deep_supported_languages(self) -> Union[str, None]:
+    def _deep_supported_languages(self, language: Optional[str] = None) -> Union[str, None]:
         """
         This function determines if the requested source language is
         one of the supported languages for the Deep translation service.
 
-        :return: language
+        :param language: language to check instead of the source language
+        :return: language code
         :rtype: string
         """
-        languages = Languages()
-        deep_languages = languages.deep_supported_languages()
-        deep_languages_str = str(deep_languages)
-        supported_languages = ast.literal_eval(deep_languages_str)
-        try:
-            if self._source_language in supported_languages.keys():
-                return self._source_language
-            elif self._source_language in supported_languages.values():
-                return self._source_language
-            else:
-                return None
-        except LanguageNotSupportedException as error:
+        language = self._source_language if language is None else language
+        supported_language = language_index('deepl').resolve(language)
+        if supported_language is None:
             logger.info('The language provided is not one of the supported languages for the Deep Translation service.')
-            logger.info(f'Requested language: {self._source_language}')
-            logger.error(''.join(traceback.format_tb(error.__traceback__)))
+            logger.info(f'Requested language: {language}')
+        return supported_language
 
     def _handle_standard_exceptions(self, error):
         """
@@ -226,7 +230,7 @@ class Translator:
         :rtype: string
         """
         try:
-            translator = deepl.Translator(auth_key=self._api_key)
+            translator = translation_clients.deepl_client(self._api_key)
             result = translator.translate_text(self._str_to_translate,
                                                target_lang='EN-US',
                                                source_lang=original_language)
@@ -238,17 +242,18 @@ class Translator:
         except (TypeError, ValueError) as error:
             self._handle_standard_exceptions(error)
 
-    def _deep_translate_reverse(self) -> str:
+    def _deep_translate_reverse(self, language: Optional[str] = None) -> str:
         """
-        This function is used to translate a word from it source language, such as Spanish into American English.
+        This function is used to translate a word from American English into another language, such as Spanish.
 
+        :param language: language to translate into instead of the source language
         :return: translated word
         :rtype: string
         """
         try:
-            translator = deepl.Translator(auth_key=self._api_key)
+            translator = translation_clients.deepl_client(self._api_key)
             result = translator.translate_text(text=self._str_to_translate,
-                                               target_lang=self._source_language,
+                                               target_lang=self._source_language if language is None else language,
                                                source_lang='EN')
             translated_text = result.text
             return translated_text
@@ -258,6 +263,65 @@ class Translator:
         except (TypeError, ValueError) as error:
             self._handle_standard_exceptions(error)
 
+    def _deep_translate_batch(self, original_language: str, texts: List[str]) -> List[Optional[str]]:
+        """
+        This function is used to translate a list of words from their source language, such as Spanish
+        into American English, with a single request.
+
+        :param original_language: language to translated from
+        :param texts: words to translate
+        :return: translated words
+        :rtype: list
+        """
+        try:
+            translator = translation_clients.deepl_client(self._api_key)
+            results = translator.translate_text(texts,
+                                                target_lang='EN-US',
+                                                source_lang=original_language)
+            return [result.text for result in results]
+        except (AuthorizationException, QuotaExceededException, TooManyRequestsException) as error:
+            self._handle_custom_exceptions(error)
+        except (TypeError, ValueError) as error:
+            self._handle_standard_exceptions(error)
+        return [None] * len(texts)
+
+    def _deep_translate_reverse_batch(self, language: str, texts: List[str]) -> List[Optional[str]]:
+        """
+        This function is used to translate a list of words from American English into another language,
+        such as Spanish, with a single request.
+
+        :param language: language to translate into
+        :param texts: words to translate
+        :return: translated words
+        :rtype: list
+        """
+        try:
+            translator = translation_clients.deepl_client(self._api_key)
+            results = translator.translate_text(texts,
+                                                target_lang=language,
+                                                source_lang='EN')
+            return [result.text for result in results]
+        except (AuthorizationException, QuotaExceededException, TooManyRequestsException) as error:
+            self._handle_custom_exceptions(error)
+        except (TypeError, ValueError) as error:
+            self._handle_standard_exceptions(error)
+        return [None] * len(texts)
+
+    @staticmethod
+    def _report_unsupported_language(language: str) -> None:
+        """
+        Informs the user that the requested language is not supported by the Deep Translation service.
+
+        :param language: requested language
+        :return: None
+        """
+        colorized_text(text='The language provided is not one of the supported languages for the Deep Translation service.',
+                       color='red')
+        colorized_text(text=f'Requested language: {language}', color='red')
+        colorized_text(text='Please review the languages supported by the Deep Translate service\n'
+                       'https://wordhoard.readthedocs.io/en/latest/translations'
+                       '/deepl_supported_translation_languages/', color='green')
+
     def translate_word(self) -> Union[str, None]:
         """
         This function is used to translate a word from it source language, such as Spanish into American English.
@@ -267,21 +331,128 @@ class Translator:
         """
         supported_language = self._deep_supported_languages()
         if supported_language:
-            return self._deep_translate(supported_language)
+            translation = translation_cache.cached_translation('deepl', supported_language, 'en-us',
+                                                               self._str_to_translate)
+            if translation is None:
+                translation = translation_cache.cache_translation('deepl', supported_language, 'en-us',
+                                                                  self._str_to_translate,
+                                                                  self._deep_translate(supported_language))
+            return translation
         elif not supported_language:
-            colorized_text(text='The language provided is not one of the supported languages for the Deep Translation service.',
-                           color='red')
-            colorized_text(text=f'Requested language: {self._source_language}', color='red')
-            colorized_text(text='Please review the languages supported by the Deep Translate service\n'
-                           'https://wordhoard.readthedocs.io/en/latest/translations'
-                           '/deepl_supported_translation_languages/', color='green')
+            self._report_unsupported_language(self._source_language)
             return None
 
-    def reverse_translate(self) -> str:
+    def reverse_translate(self) -> Union[str, None]:
         """
         This function is used to translate a word from American English into another language, such as Spanish.
 
+        :return: translated word
+        :rtype: string or None
+        """
+        supported_language = self._deep_supported_languages()
+        if not supported_language:
+            self._report_unsupported_language(self._source_language)
+            return None
+        translation = translation_cache.cached_translation('deepl', 'en-us', supported_language, self._str_to_translate)
+        if translation is None:
+            translation = translation_cache.cache_translation('deepl', 'en-us', supported_language, self._str_to_translate,
+                                                              self._deep_translate_reverse(language=supported_language))
+        return translation
+
+    def translate_many(self, words: List[str], source_language: Optional[str] = None) -> Dict[str, Optional[str]]:
+        """
+        This function is used to translate many words from their source language, such as Spanish
+        into American English, with as few requests as the limits of the Deep translation service allow.
+
+        :param words: words to translate
+        :param source_language: language to translated from instead of the source language of the translator
+        :return: translated word or None by word
+        :rtype: dict
+        """
+        supported_language = self._deep_supported_languages(source_language)
+        if not supported_language:
+            self._report_unsupported_language(self._source_language if source_language is None else source_language)
+            return {word: None for word in words}
+        return translation_batches.translate_many('deepl', supported_language, 'en-us', words,
+                                                  lambda texts: self._deep_translate_batch(supported_language, texts),
+                                                  max_texts=DEEP_BATCH_MAX_TEXTS,
+                                                  max_bytes=DEEP_BATCH_MAX_BYTES)
+
+    def reverse_translate_many(self, words: List[str], source_language: Optional[str] = None) -> Dict[str, Optional[str]]:
+        """
+        This function is used to translate many words from American English into another language,
+        such as Spanish, with as few requests as the limits of the Deep translation service allow.
+
+        :param words: words to translate
+        :param source_language: language to translate into instead of the source language of the translator
+        :return: translated word or None by word
+        :rtype: dict
+        """
+        supported_language = self._deep_supported_languages(source_language)
+        if not supported_language:
+            self._report_unsupported_language(self._source_language if source_language is None else source_language)
+            return {word: None for word in words}
+        return translation_batches.translate_many('deepl', 'en-us', supported_language, words,
+                                                  lambda texts: self._deep_translate_reverse_batch(supported_language,
+                                                                                                   texts),
+                                                  max_texts=DEEP_BATCH_MAX_TEXTS,
+                                                  max_bytes=DEEP_BATCH_MAX_BYTES)
+
+    async def atranslate_word(self) -> Union[str, None]:
+        """
+        The asynchronous variant of translate_word. The translation request is made in the
+        translation thread pool, with the same rate limit as translate_word.
+
+        :return: translated word
+        :rtype: string
+        """
+        return await async_translation.run_translation(self.translate_word)
+
+    async def areverse_translate(self) -> Union[str, None]:
+        """
+        The asynchronous variant of reverse_translate. The translation request is made in the
+        translation thread pool, with the same rate limit as reverse_translate.
+
         :return: translated word
         :rtype: string
         """
-        return self._deep_translate_reverse()
+        return await async_translation.run_translation(self.reverse_translate)
+
+    async def atranslate_many(self, words: List[str], source_language: Optional[str] = None) -> Dict[str, Optional[str]]:
+        """
+        The asynchronous variant of translate_many. The batches are translated concurrently in the
+        translation thread pool, with the same rate limit as translate_many.
+
+        :param words: words to translate
+        :param source_language: language to translated from instead of the source language of the translator
+        :return: translated word or None by word
+        :rtype: dict
+        """
+        supported_language = self._deep_supported_languages(source_language)
+        if not supported_language:
+            self._report_unsupported_language(self._source_language if source_language is None else source_language)
+            return {word: None for word in words}
+        return await translation_batches.atranslate_many('deepl', supported_language, 'en-us', words,
+                                                         lambda texts: self._deep_translate_batch(supported_language, texts),
+                                                         max_texts=DEEP_BATCH_MAX_TEXTS,
+                                                         max_bytes=DEEP_BATCH_MAX_BYTES)
+
+    async def areverse_translate_many(self, words: List[str], source_language: Optional[str] = None) -> Dict[str, Optional[str]]:
+        """
+        The asynchronous variant of reverse_translate_many. The batches are translated concurrently in the
+        translation thread pool, with the same rate limit as reverse_translate_many.
+
+        :param words: words to translate
+        :param source_language: language to translate into instead of the source language of the translator
+        :return: translated word or None by word
+        :rtype: dict
+        """
+        supported_language = self._deep_supported_languages(source_language)
+        if not supported_language:
+            self._report_unsupported_language(self._source_language if source_language is None else source_language)
+            return {word: None for word in words}
+        return await translation_batches.atranslate_many('deepl', 'en-us', supported_language, words,
+                                                         lambda texts: self._deep_translate_reverse_batch(supported_language,
+                                                                                                          texts),
+                                                         max_texts=DEEP_BATCH_MAX_TEXTS,
+                                                         max_bytes=DEEP_BATCH_MAX_BYTES)
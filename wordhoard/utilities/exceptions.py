@@ -1,7 +1,7 @@
 #!/usr/bin/env python3
 
 """
-This Python script provides various Exceptions Classes, which are used in the WordHoard Translation modules.
+This Python script provides various Exceptions Classes, which are used in the WordHoard modules.
 """
 __author__ = 'John Bumgarner'
 __date__ = 'February 04, 2023'
@@ -67,3 +67,21 @@ class RequestException(Exception):
     This exception is thrown when an ambiguous exception occurs during a connection to the Translator service
     being used.
     """
+
+class InvalidOutputFormatException(Exception):
+    """
+    This exception is thrown when the output format provided to a WordHoard class is not one of the
+    acceptable formats: dictionary, list or json.
+    """
+
+class QueryRequestException(Exception):
+    """
+    This exception is thrown when an HTTP request to an online repository fails, because of a connection
+    error, a timeout, a proxy error or after the maximum number of retries was exceeded. The relation classes
+    treat the repository as a source without results and continue with the other repositories.
+    """
+
+class PickleFileException(Exception):
+    """
+    This exception is thrown when a pickle file included with WordHoard cannot be found or opened.
+    """
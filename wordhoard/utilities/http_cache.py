@@ -0,0 +1,291 @@
+#!/usr/bin/env python3
+
+"""
+This Python module provides an HTTP response cache, which sits below the word caches.
+The cache stores the response bodies of the online repositories together with their
+ETag and Last-Modified headers, so that later queries for the same URL can be
+revalidated with a conditional request instead of downloading the page again.
+"""
+__author__ = 'John Bumgarner'
+__date__ = 'October 19, 2026'
+__status__ = 'Production'
+__license__ = 'MIT'
+__copyright__ = "Copyright (C) 2026 John Bumgarner"
+
+##################################################################################
+# “AS-IS” Clause
+#
+# Except as represented in this agreement, all work produced by Developer is
+# provided “AS IS”. Other than as provided in this agreement, Developer makes no
+# other warranties, express or implied, and hereby disclaims all implied warranties,
+# including any warranty of merchantability and warranty of fitness for a particular
+# purpose.
+##################################################################################
+
+##################################################################################
+# Date Completed: October 19, 2026
+# Author: John Bumgarner
+#
+# Date Last Revised:
+# Revised by:
+##################################################################################
+
+##################################################################################
+# Python imports required for basic operations
+##################################################################################
+# Standard library imports
+import os
+import time
+import pickle
+import hashlib
+import logging
+import threading
+import traceback
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+# Third-party imports
+import requests
+from requests.structures import CaseInsensitiveDict
+
+# Local or project-specific imports
+from wordhoard.utilities import protection_detector
+
+logger = logging.getLogger(__name__)
+
+
+class HttpCache:
+    """
+        This class stores HTTP responses and their validators in memory or in a directory.
+
+        Usage Examples
+        ----------
+        >>> http_cache = HttpCache(directory='wordhoard_http_cache')
+        >>> entry = http_cache.lookup('https://www.thesaurus.com/browse/good')
+
+        Parameters
+        ----------
+        directory : str, optional
+            The directory used to store the responses. The responses are kept in memory when no directory is provided.
+        revalidate : bool, optional
+            When True a stored response is revalidated with a conditional request before it is used.
+            When False a stored response is used without contacting the online repository, which allows
+            stored pages to be parsed again without downloading them.
+        max_entries : int, optional
+            The number of responses kept in memory when no directory is provided. The least recently
+            used responses are evicted first. Default is 1000.
+
+        Methods
+        -------
+        lookup(url: str) -> Optional[Dict[str, Any]]:
+            Returns the stored entry for a URL.
+        store(url: str, response: requests.models.Response) -> None:
+            Stores a successful response, unless it is a Cloudflare challenge or a captcha page.
+        refresh(url: str, response: requests.models.Response) -> Optional[Dict[str, Any]]:
+            Updates the validators of a stored entry after a 304 Not Modified response.
+        conditional_headers(entry: Dict[str, Any]) -> Dict[str, str]:
+            Returns the If-None-Match and If-Modified-Since headers for a stored entry.
+        build_response(entry: Dict[str, Any]) -> requests.models.Response:
+            Rebuilds a response object from a stored entry.
+        clear() -> None:
+            Removes all the stored entries.
+    """
+
+    def __init__(self, directory: Optional[str] = None, revalidate: bool = True, max_entries: int = 1000):
+        if max_entries < 1:
+            raise ValueError(f'The HTTP cache must hold at least one entry, not {max_entries}.')
+        self._directory = directory
+        self._revalidate = revalidate
+        self._max_entries = max_entries
+        self._entries: 'OrderedDict[str, Dict[str, Any]]' = OrderedDict()
+        self._lock = threading.Lock()
+        if self._directory is not None:
+            os.makedirs(self._directory, exist_ok=True)
+
+    @property
+    def revalidate(self) -> bool:
+        return self._revalidate
+
+    def _entry_path(self, url: str) -> str:
+        return os.path.join(self._directory, f'{hashlib.sha256(url.encode("utf-8")).hexdigest()}.pkl')
+
+    def lookup(self, url: str) -> Optional[Dict[str, Any]]:
+        """
+        Returns the stored entry for a URL.
+
+        :param url: the requested URL
+        :type url: str
+        :return: the stored entry or None
+        :rtype: Optional[Dict[str, Any]]
+        """
+        if self._directory is None:
+            with self._lock:
+                entry = self._entries.get(url)
+                if entry is not None:
+                    self._entries.move_to_end(url)
+                return entry
+        try:
+            with open(file=self._entry_path(url), mode='rb') as infile:
+                return pickle.load(infile)
+        except FileNotFoundError:
+            return None
+        except (OSError, pickle.UnpicklingError, EOFError) as error:
+            logger.error(f'The HTTP cache entry for {url} could not be read.')
+            logger.error(''.join(traceback.format_tb(error.__traceback__)))
+            return None
+
+    def _write(self, url: str, entry: Dict[str, Any]) -> None:
+        if self._directory is None:
+            with self._lock:
+                self._entries[url] = entry
+                self._entries.move_to_end(url)
+                while len(self._entries) > self._max_entries:
+                    self._entries.popitem(last=False)
+            return
+        entry_path = self._entry_path(url)
+        temporary_path = f'{entry_path}.{threading.get_ident()}.tmp'
+        try:
+            with open(file=temporary_path, mode='wb') as outfile:
+                pickle.dump(entry, outfile)
+            os.replace(temporary_path, entry_path)
+        except OSError as error:
+            logger.error(f'The HTTP cache entry for {url} could not be written.')
+            logger.error(''.join(traceback.format_tb(error.__traceback__)))
+
+    def store(self, url: str, response: requests.models.Response) -> None:
+        """
+        Stores a successful response. A Cloudflare challenge or a captcha page is not stored,
+        because it would be returned in place of the page until it is stored again.
+
+        :param url: the requested URL
+        :type url: str
+        :param response: the response to store
+        :type response: requests.models.Response
+        :return: None
+        """
+        protection = protection_detector.classify_response(response.status_code, response.headers, response.content)
+        if protection != protection_detector.OK:
+            logger.info(f'The {protection} page of {url} was not stored in the HTTP cache.')
+            return
+        self._write(url, {'url': response.url or url,
+                          'status_code': response.status_code,
+                          'headers': dict(response.headers),
+                          'encoding': response.encoding,
+                          'content': response.content,
+                          'stored_at': time.time()})
+
+    def refresh(self, url: str, response: requests.models.Response) -> Optional[Dict[str, Any]]:
+        """
+        Updates the validators of a stored entry after a 304 Not Modified response.
+
+        :param url: the requested URL
+        :type url: str
+        :param response: the 304 Not Modified response
+        :type response: requests.models.Response
+        :return: the updated entry or None
+        :rtype: Optional[Dict[str, Any]]
+        """
+        entry = self.lookup(url)
+        if entry is None:
+            return None
+        stored_headers = CaseInsensitiveDict(entry['headers'])
+        for header in ('ETag', 'Last-Modified'):
+            if header in response.headers:
+                stored_headers[header] = response.headers[header]
+        entry['headers'] = dict(stored_headers)
+        entry['stored_at'] = time.time()
+        self._write(url, entry)
+        return entry
+
+    @staticmethod
+    def conditional_headers(entry: Optional[Dict[str, Any]]) -> Dict[str, str]:
+        """
+        Returns the If-None-Match and If-Modified-Since headers for a stored entry.
+
+        :param entry: the stored entry
+        :type entry: Optional[Dict[str, Any]]
+        :return: conditional request headers
+        :rtype: Dict[str, str]
+        """
+        if entry is None:
+            return {}
+        stored_headers = CaseInsensitiveDict(entry['headers'])
+        headers = {}
+        if stored_headers.get('ETag'):
+            headers['If-None-Match'] = stored_headers['ETag']
+        if stored_headers.get('Last-Modified'):
+            headers['If-Modified-Since'] = stored_headers['Last-Modified']
+        return headers
+
+    @staticmethod
+    def build_response(entry: Dict[str, Any]) -> requests.models.Response:
+        """
+        Rebuilds a response object from a stored entry.
+
+        :param entry: the stored entry
+        :type entry: Dict[str, Any]
+        :return: response
+        :rtype: requests.models.Response
+        """
+        response = requests.models.Response()
+        response.url = entry['url']
+        response.status_code = entry['status_code']
+        response.headers = CaseInsensitiveDict(entry['headers'])
+        response.encoding = entry['encoding']
+        response._content = entry['content']
+        return response
+
+    def clear(self) -> None:
+        """
+        Removes all the stored entries.
+
+        :return: None
+        """
+        with self._lock:
+            self._entries.clear()
+        if self._directory is not None:
+            for file_name in os.listdir(self._directory):
+                if file_name.endswith('.pkl'):
+                    os.remove(os.path.join(self._directory, file_name))
+
+
+##################################################################################
+# module level HTTP cache used by wordhoard.utilities.request_html.Query
+##################################################################################
+_http_cache: Optional[HttpCache] = None
+
+def enable_http_cache(directory: Optional[str] = None, revalidate: bool = True, max_entries: int = 1000) -> HttpCache:
+    """
+    Enables the HTTP response cache for all the queries made by WordHoard.
+
+    :param directory: The directory used to store the responses. Defaults to an in-memory cache.
+    :type directory: Optional[str]
+    :param revalidate: Revalidate stored responses with conditional requests. When False stored
+                       responses are used without contacting the online repositories.
+    :type revalidate: bool
+    :param max_entries: The number of responses kept in memory when no directory is provided.
+    :type max_entries: int
+    :return: the enabled cache
+    :rtype: HttpCache
+    """
+    global _http_cache
+    _http_cache = HttpCache(directory=directory, revalidate=revalidate, max_entries=max_entries)
+    return _http_cache
+
+def disable_http_cache() -> None:
+    """
+    Disables the HTTP response cache.
+
+    :return: None
+    """
+    global _http_cache
+    _http_cache = None
+
+def get_http_cache() -> Optional[HttpCache]:
+    """
+    Returns the enabled HTTP response cache.
+
+    :return: the enabled cache or None
+    :rtype: Optional[HttpCache]
+    """
+    return _http_cache
@@ -0,0 +1,505 @@
+#!/usr/bin/env python3
+
+"""
+This Python module records performance and outcome metrics for the queries made by WordHoard.
+The metrics are labeled with the relation (synonyms, antonyms, definitions, hypernyms or
+hyponyms) and the source that was queried, so that a slow or failing source can be
+identified. The metrics can be read as a snapshot, exported in the Prometheus text
+exposition format or streamed to observer callbacks.
+"""
+__author__ = 'John Bumgarner'
+__date__ = 'October 19, 2026'
+__status__ = 'Production'
+__license__ = 'MIT'
+__copyright__ = "Copyright (C) 2026 John Bumgarner"
+
+##################################################################################
+# “AS-IS” Clause
+#
+# Except as represented in this agreement, all work produced by Developer is
+# provided “AS IS”. Other than as provided in this agreement, Developer makes no
+# other warranties, express or implied, and hereby disclaims all implied warranties,
+# including any warranty of merchantability and warranty of fitness for a particular
+# purpose.
+##################################################################################
+
+##################################################################################
+# Date Completed: October 19, 2026
+# Author: John Bumgarner
+#
+# Date Last Revised:
+# Revised by:
+##################################################################################
+
+##################################################################################
+# Python imports required for basic operations
+##################################################################################
+# Standard library imports
+import time
+import logging
+import functools
+import threading
+import traceback
+import contextvars
+from bisect import bisect_left
+from contextlib import contextmanager
+from urllib.parse import urlparse
+from typing import Any, Callable, Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+# Local or project-specific imports
+from wordhoard.utilities import source_health, tracing
+
+logger = logging.getLogger(__name__)
+
+# The upper bounds in seconds of the histogram buckets
+LATENCY_BUCKETS: Tuple[float, ...] = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+# name: (type, help text)
+METRICS: Dict[str, Tuple[str, str]] = {
+    'wordhoard_request_seconds': ('histogram', 'Duration of the HTTP requests sent to a source.'),
+    'wordhoard_response_bytes_total': ('counter', 'Bytes downloaded from a source.'),
+    'wordhoard_query_seconds': ('histogram', 'Duration of the query of a source, including the HTTP requests.'),
+    'wordhoard_parse_seconds': ('histogram', 'Duration of the query of a source, excluding the HTTP requests.'),
+    'wordhoard_queries_total': ('counter', 'Queries of a source by outcome: found, empty, protected, error or skipped.'),
+    'wordhoard_results_total': ('counter', 'Words or definitions returned by a source.'),
+    'wordhoard_cache_hits_total': ('counter', 'Lookups answered from the in memory cache.'),
+    'wordhoard_cache_misses_total': ('counter', 'Lookups that were not in the in memory cache.'),
+    'wordhoard_rate_limit_backoffs_total': ('counter', 'Backoffs caused by the local rate limit.'),
+    'wordhoard_cloudflare_detections_total': ('counter', 'Pages identified as a Cloudflare challenge.'),
+    'wordhoard_protected_responses_total': ('counter', 'Responses identified as a captcha or a rate limit.'),
+}
+
+
+class MetricEvent(NamedTuple):
+    """
+        A single recorded measurement, which is passed to the observer callbacks.
+
+        Attributes
+        ----------
+        name : str
+            The name of the metric, which is a key of METRICS.
+        value : float
+            The measured value or the counter increment.
+        labels : Dict[str, str]
+            The relation and source labels of the measurement.
+        timestamp : float
+            The time of the measurement as returned by time.time().
+    """
+    name: str
+    value: float
+    labels: Dict[str, str]
+    timestamp: float
+
+
+class _Histogram:
+    """
+        The bucket counts, sum and count of a histogram metric.
+    """
+    __slots__ = ('bucket_counts', 'total', 'count')
+
+    def __init__(self):
+        self.bucket_counts: List[int] = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.total: float = 0.0
+        self.count: int = 0
+
+    def observe(self, value: float) -> None:
+        self.bucket_counts[bisect_left(LATENCY_BUCKETS, value)] += 1
+        self.total += value
+        self.count += 1
+
+
+class QueryScope:
+    """
+        The state of the query of one source by one relation class. The scope is active in
+        the thread that runs the query, and the requests made in that thread are attributed
+        to its relation and source.
+
+        Parameters
+        ----------
+        relation : str
+            antonyms, synonyms, definitions, hypernyms or hyponyms
+        source : str
+            The name of the queried source.
+
+        Attributes
+        ----------
+        labels : Dict[str, str]
+            The relation and source labels of the metrics recorded in the scope.
+        network_seconds : float
+            The time spent in HTTP requests.
+        protected : bool
+            True when a page of the source was identified as a Cloudflare challenge.
+        failed : bool
+            True when the query raised an exception or a request failed.
+        results : Optional[int]
+            The number of results returned by the source.
+    """
+
+    def __init__(self, relation: str, source: str):
+        self.labels: Dict[str, str] = {'relation': relation, 'source': source}
+        self.network_seconds: float = 0.0
+        self.protected: bool = False
+        self.failed: bool = False
+        self.results: Optional[int] = None
+
+    def outcome(self) -> str:
+        if self.results:
+            return 'found'
+        if self.failed:
+            return 'error'
+        if self.protected:
+            return 'protected'
+        return 'empty'
+
+
+##################################################################################
+# module level registry
+##################################################################################
+_metrics_enabled = False
+_registry_lock = threading.Lock()
+_counters: Dict[Tuple[str, Tuple[Tuple[str, str], ...]], float] = {}
+_histograms: Dict[Tuple[str, Tuple[Tuple[str, str], ...]], _Histogram] = {}
+_observers: List[Callable[[MetricEvent], None]] = []
+_current_scope: contextvars.ContextVar = contextvars.ContextVar('wordhoard_query_scope', default=None)
+
+def enable_metrics() -> None:
+    """
+    Starts recording metrics.
+
+    :return: None
+    """
+    global _metrics_enabled
+    _metrics_enabled = True
+
+def disable_metrics() -> None:
+    """
+    Stops recording metrics. The metrics recorded so far are kept.
+
+    :return: None
+    """
+    global _metrics_enabled
+    _metrics_enabled = False
+
+def metrics_enabled() -> bool:
+    """
+    Returns True when metrics are recorded.
+
+    :return: True or False
+    :rtype: bool
+    """
+    return _metrics_enabled
+
+def reset_metrics() -> None:
+    """
+    Removes all the recorded metrics.
+
+    :return: None
+    """
+    with _registry_lock:
+        _counters.clear()
+        _histograms.clear()
+
+def add_observer(callback: Callable[[MetricEvent], None]) -> None:
+    """
+    Registers a callback that receives every recorded measurement. The callback is
+    called in the thread that made the measurement, so it should return quickly.
+
+    :param callback: A function that accepts a MetricEvent.
+    :type callback: Callable[[MetricEvent], None]
+    :return: None
+    """
+    with _registry_lock:
+        _observers.append(callback)
+
+def remove_observer(callback: Callable[[MetricEvent], None]) -> None:
+    """
+    Unregisters a callback that was registered with add_observer.
+
+    :param callback: The registered callback.
+    :type callback: Callable[[MetricEvent], None]
+    :return: None
+    """
+    with _registry_lock:
+        if callback in _observers:
+            _observers.remove(callback)
+
+def _record(name: str, value: float, labels: Dict[str, str]) -> None:
+    key = (name, tuple(sorted(labels.items())))
+    with _registry_lock:
+        if METRICS[name][0] == 'histogram':
+            histogram = _histograms.get(key)
+            if histogram is None:
+                histogram = _histograms[key] = _Histogram()
+            histogram.observe(value)
+        else:
+            _counters[key] = _counters.get(key, 0) + value
+        observers = list(_observers)
+    if observers:
+        event = MetricEvent(name, value, dict(labels), time.time())
+        for callback in observers:
+            try:
+                callback(event)
+            except Exception as error:
+                logger.error(f'The metrics observer {callback!r} raised an exception.')
+                logger.error(''.join(traceback.format_tb(error.__traceback__)))
+
+def snapshot() -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Returns the recorded metrics. Counters have a value and histograms have
+    the cumulative bucket counts, the sum and the count of their measurements.
+
+    :return: The samples of every metric by metric name.
+    :rtype: Dict[str, List[Dict[str, Any]]]
+    """
+    samples: Dict[str, List[Dict[str, Any]]] = {}
+    with _registry_lock:
+        for (name, labels), value in sorted(_counters.items()):
+            samples.setdefault(name, []).append({'labels': dict(labels), 'value': value})
+        for (name, labels), histogram in sorted(_histograms.items(), key=lambda item: item[0]):
+            cumulative, buckets = 0, {}
+            for upper_bound, bucket_count in zip(LATENCY_BUCKETS + (float('inf'),), histogram.bucket_counts):
+                cumulative += bucket_count
+                buckets[upper_bound] = cumulative
+            samples.setdefault(name, []).append({'labels': dict(labels),
+                                                 'buckets': buckets,
+                                                 'sum': histogram.total,
+                                                 'count': histogram.count})
+    return samples
+
+def _escape_label_value(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+def _format_labels(labels: Dict[str, str], **extra_labels: str) -> str:
+    pairs = {**labels, **extra_labels}
+    if not pairs:
+        return ''
+    escaped = [f'{key}="{_escape_label_value(str(value))}"' for key, value in pairs.items()]
+    return '{' + ','.join(escaped) + '}'
+
+def prometheus_text() -> str:
+    """
+    Returns the recorded metrics in the Prometheus text exposition format,
+    which can be served from a /metrics endpoint or written for a textfile collector.
+
+    :return: The metrics in the Prometheus text exposition format.
+    :rtype: str
+    """
+    lines: List[str] = []
+    for name, samples in snapshot().items():
+        metric_type, help_text = METRICS[name]
+        lines.append(f'# HELP {name} {help_text}')
+        lines.append(f'# TYPE {name} {metric_type}')
+        for sample in samples:
+            labels = sample['labels']
+            if metric_type == 'counter':
+                lines.append(f'{name}{_format_labels(labels)} {sample["value"]:g}')
+                continue
+            for upper_bound, bucket_count in sample['buckets'].items():
+                bound = '+Inf' if upper_bound == float('inf') else f'{upper_bound:g}'
+                lines.append(f'{name}_bucket{_format_labels(labels, le=bound)} {bucket_count}')
+            lines.append(f'{name}_sum{_format_labels(labels)} {sample["sum"]:g}')
+            lines.append(f'{name}_count{_format_labels(labels)} {sample["count"]}')
+    return '\n'.join(lines) + '\n'
+
+
+##################################################################################
+# query scopes
+##################################################################################
+def current_scope() -> Optional[QueryScope]:
+    """
+    Returns the query scope that is active in the calling thread.
+
+    :return: The active query scope or None
+    :rtype: Optional[QueryScope]
+    """
+    return _current_scope.get()
+
+@contextmanager
+def query_scope(relation: str, source: str) -> Iterator[QueryScope]:
+    """
+    Attributes the requests made in the block to a relation and source, and records
+    the duration and outcome of the query when the block exits. The outcome is also
+    recorded in the health state of the source.
+
+    :param relation: antonyms, synonyms, definitions, hypernyms or hyponyms
+    :type relation: str
+    :param source: The name of the queried source.
+    :type source: str
+    :return: The query scope, whose results attribute is set by the caller.
+    :rtype: Iterator[QueryScope]
+    """
+    scope = QueryScope(relation, source)
+    token = _current_scope.set(scope)
+    started = time.perf_counter()
+    try:
+        with tracing.span('wordhoard.query', relation=relation, source=source) as query_span:
+            yield scope
+            query_span.set_attribute('outcome', scope.outcome())
+    except BaseException:
+        scope.failed = True
+        raise
+    finally:
+        _current_scope.reset(token)
+        elapsed = time.perf_counter() - started
+        source_health.record_query(source, succeeded=scope.outcome() in {'found', 'empty'}, seconds=elapsed)
+        if _metrics_enabled:
+            _record('wordhoard_query_seconds', elapsed, scope.labels)
+            _record('wordhoard_parse_seconds', max(elapsed - scope.network_seconds, 0.0), scope.labels)
+            _record('wordhoard_queries_total', 1, {**scope.labels, 'outcome': scope.outcome()})
+            if scope.results:
+                _record('wordhoard_results_total', scope.results, scope.labels)
+
+def source_available(relation: str, source: str) -> bool:
+    """
+    Returns True when the circuit breaker of the source lets the query through,
+    and records the query as skipped otherwise.
+
+    :param relation: antonyms, synonyms, definitions, hypernyms or hyponyms
+    :type relation: str
+    :param source: The name of the source.
+    :type source: str
+    :return: True or False
+    :rtype: bool
+    """
+    if source_health.allow_query(source):
+        return True
+    record_skipped_query(relation, source)
+    return False
+
+def instrument_query(relation: str, source: str, task: Callable[[], Any]) -> Callable[[], Any]:
+    """
+    Wraps a query method of a relation class, which returns a tuple of results and a part
+    of speech or None, so that it runs in a query scope in the thread pool worker. The
+    context of the calling thread, which holds the active trace span, is propagated
+    to the worker.
+
+    :param relation: antonyms, synonyms, definitions, hypernyms or hyponyms
+    :type relation: str
+    :param source: The name of the queried source.
+    :type source: str
+    :param task: The query method.
+    :type task: Callable[[], Any]
+    :return: The wrapped query method.
+    :rtype: Callable[[], Any]
+    """
+    def run_in_scope():
+        with query_scope(relation, source) as scope:
+            result = task()
+            if result:
+                scope.results = len(result[0])
+            return result
+
+    context = contextvars.copy_context()
+    return functools.partial(context.run, run_in_scope)
+
+def record_query_error() -> None:
+    """
+    Marks the active query as failed.
+
+    :return: None
+    """
+    scope = _current_scope.get()
+    if scope is not None:
+        scope.failed = True
+
+
+##################################################################################
+# measurements recorded by the query and cache modules
+##################################################################################
+def _labels_for(url: str) -> Dict[str, str]:
+    scope = _current_scope.get()
+    if scope is not None:
+        return scope.labels
+    return {'source': urlparse(url).netloc}
+
+def record_request(url: str, seconds: float, size: int, status_code: int = 200) -> None:
+    """
+    Records the duration and the downloaded bytes of an HTTP request. A server error,
+    403 Forbidden or 429 Too Many Requests status code marks the active query as failed.
+
+    :param url: The requested URL.
+    :type url: str
+    :param seconds: The duration of the request.
+    :type seconds: float
+    :param size: The size of the response body in bytes.
+    :type size: int
+    :param status_code: The HTTP status code of the response.
+    :type status_code: int
+    :return: None
+    """
+    scope = _current_scope.get()
+    if scope is not None:
+        scope.network_seconds += seconds
+        if status_code >= 500 or status_code in {403, 429}:
+            scope.failed = True
+    if _metrics_enabled:
+        labels = _labels_for(url)
+        _record('wordhoard_request_seconds', seconds, labels)
+        _record('wordhoard_response_bytes_total', size, labels)
+
+def record_skipped_query(relation: str, source: str) -> None:
+    """
+    Records a query that was skipped, because the circuit breaker of the source is open.
+
+    :param relation: antonyms, synonyms, definitions, hypernyms or hyponyms
+    :type relation: str
+    :param source: The name of the skipped source.
+    :type source: str
+    :return: None
+    """
+    if _metrics_enabled:
+        _record('wordhoard_queries_total', 1, {'relation': relation, 'source': source, 'outcome': 'skipped'})
+
+def record_cloudflare_detection(url: str) -> None:
+    """
+    Records a page that was identified as a Cloudflare challenge.
+
+    :param url: The URL of the source.
+    :type url: str
+    :return: None
+    """
+    scope = _current_scope.get()
+    if scope is not None:
+        scope.protected = True
+    if _metrics_enabled:
+        _record('wordhoard_cloudflare_detections_total', 1, _labels_for(url))
+
+def record_protected_response(url: str, protection: str) -> None:
+    """
+    Records a response that was identified as a captcha or a rate limit.
+
+    :param url: The URL of the source.
+    :type url: str
+    :param protection: captcha or rate_limited
+    :type protection: str
+    :return: None
+    """
+    scope = _current_scope.get()
+    if scope is not None:
+        scope.protected = True
+    if _metrics_enabled:
+        _record('wordhoard_protected_responses_total', 1, dict(_labels_for(url), protection=protection))
+
+def record_cache_lookup(relation: str, hit: bool) -> None:
+    """
+    Records a lookup of the in memory cache.
+
+    :param relation: antonyms, synonyms, definitions, hypernyms or hyponyms
+    :type relation: str
+    :param hit: True when the word was cached.
+    :type hit: bool
+    :return: None
+    """
+    if _metrics_enabled:
+        _record('wordhoard_cache_hits_total' if hit else 'wordhoard_cache_misses_total', 1, {'relation': relation})
+
+def record_backoff(relation: str) -> None:
+    """
+    Records a backoff caused by the local rate limit.
+
+    :param relation: antonyms, synonyms, definitions, hypernyms or hyponyms
+    :type relation: str
+    :return: None
+    """
+    if _metrics_enabled:
+        _record('wordhoard_rate_limit_backoffs_total', 1, {'relation': relation})
@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+
+"""
+This Python module implements the multilingual lookup mode of the relation classes.
+A relation class created with a translator translates its word into English, queries the
+English online repositories and translates the results back into the language of the
+translator. The results of a lookup are translated back with batched requests, and the
+translations are cached by the translation cache, so a repeated lookup sends no requests.
+"""
+__author__ = 'John Bumgarner'
+__date__ = 'October 19, 2026'
+__status__ = 'Production'
+__license__ = 'MIT'
+__copyright__ = "Copyright (C) 2026 John Bumgarner"
+
+##################################################################################
+# “AS-IS” Clause
+#
+# Except as represented in this agreement, all work produced by Developer is
+# provided “AS IS”. Other than as provided in this agreement, Developer makes no
+# other warranties, express or implied, and hereby disclaims all implied warranties,
+# including any warranty of merchantability and warranty of fitness for a particular
+# purpose.
+##################################################################################
+
+##################################################################################
+# Date Completed: October 19, 2026
+# Author: John Bumgarner
+#
+# Date Last Revised:
+# Revised by:
+##################################################################################
+
+
+##################################################################################
+# Python imports required for basic operations
+##################################################################################
+# Standard library imports
+import json
+import logging
+import functools
+from typing import Any, Callable, Dict, Iterator, List, Optional, Protocol
+
+# Local or project-specific imports
+from wordhoard.utilities import caching
+from wordhoard.utilities.colorized_text import colorized_text
+
+logger = logging.getLogger(__name__)
+
+
+class BatchTranslator(Protocol):
+    """
+        The batch translation methods of the Google, MyMemory and DeepL Translator classes,
+        which are used by the multilingual lookup mode.
+    """
+
+    def translate_many(self, words: List[str], source_language: Optional[str] = None) -> Dict[str, Optional[str]]:
+        ...
+
+    def reverse_translate_many(self, words: List[str], source_language: Optional[str] = None) -> Dict[str, Optional[str]]:
+        ...
+
+
+def english_word(translator: BatchTranslator, search_string: str) -> Optional[str]:
+    """
+    Translates the word of a lookup into English.
+
+    :param translator: The translator of the language of the word.
+    :type translator: BatchTranslator
+    :param search_string: The word to translate.
+    :type search_string: str
+    :return: The English word or None when the word could not be translated.
+    :rtype: Optional[str]
+    """
+    translation = translator.translate_many([search_string]).get(search_string)
+    if not translation:
+        colorized_text(text=f'The word {search_string} could not be translated into English.', color='magenta')
+        logger.info(f'The word {search_string} could not be translated into English.')
+        return None
+    return translation
+
+def _result_texts(value: Any) -> Iterator[str]:
+    if isinstance(value, list):
+        for item in value:
+            if isinstance(item, str):
+                yield item
+            else:
+                yield from _result_texts(item)
+    elif isinstance(value, dict):
+        for item in value.values():
+            yield from _result_texts(item)
+
+def _replace_texts(value: Any, translations: Dict[str, Optional[str]], search_word: str) -> Any:
+    if isinstance(value, list):
+        items: List[Any] = []
+        for item in value:
+            if isinstance(item, str):
+                # an untranslated result is kept in English, and the word itself is not one of its own results
+                item = translations.get(item) or item
+                if caching.normalize_key(item) == search_word or item in items:
+                    continue
+            else:
+                item = _replace_texts(item, translations, search_word)
+            items.append(item)
+        return items
+    if isinstance(value, dict):
+        return {key: _replace_texts(item, translations, search_word) for key, item in value.items()}
+    return value
+
+def translate_output(translator: BatchTranslator, output: Any, search_string: str) -> Any:
+    """
+    Translates the results in the output of an English lookup back into the language of the
+    translator, with as few requests as the translation service allows. The keys of the output
+    and the parts of speech are kept.
+
+    :param translator: The translator of the language of the word.
+    :type translator: BatchTranslator
+    :param output: The list, dictionary or json output of the English lookup.
+    :type output: Any
+    :param search_string: The word of the lookup, which is removed from the translated results.
+    :type search_string: str
+    :return: The output with the translated results.
+    :rtype: Any
+    """
+    if output is None:
+        return None
+    if isinstance(output, str):
+        return json.dumps(translate_output(translator, json.loads(output), search_string), indent=4, ensure_ascii=False)
+    texts = list(dict.fromkeys(_result_texts(output)))
+    translations = translator.reverse_translate_many(texts) if texts else {}
+    return _replace_texts(output, translations, caching.normalize_key(search_string))
+
+def translated(lookup: Callable) -> Callable:
+    """
+    Decorates the find method of a relation class. When the relation class has a translator,
+    its word is translated into English before the lookup and the results are translated back.
+
+    :param lookup: The find method of the relation class.
+    :type lookup: Callable
+    :return: The decorated method.
+    :rtype: Callable
+    """
+    @functools.wraps(lookup)
+    def translated_lookup(relation, *args, **kwargs):
+        translator = relation._translator
+        if translator is None:
+            return lookup(relation, *args, **kwargs)
+        english_search_string = english_word(translator, relation._search_string)
+        if english_search_string is None:
+            return None
+        relation._word = caching.normalize_key(english_search_string)
+        return translate_output(translator, lookup(relation, *args, **kwargs), relation._search_string)
+    return translated_lookup
+
+def translated_stream(stream: Callable) -> Callable:
+    """
+    Decorates the iter method of a relation class. When the relation class has a translator,
+    its word is translated into English before the lookup and the results of every yielded
+    StreamedResult are translated back.
+
+    :param stream: The iter method of the relation class.
+    :type stream: Callable
+    :return: The decorated method.
+    :rtype: Callable
+    """
+    @functools.wraps(stream)
+    def translated_results(relation, *args, **kwargs):
+        translator = relation._translator
+        if translator is None:
+            yield from stream(relation, *args, **kwargs)
+            return
+        english_search_string = english_word(translator, relation._search_string)
+        if english_search_string is None:
+            return
+        relation._word = caching.normalize_key(english_search_string)
+        for result in stream(relation, *args, **kwargs):
+            yield result._replace(output=translate_output(translator, result.output, relation._search_string))
+    return translated_results
@@ -32,33 +32,32 @@ __copyright__ = "Copyright (C) 2021 John Bumgarner"
 # Python imports required for basic operations
 ##################################################################################
 # Standard library imports
-import ast
-import sys
 import logging
 import traceback
 from string import punctuation
-from typing import Dict, Optional, Tuple, Union
+from typing import Dict, List, Optional, Union
 
 # Third-party imports
-import requests
-from requests.adapters import Retry
-from requests.adapters import HTTPAdapter
 from backoff import on_exception, expo
 from ratelimit import limits, RateLimitException
 
 # Local or project-specific imports
+from wordhoard.utilities import async_translation, transport, translation_batches, translation_cache, translation_clients
 from wordhoard.utilities.exceptions import RequestException
 from wordhoard.utilities.colorized_text import colorized_text
-from wordhoard.utilities.translator_languages import Languages
+from wordhoard.utilities.translator_languages import language_index
 from wordhoard.utilities.user_agents import get_random_user_agent
 from wordhoard.utilities.exceptions import InvalidLengthException
 from wordhoard.utilities.exceptions import TooManyRequestsException
 from wordhoard.utilities.exceptions import InvalidEmailAddressException
-from wordhoard.utilities.exceptions import LanguageNotSupportedException
 from wordhoard.utilities.email_address_verification import validate_address
 
 logger = logging.getLogger(__name__)
 
+# The MyMemory Translation service accepts at most 500 bytes of text per request
+MYMEMORY_BATCH_MAX_TEXTS = 50
+MYMEMORY_BATCH_MAX_BYTES = 500
+
 class Translator:
     """
         This class provides translation capabilities using the MyMemory Translation service.
@@ -84,12 +83,19 @@ class Translator:
             __init__: Initializes the Translator object with source language, text to translate, email address, and proxies.
             _backoff_handler: Handles rate limit exceeded situations by logging and setting rate_limit_status.
             _mymemory_supported_languages: Checks if the source language is supported by MyMemory Translation service.
-            _requests_retry_session: Configures a retry session for handling HTTP request retries.
             _handle_custom_exceptions: Handles custom exceptions specific to MyMemory Translation service.
             _mymemory_translate: Translates text from the source language to English using MyMemory Translation service.
             _mymemory_translate_reverse: Translates text from English to the source language using MyMemory Translation service.
-            translate_word: Translates text from the source language to English, handling unsupported languages.
+            _mymemory_translate_batch: Translates a batch of words from the source language to English.
+            _mymemory_translate_reverse_batch: Translates a batch of words from English to the source language.
+            translate_word: Translates text from the source language to English, using the translation cache.
             reverse_translate: Translates text from English to the source language.
+            translate_many: Translates many words from the source language to English in batched requests.
+            reverse_translate_many: Translates many words from English to the source language in batched requests.
+            atranslate_word: The asynchronous variant of translate_word.
+            areverse_translate: The asynchronous variant of reverse_translate.
+            atranslate_many: The asynchronous variant of translate_many, which translates the batches concurrently.
+            areverse_translate_many: The asynchronous variant of reverse_translate_many.
 
         Note:
             This class requires the 'requests', 'backoff', and 'ratelimit' modules for handling HTTP requests
@@ -124,8 +130,10 @@ class Translator:
                                on_backoff=self._backoff_handler)
         # Establishes a rate limit for making requests to the MyMemory translation service
         limiter = limits(calls=max_number_of_requests, period=rate_limit_timeout_period)
-        self.translate_word = handler(limiter(self.translate_word))
-        self.reverse_translate = handler(limiter(self.reverse_translate))
+        # Replayed requests do not reach the translation service, so they are not rate limited
+        if transport.replay_enabled() is False:
+            self._mymemory_translate = handler(limiter(self._mymemory_translate))
+            self._mymemory_translate_reverse = handler(limiter(self._mymemory_translate_reverse))
 
     def _backoff_handler(self, details) -> None:
         """
@@ -163,49 +171,21 @@ class Translator:
             colorized_text(text=f"Backing off {details['wait']:.1f} seconds afters {details['tries']} tries.",
                            color='blue')
 
-    def _mymemory_supported_languages(self) -> Union[str, None]:
+    def _mymemory_supported_languages(self, language: Optional[str] = None) -> Union[str, None]:
         """
         This function determines if the requested source language is
         one supported languages for the MyMemory Translator.
 
-        :return: language
+        :param language: language to check instead of the source language
+        :return: language code
         :rtype: string
         """
-        languages = Languages()
-        mymemory_languages = languages.mymemory_supported_languages()
-        mymemory_languages_str = str(mymemory_languages)
-        supported_languages = ast.literal_eval(mymemory_languages_str)
-        try:
-            if self._source_language in supported_languages.keys():
-                return self._source_language
-            elif self._source_language in supported_languages.values():
-                return self._source_language
-            else:
-                return None
-        except LanguageNotSupportedException as error:
-            logger.info('The language provided is not one of the supported languages of the MyMemory Translation service.')
-            logger.info(f'Requested language: {self._source_language}')
-            logger.error(''.join(traceback.format_tb(error.__traceback__)))
-
-    # reference: https://urllib3.readthedocs.io/en/latest/reference/urllib3.util.html#module-urllib3.util.retry
-    @staticmethod
-    def _requests_retry_session(retries: int = 5,
-                                backoff_factor: float = 0.5,
-                                status_forcelist: Tuple[int] = (500, 502, 503, 504),
-                                session: requests.sessions.Session = None,
-                                ):
-        session = session or requests.Session()
-        retry = Retry(
-            total=retries,
-            read=retries,
-            connect=retries,
-            backoff_factor=backoff_factor,
-            status_forcelist=status_forcelist,
-        )
-        http_adapter = HTTPAdapter(max_retries=retry)
-        session.mount(prefix='http://', adapter=http_adapter)
-        session.mount(prefix='https://', adapter=http_adapter)
-        return session
+        language = self._source_language if language is None else language
+        supported_language = language_index('mymemory').resolve(language)
+        if supported_language is None:
+            logger.info('The language provided is not one of the supported languages for the MyMemory Translation service.')
+            logger.info(f'Requested language: {language}')
+        return supported_language
 
     def _handle_custom_exceptions(self, error):
         """
@@ -238,26 +218,27 @@ class Translator:
             logger.error('There has been too many connection requests to the MyMemory Translation service.')
             logger.error(''.join(traceback.format_tb(error.__traceback__)))
 
-    def _mymemory_translate(self, original_language: str) -> Union[str, None]:
+    def _mymemory_translate(self, original_language: str, text: Optional[str] = None) -> Union[str, None]:
         """
         This function is used to translate a word from it source language, such as Spanish into American English.
 
         :param original_language: language to translated from
+        :param text: text to translate instead of the word of the translator
         :return: translated word
         :rtype: string or None
         """
+        text = self._str_to_translate if text is None else text
         try:
             if not validate_address(email_address=self._email_address):
-                colorized_text(text='A valid email address is required to use the MyMemory Translation service.',
-                               color='red')
-                sys.exit(1)
+                raise InvalidEmailAddressException()
 
-            response = self._requests_retry_session().get(self._url_to_query,
-                                                          params={'langpair': f'{original_language}|en-us',
-                                                                  'q': self._str_to_translate,
-                                                                  'de': self._email_address},
-                                                          headers=self._headers,
-                                                          proxies=self._proxies)
+            session = translation_clients.translation_session('mymemory')
+            response = session.get(self._url_to_query,
+                                   params={'langpair': f'{original_language}|en-us',
+                                           'q': text,
+                                           'de': self._email_address},
+                                   headers=self._headers,
+                                   proxies=self._proxies)
 
             if response.status_code == 429:
                 # HTTP 429 -- Too Many Requests response status code indicates the user has
@@ -268,7 +249,7 @@ class Translator:
 
             data = response.json()
             if not data:
-                colorized_text(text=f'MyMemory could not translate the word "{self._str_to_translate}".',
+                colorized_text(text=f'MyMemory could not translate the word "{text}".',
                                color='magenta')
                 return None
 
@@ -281,26 +262,28 @@ class Translator:
         except (InvalidEmailAddressException, InvalidLengthException, TooManyRequestsException, RequestException) as error:
             self._handle_custom_exceptions(error)
 
-    def _mymemory_translate_reverse(self) -> Union[str, None]:
+    def _mymemory_translate_reverse(self, text: Optional[str] = None, language: Optional[str] = None) -> Union[str, None]:
         """
-        This function is used to translate a word from it source language, such as Spanish into American English.
+        This function is used to translate a word from American English into another language, such as Spanish.
 
+        :param text: text to translate instead of the word of the translator
+        :param language: language to translate into instead of the source language
         :return: translated word
         :rtype: string or None
         """
+        text = self._str_to_translate if text is None else text
+        language = self._source_language if language is None else language
         try:
             if not validate_address(email_address=self._email_address):
-                colorized_text(text='A valid email address is required to use the MyMemory Translation service.',
-                               color='red')
-                sys.exit(1)
-
-            response = self._requests_retry_session().get(url=self._url_to_query,
-                                                          params={'langpair': f'en-us|{self._source_language}',
-                                                                  'q': self._str_to_translate,
-                                                                  'de': self._email_address},
-                                                          headers=self._headers,
-                                                          proxies=self._proxies
-                                                          )
+                raise InvalidEmailAddressException()
+
+            session = translation_clients.translation_session('mymemory')
+            response = session.get(url=self._url_to_query,
+                                   params={'langpair': f'en-us|{language}',
+                                           'q': text,
+                                           'de': self._email_address},
+                                   headers=self._headers,
+                                   proxies=self._proxies)
 
             if response.status_code == 429:
                 # HTTP 429 -- Too Many Requests response status code indicates the user has
@@ -311,7 +294,7 @@ class Translator:
 
             data = response.json()
             if not data:
-                colorized_text(text=f'MyMemory could not translate the word "{self._str_to_translate}".',
+                colorized_text(text=f'MyMemory could not translate the word "{text}".',
                                color='magenta')
                 return None
 
@@ -324,6 +307,61 @@ class Translator:
         except (InvalidEmailAddressException, InvalidLengthException, TooManyRequestsException, RequestException) as error:
             self._handle_custom_exceptions(error)
 
+    @staticmethod
+    def _report_unsupported_language(language: str) -> None:
+        """
+        Informs the user that the requested language is not supported by the MyMemory Translation service.
+
+        :param language: requested language
+        :return: None
+        """
+        colorized_text(text='The language provided is not one of the supported languages for the MyMemory '
+                       'Translation service.', color='red')
+        colorized_text(text=f'Requested language: {language}', color='red')
+        colorized_text(text='Please review the languages supported by the MyMemory Translate service\n'
+                       'https://wordhoard.readthedocs.io/en/latest/translations'
+                       '/mymemory_supported_translation_languages/', color='green')
+
+    def _mymemory_translate_batch(self, original_language: str, texts: List[str]) -> List[Optional[str]]:
+        """
+        This function is used to translate a batch of words from it source language, such as Spanish
+        into American English, with a single request. The words are sent one per line. When the
+        lines of the translation do not match the words, the words are translated one by one.
+
+        :param original_language: language to translated from
+        :param texts: words to translate
+        :return: translated words
+        :rtype: list
+        """
+        translations = translation_batches.split_batch_translation(
+            self._mymemory_translate(original_language, text=translation_batches.SEPARATOR.join(texts)), texts)
+        if translations is None and len(texts) > 1:
+            logger.info('The MyMemory Translation service did not preserve the lines of a batch, '
+                        'so its words are translated one by one.')
+            translations = [self._mymemory_translate(original_language, text=text) for text in texts]
+        return [translation.rstrip(punctuation) if translation else None
+                for translation in translations or [None] * len(texts)]
+
+    def _mymemory_translate_reverse_batch(self, language: str, texts: List[str]) -> List[Optional[str]]:
+        """
+        This function is used to translate a batch of words from American English into another
+        language, such as Spanish, with a single request. When the lines of the translation do not
+        match the words, the words are translated one by one.
+
+        :param language: language to translate into
+        :param texts: words to translate
+        :return: translated words
+        :rtype: list
+        """
+        translations = translation_batches.split_batch_translation(
+            self._mymemory_translate_reverse(text=translation_batches.SEPARATOR.join(texts), language=language), texts)
+        if translations is None and len(texts) > 1:
+            logger.info('The MyMemory Translation service did not preserve the lines of a batch, '
+                        'so its words are translated one by one.')
+            translations = [self._mymemory_translate_reverse(text=text, language=language) for text in texts]
+        return [translation.rstrip(punctuation) if translation else None
+                for translation in translations or [None] * len(texts)]
+
     def translate_word(self) -> Union[str, None]:
         """
         This function is used to translate a word from it source language, such as Spanish into American English.
@@ -333,15 +371,15 @@ class Translator:
         """
         supported_language = self._mymemory_supported_languages()
         if supported_language:
-            return self._mymemory_translate(supported_language)
+            translation = translation_cache.cached_translation('mymemory', supported_language, 'en-us',
+                                                               self._str_to_translate)
+            if translation is None:
+                translation = translation_cache.cache_translation('mymemory', supported_language, 'en-us',
+                                                                  self._str_to_translate,
+                                                                  self._mymemory_translate(supported_language))
+            return translation
         elif not supported_language:
-            colorized_text(text='The language provided is not one of the supported languages for the MyMemory '
-                           'Translation service.', color='red')
-            colorized_text(text=f'Requested language: {self._source_language}', color='red')
-            colorized_text(text='Please review the languages supported by the MyMemory Translate service\n'
-                           'https://wordhoard.readthedocs.io/en/latest/translations'
-                           '/mymemory_supported_translation_languages/', color='green')
-
+            self._report_unsupported_language(self._source_language)
             return None
 
     def reverse_translate(self) -> Union[str, None]:
@@ -351,4 +389,110 @@ class Translator:
         :return: translated word
         :rtype: string or None
         """
-        return self._mymemory_translate_reverse()
+        supported_language = self._mymemory_supported_languages()
+        if not supported_language:
+            self._report_unsupported_language(self._source_language)
+            return None
+        translation = translation_cache.cached_translation('mymemory', 'en-us', supported_language, self._str_to_translate)
+        if translation is None:
+            translation = translation_cache.cache_translation('mymemory', 'en-us', supported_language, self._str_to_translate,
+                                                              self._mymemory_translate_reverse(language=supported_language))
+        return translation
+
+    def translate_many(self, words: List[str], source_language: Optional[str] = None) -> Dict[str, Optional[str]]:
+        """
+        This function is used to translate many words from their source language, such as Spanish
+        into American English, with as few requests as the limits of the MyMemory Translation service allow.
+
+        :param words: words to translate
+        :param source_language: language to translated from instead of the source language of the translator
+        :return: translated word or None by word
+        :rtype: dict
+        """
+        supported_language = self._mymemory_supported_languages(source_language)
+        if not supported_language:
+            self._report_unsupported_language(self._source_language if source_language is None else source_language)
+            return {word: None for word in words}
+        return translation_batches.translate_many('mymemory', supported_language, 'en-us', words,
+                                                  lambda texts: self._mymemory_translate_batch(supported_language, texts),
+                                                  max_texts=MYMEMORY_BATCH_MAX_TEXTS,
+                                                  max_bytes=MYMEMORY_BATCH_MAX_BYTES)
+
+    def reverse_translate_many(self, words: List[str], source_language: Optional[str] = None) -> Dict[str, Optional[str]]:
+        """
+        This function is used to translate many words from American English into another language,
+        such as Spanish, with as few requests as the limits of the MyMemory Translation service allow.
+
+        :param words: words to translate
+        :param source_language: language to translate into instead of the source language of the translator
+        :return: translated word or None by word
+        :rtype: dict
+        """
+        supported_language = self._mymemory_supported_languages(source_language)
+        if not supported_language:
+            self._report_unsupported_language(self._source_language if source_language is None else source_language)
+            return {word: None for word in words}
+        return translation_batches.translate_many('mymemory', 'en-us', supported_language, words,
+                                                  lambda texts: self._mymemory_translate_reverse_batch(supported_language,
+                                                                                                   texts),
+                                                  max_texts=MYMEMORY_BATCH_MAX_TEXTS,
+                                                  max_bytes=MYMEMORY_BATCH_MAX_BYTES)
+
+    async def atranslate_word(self) -> Union[str, None]:
+        """
+        The asynchronous variant of translate_word. The translation request is made in the
+        translation thread pool, with the same rate limit as translate_word.
+
+        :return: translated word
+        :rtype: string
+        """
+        return await async_translation.run_translation(self.translate_word)
+
+    async def areverse_translate(self) -> Union[str, None]:
+        """
+        The asynchronous variant of reverse_translate. The translation request is made in the
+        translation thread pool, with the same rate limit as reverse_translate.
+
+        :return: translated word
+        :rtype: string
+        """
+        return await async_translation.run_translation(self.reverse_translate)
+
+    async def atranslate_many(self, words: List[str], source_language: Optional[str] = None) -> Dict[str, Optional[str]]:
+        """
+        The asynchronous variant of translate_many. The batches are translated concurrently in the
+        translation thread pool, with the same rate limit as translate_many.
+
+        :param words: words to translate
+        :param source_language: language to translated from instead of the source language of the translator
+        :return: translated word or None by word
+        :rtype: dict
+        """
+        supported_language = self._mymemory_supported_languages(source_language)
+        if not supported_language:
+            self._report_unsupported_language(self._source_language if source_language is None else source_language)
+            return {word: None for word in words}
+        return await translation_batches.atranslate_many('mymemory', supported_language, 'en-us', words,
+                                                         lambda texts: self._mymemory_translate_batch(supported_language, texts),
+                                                         max_texts=MYMEMORY_BATCH_MAX_TEXTS,
+                                                         max_bytes=MYMEMORY_BATCH_MAX_BYTES)
+
+    async def areverse_translate_many(self, words: List[str], source_language: Optional[str] = None) -> Dict[str, Optional[str]]:
+        """
+        The asynchronous variant of reverse_translate_many. The batches are translated concurrently in the
+        translation thread pool, with the same rate limit as reverse_translate_many.
+
+        :param words: words to translate
+        :param source_language: language to translate into instead of the source language of the translator
+        :return: translated word or None by word
+        :rtype: dict
+        """
+        supported_language = self._mymemory_supported_languages(source_language)
+        if not supported_language:
+            self._report_unsupported_language(self._source_language if source_language is None else source_language)
+            return {word: None for word in words}
+        return await translation_batches.atranslate_many('mymemory', 'en-us', supported_language, words,
+                                                         lambda texts: self._mymemory_translate_reverse_batch(supported_language,
+                                                                                                          texts),
+                                                         max_texts=MYMEMORY_BATCH_MAX_TEXTS,
+                                                         max_bytes=MYMEMORY_BATCH_MAX_BYTES)
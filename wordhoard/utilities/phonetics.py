@@ -0,0 +1,690 @@
+#!/usr/bin/env python3
+
+"""
+This Python module implements the Double Metaphone phonetic encoding of Lawrence Philips,
+which encodes a word into a primary and an alternate key that approximate its English
+pronunciation. Words with the same key sound alike, which makes the keys suitable for
+finding homophone candidates without a network connection. Double Metaphone ignores the
+vowels after the first letter, so the module also approximates the vowel sounds of a word
+from its spelling, which separates words such as horse and hours that share a key.
+
+Usage Examples
+----------
+>>> double_metaphone('knight')
+('NT', 'NT')
+>>> double_metaphone('smith')
+('SM0', 'XMT')
+>>> vowel_sounds('nite') == vowel_sounds('night')
+True
+"""
+__author__ = 'John Bumgarner'
+__date__ = 'October 19, 2026'
+__status__ = 'Production'
+__license__ = 'MIT'
+__copyright__ = "Copyright (C) 2026 John Bumgarner"
+
+##################################################################################
+# “AS-IS” Clause
+#
+# Except as represented in this agreement, all work produced by Developer is
+# provided “AS IS”. Other than as provided in this agreement, Developer makes no
+# other warranties, express or implied, and hereby disclaims all implied warranties,
+# including any warranty of merchantability and warranty of fitness for a particular
+# purpose.
+##################################################################################
+
+##################################################################################
+# Date Completed: October 19, 2026
+# Author: John Bumgarner
+#
+# Date Last Revised:
+# Revised by:
+##################################################################################
+
+
+##################################################################################
+# Python imports required for basic operations
+##################################################################################
+# Standard library imports
+import unicodedata
+from functools import lru_cache
+from typing import Tuple
+
+# The maximum length of a phonetic key
+MAX_KEY_LENGTH = 4
+
+_VOWELS = frozenset('AEIOUY')
+_SILENT_STARTS = ('GN', 'KN', 'PN', 'WR', 'PS')
+
+
+class _Encoder:
+    """
+        The state of the Double Metaphone encoding of a single word.
+    """
+
+    def __init__(self, word: str, max_length: int = MAX_KEY_LENGTH):
+        self.word = word
+        self.max_length = max_length
+        self.length = len(word)
+        self.last = self.length - 1
+        self.primary = []
+        self.secondary = []
+        self.slavo_germanic = any(part in word for part in ('W', 'K', 'CZ', 'WITZ'))
+
+    def char_at(self, position: int) -> str:
+        if 0 <= position < self.length:
+            return self.word[position]
+        return ''
+
+    def string_at(self, start: int, length: int, *candidates: str) -> bool:
+        if start < 0:
+            return False
+        return self.word[start:start + length] in candidates
+
+    def is_vowel(self, position: int) -> bool:
+        return self.char_at(position) in _VOWELS
+
+    def add(self, primary: str, secondary: str = None) -> None:
+        self.primary.append(primary)
+        self.secondary.append(primary if secondary is None else secondary)
+
+    def keys(self) -> Tuple[str, str]:
+        return ''.join(self.primary)[:self.max_length], ''.join(self.secondary)[:self.max_length]
+
+    def complete(self) -> bool:
+        return len(''.join(self.primary)) >= self.max_length and len(''.join(self.secondary)) >= self.max_length
+
+
+def _encode_c(encoder: _Encoder, current: int) -> int:
+    # various germanic
+    if current > 1 and not encoder.is_vowel(current - 2) and encoder.string_at(current - 1, 3, 'ACH') \
+            and encoder.char_at(current + 2) != 'I' \
+            and (encoder.char_at(current + 2) != 'E' or encoder.string_at(current - 2, 6, 'BACHER', 'MACHER')):
+        encoder.add('K')
+        return current + 2
+    # special case 'caesar'
+    if current == 0 and encoder.string_at(current, 6, 'CAESAR'):
+        encoder.add('S')
+        return current + 2
+    # italian 'chianti'
+    if encoder.string_at(current, 4, 'CHIA'):
+        encoder.add('K')
+        return current + 2
+    if encoder.string_at(current, 2, 'CH'):
+        # find 'michael'
+        if current > 0 and encoder.string_at(current, 4, 'CHAE'):
+            encoder.add('K', 'X')
+            return current + 2
+        # greek roots e.g. 'chemistry', 'chorus'
+        if current == 0 and (encoder.string_at(current + 1, 5, 'HARAC', 'HARIS')
+                             or encoder.string_at(current + 1, 3, 'HOR', 'HYM', 'HIA', 'HEM')) \
+                and not encoder.string_at(0, 5, 'CHORE'):
+            encoder.add('K')
+            return current + 2
+        # germanic, greek, or otherwise 'ch' for 'kh' sound
+        if encoder.string_at(0, 4, 'VAN ', 'VON ') or encoder.string_at(0, 3, 'SCH') \
+                or encoder.string_at(current - 2, 6, 'ORCHES', 'ARCHIT', 'ORCHID') \
+                or encoder.string_at(current + 2, 1, 'T', 'S') \
+                or ((encoder.string_at(current - 1, 1, 'A', 'O', 'U', 'E') or current == 0)
+                    and encoder.string_at(current + 2, 1, 'L', 'R', 'N', 'M', 'B', 'H', 'F', 'V', 'W', ' ')):
+            encoder.add('K')
+        elif current > 0:
+            if encoder.string_at(0, 2, 'MC'):
+                # e.g. 'McHugh'
+                encoder.add('K')
+            else:
+                encoder.add('X', 'K')
+        else:
+            encoder.add('X')
+        return current + 2
+    # e.g. 'czerny'
+    if encoder.string_at(current, 2, 'CZ') and not encoder.string_at(current - 2, 4, 'WICZ'):
+        encoder.add('S', 'X')
+        return current + 2
+    # e.g. 'focaccia'
+    if encoder.string_at(current + 1, 3, 'CIA'):
+        encoder.add('X')
+        return current + 3
+    # double 'C', but not if e.g. 'McClellan'
+    if encoder.string_at(current, 2, 'CC') and not (current == 1 and encoder.char_at(0) == 'M'):
+        # 'bellocchio' but not 'bacchus'
+        if encoder.string_at(current + 2, 1, 'I', 'E', 'H') and not encoder.string_at(current + 2, 2, 'HU'):
+            # 'accident', 'accede', 'succeed'
+            if (current == 1 and encoder.char_at(current - 1) == 'A') \
+                    or encoder.string_at(current - 1, 5, 'UCCEE', 'UCCES'):
+                encoder.add('KS')
+            # 'bacci', 'bertucci', other italian
+            else:
+                encoder.add('X')
+            return current + 3
+        # Pierce's rule
+        encoder.add('K')
+        return current + 2
+    if encoder.string_at(current, 2, 'CK', 'CG', 'CQ'):
+        encoder.add('K')
+        return current + 2
+    if encoder.string_at(current, 2, 'CI', 'CE', 'CY'):
+        # italian vs. english
+        if encoder.string_at(current, 3, 'CIO', 'CIE', 'CIA'):
+            encoder.add('S', 'X')
+        else:
+            encoder.add('S')
+        return current + 2
+    encoder.add('K')
+    # name sent in 'mac caffrey', 'mac gregor'
+    if encoder.string_at(current + 1, 2, ' C', ' Q', ' G'):
+        return current + 3
+    if encoder.string_at(current + 1, 1, 'C', 'K', 'Q') and not encoder.string_at(current + 1, 2, 'CE', 'CI'):
+        return current + 2
+    return current + 1
+
+
+def _encode_g(encoder: _Encoder, current: int) -> int:
+    if encoder.char_at(current + 1) == 'H':
+        if current > 0 and not encoder.is_vowel(current - 1):
+            encoder.add('K')
+            return current + 2
+        if current == 0:
+            # 'ghislane', 'ghiradelli'
+            if encoder.char_at(current + 2) == 'I':
+                encoder.add('J')
+            else:
+                encoder.add('K')
+            return current + 2
+        # Parker's rule (with some further refinements) - e.g. 'hugh'
+        if (current > 1 and encoder.string_at(current - 2, 1, 'B', 'H', 'D')) \
+                or (current > 2 and encoder.string_at(current - 3, 1, 'B', 'H', 'D')) \
+                or (current > 3 and encoder.string_at(current - 4, 1, 'B', 'H')):
+            return current + 2
+        # e.g. 'laugh', 'McLaughlin', 'cough', 'gough', 'rough', 'tough'
+        if current > 2 and encoder.char_at(current - 1) == 'U' \
+                and encoder.string_at(current - 3, 1, 'C', 'G', 'L', 'R', 'T'):
+            encoder.add('F')
+        elif current > 0 and encoder.char_at(current - 1) != 'I':
+            encoder.add('K')
+        return current + 2
+    if encoder.char_at(current + 1) == 'N':
+        if current == 1 and encoder.is_vowel(0) and not encoder.slavo_germanic:
+            encoder.add('KN', 'N')
+        # not e.g. 'cagney'
+        elif not encoder.string_at(current + 2, 2, 'EY') and encoder.char_at(current + 1) != 'Y' \
+                and not encoder.slavo_germanic:
+            encoder.add('N', 'KN')
+        else:
+            encoder.add('KN')
+        return current + 2
+    # 'tagliaro'
+    if encoder.string_at(current + 1, 2, 'LI') and not encoder.slavo_germanic:
+        encoder.add('KL', 'L')
+        return current + 2
+    # -ges-, -gep-, -gel-, -gie- at beginning
+    if current == 0 and (encoder.char_at(current + 1) == 'Y'
+                         or encoder.string_at(current + 1, 2, 'ES', 'EP', 'EB', 'EL', 'EY', 'IB', 'IL', 'IN', 'IE',
+                                              'EI', 'ER')):
+        encoder.add('K', 'J')
+        return current + 2
+    # -ger-, -gy-
+    if (encoder.string_at(current + 1, 2, 'ER') or encoder.char_at(current + 1) == 'Y') \
+            and not encoder.string_at(0, 6, 'DANGER', 'RANGER', 'MANGER') \
+            and not encoder.string_at(current - 1, 1, 'E', 'I') \
+            and not encoder.string_at(current - 1, 3, 'RGY', 'OGY'):
+        encoder.add('K', 'J')
+        return current + 2
+    # italian e.g. 'biaggi'
+    if encoder.string_at(current + 1, 1, 'E', 'I', 'Y') or encoder.string_at(current - 1, 4, 'AGGI', 'OGGI'):
+        # obvious germanic
+        if encoder.string_at(0, 4, 'VAN ', 'VON ') or encoder.string_at(0, 3, 'SCH') \
+                or encoder.string_at(current + 1, 2, 'ET'):
+            encoder.add('K')
+        # always soft if french ending
+        elif encoder.string_at(current + 1, 4, 'IER '):
+            encoder.add('J')
+        else:
+            encoder.add('J', 'K')
+        return current + 2
+    encoder.add('K')
+    return current + 2 if encoder.char_at(current + 1) == 'G' else current + 1
+
+
+def _encode_j(encoder: _Encoder, current: int) -> int:
+    # obvious spanish, 'jose', 'san jacinto'
+    if encoder.string_at(current, 4, 'JOSE') or encoder.string_at(0, 4, 'SAN '):
+        if (current == 0 and encoder.char_at(current + 4) == ' ') or encoder.string_at(0, 4, 'SAN '):
+            encoder.add('H')
+        else:
+            encoder.add('J', 'H')
+        return current + 1
+    if current == 0 and not encoder.string_at(current, 4, 'JOSE'):
+        # Yankelovich/Jankelowicz
+        encoder.add('J', 'A')
+    # spanish pron. of e.g. 'bajador'
+    elif encoder.is_vowel(current - 1) and not encoder.slavo_germanic \
+            and encoder.char_at(current + 1) in ('A', 'O'):
+        encoder.add('J', 'H')
+    elif current == encoder.last:
+        encoder.add('J', '')
+    elif not encoder.string_at(current + 1, 1, 'L', 'T', 'K', 'S', 'N', 'M', 'B', 'Z') \
+            and not encoder.string_at(current - 1, 1, 'S', 'K', 'L'):
+        encoder.add('J')
+    return current + 2 if encoder.char_at(current + 1) == 'J' else current + 1
+
+
+def _encode_l(encoder: _Encoder, current: int) -> int:
+    if encoder.char_at(current + 1) == 'L':
+        # spanish e.g. 'cabrillo', 'gallegos'
+        if (current == encoder.length - 3 and encoder.string_at(current - 1, 4, 'ILLO', 'ILLA', 'ALLE')) \
+                or ((encoder.string_at(encoder.last - 1, 2, 'AS', 'OS') or encoder.string_at(encoder.last, 1, 'A', 'O'))
+                    and encoder.string_at(current - 1, 4, 'ALLE')):
+            encoder.add('L', '')
+            return current + 2
+        encoder.add('L')
+        return current + 2
+    encoder.add('L')
+    return current + 1
+
+
+def _encode_s(encoder: _Encoder, current: int) -> int:
+    # special cases 'island', 'isle', 'carlisle', 'carlysle'
+    if encoder.string_at(current - 1, 3, 'ISL', 'YSL'):
+        return current + 1
+    # special case 'sugar-'
+    if current == 0 and encoder.string_at(current, 5, 'SUGAR'):
+        encoder.add('X', 'S')
+        return current + 1
+    if encoder.string_at(current, 2, 'SH'):
+        # germanic
+        if encoder.string_at(current + 1, 4, 'HEIM', 'HOEK', 'HOLM', 'HOLZ'):
+            encoder.add('S')
+        else:
+            encoder.add('X')
+        return current + 2
+    # italian & armenian
+    if encoder.string_at(current, 3, 'SIO', 'SIA') or encoder.string_at(current, 4, 'SIAN'):
+        if not encoder.slavo_germanic:
+            encoder.add('S', 'X')
+        else:
+            encoder.add('S')
+        return current + 3
+    # german & anglicisations, e.g. 'smith' match 'schmidt', 'snider' match 'schneider'
+    # also, -sz- in slavic language although in hungarian it is pronounced 's'
+    if (current == 0 and encoder.string_at(current + 1, 1, 'M', 'N', 'L', 'W')) \
+            or encoder.string_at(current + 1, 1, 'Z'):
+        encoder.add('S', 'X')
+        return current + 2 if encoder.string_at(current + 1, 1, 'Z') else current + 1
+    if encoder.string_at(current, 2, 'SC'):
+        # Schlesinger's rule
+        if encoder.char_at(current + 2) == 'H':
+            # dutch origin, e.g. 'school', 'schooner'
+            if encoder.string_at(current + 3, 2, 'OO', 'ER', 'EN', 'UY', 'ED', 'EM'):
+                # 'schermerhorn', 'schenker'
+                if encoder.string_at(current + 3, 2, 'ER', 'EN'):
+                    encoder.add('X', 'SK')
+                else:
+                    encoder.add('SK')
+                return current + 3
+            if current == 0 and not encoder.is_vowel(3) and encoder.char_at(3) != 'W':
+                encoder.add('X', 'S')
+            else:
+                encoder.add('X')
+            return current + 3
+        if encoder.string_at(current + 2, 1, 'I', 'E', 'Y'):
+            encoder.add('S')
+            return current + 3
+        encoder.add('SK')
+        return current + 3
+    # french e.g. 'resnais', 'artois'
+    if current == encoder.last and encoder.string_at(current - 2, 2, 'AI', 'OI'):
+        encoder.add('', 'S')
+    else:
+        encoder.add('S')
+    return current + 2 if encoder.string_at(current + 1, 1, 'S', 'Z') else current + 1
+
+
+def _encode_t(encoder: _Encoder, current: int) -> int:
+    if encoder.string_at(current, 4, 'TION') or encoder.string_at(current, 3, 'TIA', 'TCH'):
+        encoder.add('X')
+        return current + 3
+    if encoder.string_at(current, 2, 'TH') or encoder.string_at(current, 3, 'TTH'):
+        # special case 'thomas', 'thames' or germanic
+        if encoder.string_at(current + 2, 2, 'OM', 'AM') or encoder.string_at(0, 4, 'VAN ', 'VON ') \
+                or encoder.string_at(0, 3, 'SCH'):
+            encoder.add('T')
+        else:
+            encoder.add('0', 'T')
+        return current + 2
+    encoder.add('T')
+    return current + 2 if encoder.string_at(current + 1, 1, 'T', 'D') else current + 1
+
+
+def _encode_w(encoder: _Encoder, current: int) -> int:
+    # can also be in middle of word
+    if encoder.string_at(current, 2, 'WR'):
+        encoder.add('R')
+        return current + 2
+    if current == 0 and (encoder.is_vowel(current + 1) or encoder.string_at(current, 2, 'WH')):
+        # Wasserman should match Vasserman
+        if encoder.is_vowel(current + 1):
+            encoder.add('A', 'F')
+        # need Uomo to match Womo
+        else:
+            encoder.add('A')
+    # Arnow should match Arnoff
+    if (current == encoder.last and encoder.is_vowel(current - 1)) \
+            or encoder.string_at(current - 1, 5, 'EWSKI', 'EWSKY', 'OWSKI', 'OWSKY') \
+            or encoder.string_at(0, 3, 'SCH'):
+        encoder.add('', 'F')
+        return current + 1
+    # polish e.g. 'filipowicz'
+    if encoder.string_at(current, 4, 'WICZ', 'WITZ'):
+        encoder.add('TS', 'FX')
+        return current + 4
+    return current + 1
+
+
+def _encode_x(encoder: _Encoder, current: int) -> int:
+    # french e.g. breaux
+    if not (current == encoder.last and (encoder.string_at(current - 3, 3, 'IAU', 'EAU')
+                                         or encoder.string_at(current - 2, 2, 'AU', 'OU'))):
+        encoder.add('KS')
+    return current + 2 if encoder.string_at(current + 1, 1, 'C', 'X') else current + 1
+
+
+def _encode_z(encoder: _Encoder, current: int) -> int:
+    # chinese pinyin e.g. 'zhao'
+    if encoder.char_at(current + 1) == 'H':
+        encoder.add('J')
+        return current + 2
+    if encoder.string_at(current + 1, 2, 'ZO', 'ZI', 'ZA') \
+            or (encoder.slavo_germanic and current > 0 and encoder.char_at(current - 1) != 'T'):
+        encoder.add('S', 'TS')
+    else:
+        encoder.add('S')
+    return current + 2 if encoder.char_at(current + 1) == 'Z' else current + 1
+
+
+def _encode_character(encoder: _Encoder, current: int) -> int:
+    character = encoder.char_at(current)
+    if character in _VOWELS:
+        # all initial vowels map to 'A'
+        if current == 0:
+            encoder.add('A')
+        return current + 1
+    if character == 'B':
+        # '-mb', e.g. 'dumb', already skipped over
+        encoder.add('P')
+        return current + 2 if encoder.char_at(current + 1) == 'B' else current + 1
+    if character == 'Ç':
+        encoder.add('S')
+        return current + 1
+    if character == 'C':
+        return _encode_c(encoder, current)
+    if character == 'D':
+        if encoder.string_at(current, 2, 'DG'):
+            # e.g. 'edge'
+            if encoder.string_at(current + 2, 1, 'I', 'E', 'Y'):
+                encoder.add('J')
+                return current + 3
+            # e.g. 'edgar'
+            encoder.add('TK')
+            return current + 2
+        encoder.add('T')
+        return current + 2 if encoder.string_at(current, 2, 'DT', 'DD') else current + 1
+    if character == 'F':
+        encoder.add('F')
+        return current + 2 if encoder.char_at(current + 1) == 'F' else current + 1
+    if character == 'G':
+        return _encode_g(encoder, current)
+    if character == 'H':
+        # only keep if first & before vowel or between 2 vowels
+        if (current == 0 or encoder.is_vowel(current - 1)) and encoder.is_vowel(current + 1):
+            encoder.add('H')
+            return current + 2
+        return current + 1
+    if character == 'J':
+        return _encode_j(encoder, current)
+    if character == 'K':
+        encoder.add('K')
+        return current + 2 if encoder.char_at(current + 1) == 'K' else current + 1
+    if character == 'L':
+        return _encode_l(encoder, current)
+    if character == 'M':
+        encoder.add('M')
+        if (encoder.string_at(current - 1, 3, 'UMB')
+                and (current + 1 == encoder.last or encoder.string_at(current + 2, 2, 'ER'))) \
+                or encoder.char_at(current + 1) == 'M':
+            return current + 2
+        return current + 1
+    if character == 'N':
+        encoder.add('N')
+        return current + 2 if encoder.char_at(current + 1) == 'N' else current + 1
+    if character == 'Ñ':
+        encoder.add('N')
+        return current + 1
+    if character == 'P':
+        if encoder.char_at(current + 1) == 'H':
+            encoder.add('F')
+            return current + 2
+        # also account for 'campbell', 'raspberry'
+        encoder.add('P')
+        return current + 2 if encoder.string_at(current + 1, 1, 'P', 'B') else current + 1
+    if character == 'Q':
+        encoder.add('K')
+        return current + 2 if encoder.char_at(current + 1) == 'Q' else current + 1
+    if character == 'R':
+        # french e.g. 'rogier', but exclude 'hochmeier'
+        if current == encoder.last and not encoder.slavo_germanic and encoder.string_at(current - 2, 2, 'IE') \
+                and not encoder.string_at(current - 4, 2, 'ME', 'MA'):
+            encoder.add('', 'R')
+        else:
+            encoder.add('R')
+        return current + 2 if encoder.char_at(current + 1) == 'R' else current + 1
+    if character == 'S':
+        return _encode_s(encoder, current)
+    if character == 'T':
+        return _encode_t(encoder, current)
+    if character == 'V':
+        encoder.add('F')
+        return current + 2 if encoder.char_at(current + 1) == 'V' else current + 1
+    if character == 'W':
+        return _encode_w(encoder, current)
+    if character == 'X':
+        return _encode_x(encoder, current)
+    if character == 'Z':
+        return _encode_z(encoder, current)
+    # spaces, hyphens, apostrophes and other characters are not encoded
+    return current + 1
+
+
+@lru_cache(maxsize=65536)
+def double_metaphone(word: str, max_length: int = MAX_KEY_LENGTH) -> Tuple[str, str]:
+    """
+    Returns the primary and the alternate Double Metaphone keys of a word. The keys are
+    empty when the word has no letters.
+
+    :param word: The word to encode.
+    :type word: str
+    :param max_length: The maximum length of the keys. Longer keys tell long words apart.
+    :type max_length: int
+    :return: The primary and the alternate phonetic keys.
+    :rtype: Tuple[str, str]
+    """
+    word = unicodedata.normalize('NFC', str(word)).upper().strip()
+    encoder = _Encoder(word, max_length)
+    current = 0
+    # skip these when at start of word
+    if encoder.string_at(0, 2, *_SILENT_STARTS):
+        current = 1
+    # initial 'X' is pronounced 'Z' e.g. 'xavier'
+    if encoder.char_at(0) == 'X':
+        encoder.add('S')
+        current = 1
+    while current < encoder.length and not encoder.complete():
+        current = _encode_character(encoder, current)
+    return encoder.keys()
+
+
+##################################################################################
+# vowel sounds
+#
+# The vowel sounds are approximated from the vowel spellings of a word. A single
+# vowel is short, unless it ends the word or is followed by one consonant and a
+# silent final e. A vowel that is followed by an r, which is not followed by a
+# vowel, is r-controlled. The short and r-controlled vowels of the unstressed
+# syllables after the first syllable are reduced, as in better and bettor.
+##################################################################################
+_VOWEL_LETTERS = frozenset('aeiouy')
+
+_SHORT_VOWELS = {'a': 'A', 'e': 'E', 'i': 'I', 'o': 'O', 'u': 'U', 'y': 'I'}
+_LONG_VOWELS = {'a': 'EY', 'e': 'IY', 'i': 'AY', 'o': 'OW', 'u': 'UW', 'y': 'AY'}
+_VOWEL_SPELLINGS = {'ai': 'EY', 'ay': 'EY', 'ae': 'EY', 'ei': 'EY', 'ey': 'EY', 'eigh': 'EY', 'aigh': 'EY',
+                    'ee': 'IY', 'ea': 'IY', 'ie': 'IY',
+                    'igh': 'AY', 'uy': 'AY', 'ye': 'AY',
+                    'oa': 'OW', 'oe': 'OW', 'ow': 'OW',
+                    'oo': 'UW', 'ue': 'UW', 'ui': 'UW', 'ew': 'UW', 'eu': 'UW',
+                    'ou': 'AW', 'ough': 'OUGH',
+                    'oi': 'OY', 'oy': 'OY',
+                    'au': 'AO', 'aw': 'AO'}
+_R_CONTROLLED_VOWELS = {'a': 'AR', 'e': 'ER', 'i': 'ER', 'o': 'OR', 'u': 'ER', 'y': 'ER',
+                        'ai': 'AIR', 'ei': 'AIR', 'ea': 'ER', 'ee': 'IR', 'ie': 'IR',
+                        'oa': 'OR', 'oo': 'OR', 'ou': 'AWR'}
+# r-controlled vowels followed by a silent final e, e.g. care, here, fire, more and pure
+_R_CONTROLLED_LONG_VOWELS = {'a': 'AIR', 'e': 'IR', 'i': 'AYR', 'o': 'OR', 'u': 'UR', 'y': 'AYR'}
+# the reduced vowels of the unstressed syllables
+_REDUCED_VOWELS = {'A': 'AH', 'E': 'AH', 'I': 'AH', 'O': 'AH', 'U': 'AH', 'AR': 'ER', 'OR': 'ER'}
+
+
+def _vowel_sound(spelling: str, r_controlled: bool, long: bool, word_end: bool, first: bool) -> str:
+    if r_controlled:
+        if long and spelling in _R_CONTROLLED_LONG_VOWELS:
+            return _R_CONTROLLED_LONG_VOWELS[spelling]
+        if spelling == 'ea' and word_end:
+            # hear and fear, but heard and learn
+            return 'IR'
+        return _R_CONTROLLED_VOWELS.get(spelling, spelling.upper() + 'R')
+    if word_end and not first and spelling in {'y', 'ey', 'ie'}:
+        # the final vowel of happy, monkey and cookie
+        return 'IY'
+    if word_end and first and spelling == 'ie':
+        # pie and tie
+        return 'AY'
+    if spelling in _VOWEL_SPELLINGS:
+        return _VOWEL_SPELLINGS[spelling]
+    if len(spelling) == 1:
+        return _LONG_VOWELS[spelling] if long else _SHORT_VOWELS[spelling]
+    return spelling.upper()
+
+@lru_cache(maxsize=65536)
+def vowel_sounds(word: str) -> Tuple[str, ...]:
+    """
+    Returns the approximate vowel sounds of a word, one for every syllable, from the
+    spelling of its vowels. Words that sound alike usually have the same vowel sounds.
+
+    :param word: The word to encode.
+    :type word: str
+    :return: The vowel sounds, e.g. ('AY',) for night.
+    :rtype: Tuple[str, ...]
+    """
+    letters = ''.join(character for character in unicodedata.normalize('NFC', str(word)).lower()
+                      if character.isalpha())
+    # the plural s does not change the vowels
+    if len(letters) > 3 and letters.endswith('s') and letters[-2] not in 'su':
+        letters = letters[:-1]
+    # the past tense ed is not a syllable after other letters than t and d, e.g. in fined and brayed
+    if len(letters) > 3 and letters.endswith('ed') and letters[-3] not in 'td':
+        letters = letters[:-2] if letters[-3] in _VOWEL_LETTERS else letters[:-1]
+    # a final le after a consonant is a syllable of its own, e.g. in able and meddle
+    syllabic_le = len(letters) > 3 and letters.endswith('le') and letters[-3] not in _VOWEL_LETTERS
+    if syllabic_le:
+        letters = letters[:-2]
+    # a final e after a consonant is silent, e.g. in nite, horse and hire
+    silent_e = len(letters) > 2 and letters[-1] == 'e' and letters[-2] not in _VOWEL_LETTERS \
+        and any(letter in _VOWEL_LETTERS for letter in letters[:-2])
+    if silent_e:
+        letters = letters[:-1]
+    sounds = []
+    position = 1 if letters[:1] == 'y' else 0
+    while position < len(letters):
+        if letters[position] not in _VOWEL_LETTERS:
+            position += 1
+            continue
+        end = position
+        while end < len(letters) and letters[end] in _VOWEL_LETTERS:
+            end += 1
+        spelling = letters[position:end]
+        if letters.startswith('gh', end) and spelling in {'i', 'ei', 'ai', 'ou'}:
+            spelling, end = spelling + 'gh', end + 2
+        elif end < len(letters) and letters[end] == 'w' and spelling in {'o', 'e', 'a'}:
+            spelling, end = spelling + 'w', end + 1
+        elif spelling == 'a' and letters[end:end + 2] in {'ll', 'lk'}:
+            # all, ball and walk
+            spelling = 'aw'
+        elif spelling == 'i' and letters[end:] == 'nd' and not silent_e:
+            # find, kind and mind
+            spelling = 'igh'
+        r_controlled = end < len(letters) and letters[end] == 'r' and \
+            (end + 1 == len(letters) or letters[end + 1] not in _VOWEL_LETTERS)
+        if r_controlled:
+            long = silent_e and end + 1 == len(letters)
+            word_end = end + 1 == len(letters) and not silent_e
+            end += 1
+        else:
+            long = (silent_e and end == len(letters) - 1) or (end == len(letters) and not silent_e)
+            word_end = end == len(letters) and not silent_e
+        sound = _vowel_sound(spelling, r_controlled, long, word_end, first=not sounds)
+        sounds.append(_REDUCED_VOWELS.get(sound, sound) if sounds else sound)
+        position = end
+    if syllabic_le:
+        sounds.append('AH')
+    return tuple(sounds)
+
+
+##################################################################################
+# consonant voicing
+#
+# Double Metaphone encodes voiced and voiceless consonants alike, e.g. d and t
+# or g and k. The voicing of the stops and the fricatives of a word separates
+# words such as pig and pick or provided and profited. An s, a soft c and an x are left out,
+# because their voicing cannot be told from the spelling, e.g. in rose and rows.
+##################################################################################
+_VOICED_CONSONANTS = frozenset('bdgjvz')
+_VOICELESS_CONSONANTS = frozenset('fkpqt')
+
+
+@lru_cache(maxsize=65536)
+def consonant_voicing(word: str) -> str:
+    """
+    Returns the voicing of the stops and the fricatives of a word, one letter per sound: 'V'
+    for voiced and 'U' for voiceless. A doubled consonant is one sound.
+
+    :param word: The word to encode.
+    :type word: str
+    :return: The voicing of the stops and the fricatives.
+    :rtype: str
+    """
+    letters = ''.join(character for character in unicodedata.normalize('NFC', str(word)).lower()
+                      if character.isalpha())
+    if letters[:2] in {'kn', 'gn', 'pn', 'ps', 'wr'}:
+        letters = letters[1:]
+    # the silent gh of night, the silent g of feign and the silent b of lamb
+    letters = letters.replace('gh', '')
+    letters = ''.join(letter for position, letter in enumerate(letters)
+                      if not (letter == 'g' and letters[position + 1:position + 2] == 'n'
+                              and letters[position + 2:position + 3] not in _VOWEL_LETTERS))
+    if letters.endswith('mb'):
+        letters = letters[:-1]
+    # the past tense ed is a d after a voiced letter and a t after a voiceless letter
+    if len(letters) > 3 and letters.endswith('ed') and letters[-3] not in 'td':
+        letters = letters[:-2] + ('t' if letters[-3] in _VOICELESS_CONSONANTS or letters[-3] in 'csx' else 'd')
+    voicing = []
+    for position, letter in enumerate(letters):
+        if letter == letters[position - 1:position]:
+            continue
+        if letter == 'c':
+            # a hard c is a k, a soft c is an s, and the ck of kick is one k
+            if letters[position + 1:position + 2] not in {'e', 'i', 'y', 'k'}:
+                voicing.append('U')
+        elif letter in _VOICED_CONSONANTS:
+            voicing.append('V')
+        elif letter in _VOICELESS_CONSONANTS:
+            voicing.append('U')
+    return ''.join(voicing)
@@ -0,0 +1,292 @@
+#!/usr/bin/env python3
+
+"""
+This Python module provides a sampling profiler for the WordHoard lookup pipelines.
+The stacks of all threads are sampled at a fixed interval, and the wall clock and CPU
+time between two samples are attributed to the sampled stacks. The profile is written
+in the collapsed stack format, which is read by flamegraph.pl, speedscope and inferno,
+and it is summarized by pipeline stage: fetch, parse, cloudflare, cleansing and caching.
+
+Usage Examples
+----------
+>>> import wordhoard
+>>> with wordhoard.profile('synonyms.folded') as profiler:
+...     wordhoard.Synonyms('mother').find_synonyms()
+>>> profiler.stage_summary()
+
+Setting the environment variable WORDHOARD_PROFILE to a file path profiles the whole
+process and writes the profile when the process exits. WORDHOARD_PROFILE_CLOCK selects
+the clock of the written profile, which is wall (the default) or cpu.
+"""
+__author__ = 'John Bumgarner'
+__date__ = 'October 19, 2026'
+__status__ = 'Production'
+__license__ = 'MIT'
+__copyright__ = "Copyright (C) 2026 John Bumgarner"
+
+##################################################################################
+# “AS-IS” Clause
+#
+# Except as represented in this agreement, all work produced by Developer is
+# provided “AS IS”. Other than as provided in this agreement, Developer makes no
+# other warranties, express or implied, and hereby disclaims all implied warranties,
+# including any warranty of merchantability and warranty of fitness for a particular
+# purpose.
+##################################################################################
+
+##################################################################################
+# Date Completed: October 19, 2026
+# Author: John Bumgarner
+#
+# Date Last Revised:
+# Revised by:
+##################################################################################
+
+##################################################################################
+# Python imports required for basic operations
+##################################################################################
+# Standard library imports
+import os
+import sys
+import time
+import atexit
+import logging
+import threading
+from contextlib import contextmanager
+from types import FrameType
+from typing import Dict, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# The pipeline stage of the innermost WordHoard frame of a stack, by module
+_MODULE_STAGES: Dict[str, str] = {'wordhoard.utilities.request_html': 'fetch',
+                                  'wordhoard.utilities.transport': 'fetch',
+                                  'wordhoard.utilities.http_cache': 'fetch',
+                                  'wordhoard.utilities.cloudflare_checker': 'cloudflare',
+                                  'wordhoard.utilities.cloudflare_bypass': 'cloudflare',
+                                  'wordhoard.utilities.protection_detector': 'cloudflare',
+                                  'wordhoard.utilities.cleansing': 'cleansing',
+                                  'wordhoard.utilities.caching': 'caching'}
+
+# The pipeline stage of the innermost WordHoard frame of a stack, by function name prefix
+_FUNCTION_STAGES: Tuple[Tuple[str, str], ...] = (('ParseWords.', 'parse'),
+                                                 ('PartOfSpeech.', 'parse'),
+                                                 ('SoupParser.', 'parse'),
+                                                 ('make_soup', 'parse'),
+                                                 ('_request_http_response', 'fetch'))
+
+_PROFILER_MODULES = {__name__, 'wordhoard.utilities.tracing'}
+
+
+def _frame_label(frame: FrameType) -> str:
+    code = frame.f_code
+    function_name = getattr(code, 'co_qualname', code.co_name)
+    return f"{frame.f_globals.get('__name__', '?')}.{function_name}"
+
+
+def _stage_of(frames: List[FrameType]) -> str:
+    """
+    Returns the pipeline stage of the innermost WordHoard frame of a stack,
+    which is ordered from the innermost to the outermost frame.
+    """
+    for frame in frames:
+        module_name = frame.f_globals.get('__name__', '')
+        if not module_name.startswith('wordhoard'):
+            continue
+        function_name = getattr(frame.f_code, 'co_qualname', frame.f_code.co_name)
+        for prefix, stage in _FUNCTION_STAGES:
+            if function_name.startswith(prefix):
+                return stage
+        if module_name in _MODULE_STAGES:
+            return _MODULE_STAGES[module_name]
+        if module_name not in _PROFILER_MODULES:
+            return 'other'
+    return 'other'
+
+
+def _thread_cpu_time(thread_id: int) -> Optional[float]:
+    try:
+        return time.clock_gettime(time.pthread_getcpuclockid(thread_id))
+    except (AttributeError, OSError):
+        # the clock is not available on this platform or the thread has exited
+        return None
+
+
+class SamplingProfiler:
+    """
+        A profiler that samples the stacks of all threads at a fixed interval.
+
+        Parameters
+        ----------
+        output : Optional[str]
+            The path of the collapsed stack file written when the profiler stops.
+        clock : str, optional
+            The time written to the collapsed stack file: 'wall' or 'cpu'. Default is 'wall'.
+        interval : float, optional
+            The sampling interval in seconds. Default is 0.005.
+        all_stacks : bool, optional
+            Also records the stacks without a WordHoard frame. Default is False.
+
+        Attributes
+        ----------
+        samples : int
+            The number of samples taken.
+
+        Methods
+        -------
+        start() -> None:
+            Starts sampling in a background thread.
+        stop() -> None:
+            Stops sampling and writes the collapsed stack file.
+        collapsed_stacks(clock: str = 'wall') -> Dict[str, float]:
+            Returns the seconds attributed to every sampled stack.
+        stage_summary() -> Dict[str, Dict[str, float]]:
+            Returns the wall clock and CPU seconds of every pipeline stage.
+        write(path: str, clock: str = 'wall') -> None:
+            Writes the profile in the collapsed stack format.
+    """
+
+    def __init__(self,
+                 output: Optional[str] = None,
+                 clock: str = 'wall',
+                 interval: float = 0.005,
+                 all_stacks: bool = False):
+        if clock not in {'wall', 'cpu'}:
+            raise ValueError(f'Unknown profiling clock: {clock}. Acceptable clocks: wall or cpu.')
+        self._output = output
+        self._clock = clock
+        self._interval = interval
+        self._all_stacks = all_stacks
+        self._stop_event = threading.Event()
+        self._sampler: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._wall_stacks: Dict[str, float] = {}
+        self._cpu_stacks: Dict[str, float] = {}
+        self._stages: Dict[str, Dict[str, float]] = {}
+        self._last_cpu_times: Dict[int, float] = {}
+        self.samples = 0
+
+    def start(self) -> None:
+        if self._sampler is not None:
+            return
+        self._stop_event.clear()
+        self._sampler = threading.Thread(target=self._sample_until_stopped, name='wordhoard-profiler', daemon=True)
+        self._sampler.start()
+
+    def stop(self) -> None:
+        if self._sampler is None:
+            return
+        self._stop_event.set()
+        self._sampler.join()
+        self._sampler = None
+        if self._output:
+            self.write(self._output, clock=self._clock)
+
+    def _sample_until_stopped(self) -> None:
+        sampler_id = threading.get_ident()
+        last_sample = time.perf_counter()
+        while not self._stop_event.wait(self._interval):
+            now = time.perf_counter()
+            self._take_sample(sampler_id, now - last_sample)
+            last_sample = now
+
+    def _take_sample(self, sampler_id: int, wall_seconds: float) -> None:
+        with self._lock:
+            self.samples += 1
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == sampler_id:
+                    continue
+                frames: List[FrameType] = []
+                while frame is not None:
+                    frames.append(frame)
+                    frame = frame.f_back
+                cpu_time = _thread_cpu_time(thread_id)
+                previous_cpu_time = self._last_cpu_times.get(thread_id, cpu_time)
+                cpu_seconds = max(cpu_time - previous_cpu_time, 0.0) if cpu_time is not None else 0.0
+                if cpu_time is not None:
+                    self._last_cpu_times[thread_id] = cpu_time
+                if not self._all_stacks and not any(frame.f_globals.get('__name__', '').startswith('wordhoard.')
+                                                    for frame in frames):
+                    continue
+                stack = ';'.join(_frame_label(frame) for frame in reversed(frames))
+                self._wall_stacks[stack] = self._wall_stacks.get(stack, 0.0) + wall_seconds
+                self._cpu_stacks[stack] = self._cpu_stacks.get(stack, 0.0) + cpu_seconds
+                stage = self._stages.setdefault(_stage_of(frames), {'wall': 0.0, 'cpu': 0.0})
+                stage['wall'] += wall_seconds
+                stage['cpu'] += cpu_seconds
+
+    def collapsed_stacks(self, clock: str = 'wall') -> Dict[str, float]:
+        with self._lock:
+            return dict(self._wall_stacks if clock == 'wall' else self._cpu_stacks)
+
+    def stage_summary(self) -> Dict[str, Dict[str, float]]:
+        with self._lock:
+            return {stage: dict(times) for stage, times in sorted(self._stages.items())}
+
+    def write(self, path: str, clock: str = 'wall') -> None:
+        """
+        Writes the profile in the collapsed stack format. Every line holds a stack, with the
+        frames separated by semicolons, and the microseconds attributed to the stack.
+
+        :param path: The path of the collapsed stack file.
+        :type path: str
+        :param clock: 'wall' or 'cpu'
+        :type clock: str
+        :return: None
+        """
+        lines = [f'{stack} {round(seconds * 1_000_000)}'
+                 for stack, seconds in sorted(self.collapsed_stacks(clock).items())
+                 if round(seconds * 1_000_000) > 0]
+        with open(file=path, mode='w', encoding='utf-8') as outfile:
+            outfile.write('\n'.join(lines) + '\n' if lines else '')
+        logger.info(f'The WordHoard profile ({self.samples} samples) was written to {path}.')
+        for stage, times in self.stage_summary().items():
+            logger.info(f"Profiled stage {stage}: {times['wall']:.3f}s wall clock, {times['cpu']:.3f}s CPU")
+
+
+@contextmanager
+def profile(output: Optional[str] = None,
+            clock: str = 'wall',
+            interval: float = 0.005,
+            all_stacks: bool = False) -> Iterator[SamplingProfiler]:
+    """
+    Profiles the block with a SamplingProfiler and writes the collapsed stack file when the block exits.
+
+    :param output: The path of the collapsed stack file.
+    :type output: Optional[str]
+    :param clock: The time written to the collapsed stack file: 'wall' or 'cpu'.
+    :type clock: str
+    :param interval: The sampling interval in seconds.
+    :type interval: float
+    :param all_stacks: Also records the stacks without a WordHoard frame.
+    :type all_stacks: bool
+    :return: The profiler, which provides the stage summary after the block.
+    :rtype: Iterator[SamplingProfiler]
+    """
+    profiler = SamplingProfiler(output=output, clock=clock, interval=interval, all_stacks=all_stacks)
+    profiler.start()
+    try:
+        yield profiler
+    finally:
+        profiler.stop()
+
+
+def profile_from_environment() -> Optional[SamplingProfiler]:
+    """
+    Starts profiling the process when the environment variable WORDHOARD_PROFILE is set.
+    The profile is written to the path in WORDHOARD_PROFILE when the process exits.
+
+    :return: The started profiler or None
+    :rtype: Optional[SamplingProfiler]
+    """
+    output = os.environ.get('WORDHOARD_PROFILE')
+    if not output:
+        return None
+    try:
+        profiler = SamplingProfiler(output=output, clock=os.environ.get('WORDHOARD_PROFILE_CLOCK', 'wall'))
+    except ValueError as error:
+        logger.error(f'The WordHoard profiler was not started: {error}')
+        return None
+    profiler.start()
+    atexit.register(profiler.stop)
+    return profiler
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+
+"""
+This Python module classifies the HTTP responses of the online repositories before they
+are parsed. A response is either a normal page, a Cloudflare challenge, a captcha or a
+rate limit. The classification uses the status code, the headers and a bounded scan of
+the first bytes of the body, so no BeautifulSoup object is built for a challenge page
+and a normal page is not searched once per protection marker.
+"""
+__author__ = 'John Bumgarner'
+__date__ = 'October 19, 2026'
+__status__ = 'Production'
+__license__ = 'MIT'
+__copyright__ = "Copyright (C) 2026 John Bumgarner"
+
+##################################################################################
+# “AS-IS” Clause
+#
+# Except as represented in this agreement, all work produced by Developer is
+# provided “AS IS”. Other than as provided in this agreement, Developer makes no
+# other warranties, express or implied, and hereby disclaims all implied warranties,
+# including any warranty of merchantability and warranty of fitness for a particular
+# purpose.
+##################################################################################
+
+##################################################################################
+# Date Completed: October 19, 2026
+# Author: John Bumgarner
+#
+# Date Last Revised:
+# Revised by:
+##################################################################################
+
+##################################################################################
+# Python imports required for basic operations
+##################################################################################
+# Standard library imports
+import re as regex
+import logging
+from typing import Mapping, Union
+
+# Third-party imports
+import requests
+
+# Local or project-specific imports
+from wordhoard.utilities import metrics, tracing
+
+logger = logging.getLogger(__name__)
+
+# The classifications of a response
+OK = 'ok'
+CLOUDFLARE = 'cloudflare'
+CAPTCHA = 'captcha'
+RATE_LIMITED = 'rate_limited'
+
+# The number of bytes at the start of the body that are scanned for protection markers
+SCAN_BYTES = 32768
+
+# The markers of a Cloudflare challenge page
+_CLOUDFLARE_MARKERS = regex.compile(rb'data-translate=["\']why_captcha_detail["\']'
+                                    rb'|id=["\']challenge-body-text["\']'
+                                    rb'|id=["\']captcha-bypass["\']'
+                                    rb'|<title>\s*(?:Please Wait\.\.\. \| Cloudflare'
+                                    rb'|Just a moment\.\.\.'
+                                    rb'|Attention Required! \| Cloudflare)')
+
+# The markers of a captcha page
+_CAPTCHA_MARKERS = regex.compile(rb'id=["\']px-captcha["\']'
+                                 rb'|<title>\s*Are you a robot\?'
+                                 rb"|We've detected unusual activity from your computer network")
+
+
+def classify_response(status_code: int,
+                      headers: Mapping[str, str],
+                      body: Union[bytes, str]) -> str:
+    """
+    Classifies a response from its status code, its headers and the first SCAN_BYTES bytes of its body.
+
+    :param status_code: The HTTP status code of the response.
+    :type status_code: int
+    :param headers: The headers of the response, with case-insensitive keys.
+    :type headers: Mapping[str, str]
+    :param body: The body of the response.
+    :type body: Union[bytes, str]
+    :return: ok, cloudflare, captcha or rate_limited
+    :rtype: str
+    """
+    if status_code == 429:
+        return RATE_LIMITED
+    if headers.get('cf-mitigated', '').lower() == 'challenge':
+        return CLOUDFLARE
+    head = body[:SCAN_BYTES]
+    if isinstance(head, str):
+        head = head.encode('utf-8', errors='ignore')
+    if _CLOUDFLARE_MARKERS.search(head):
+        return CLOUDFLARE
+    if _CAPTCHA_MARKERS.search(head):
+        return CAPTCHA
+    return OK
+
+@tracing.traced()
+def detect_protection(response: requests.models.Response) -> str:
+    """
+    Classifies the response of an online repository and records a protected response
+    in the WordHoard metrics.
+
+    :param response: The response of the online repository.
+    :type response: requests.models.Response
+    :return: ok, cloudflare, captcha or rate_limited
+    :rtype: str
+    """
+    protection = classify_response(response.status_code, response.headers, response.content)
+    if protection == CLOUDFLARE:
+        metrics.record_cloudflare_detection(response.url)
+    elif protection != OK:
+        logger.error(f'The response of {response.url} was identified as a {protection} page.')
+        metrics.record_protected_response(response.url, protection)
+    return protection
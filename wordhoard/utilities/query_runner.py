@@ -0,0 +1,301 @@
+#!/usr/bin/env python3
+
+"""
+This Python module runs the queries of the online repositories of a relation class in
+parallel. By default every query is awaited. A deadline, a quorum of repositories that agree
+on a result or a minimum number of results lets the caller return before the slowest
+repository has answered.
+The queries that are still running continue in the background and update the cache when
+they finish. The results can also be streamed, source by source, as the queries finish.
+"""
+__author__ = 'John Bumgarner'
+__date__ = 'October 19, 2026'
+__status__ = 'Production'
+__license__ = 'MIT'
+__copyright__ = "Copyright (C) 2026 John Bumgarner"
+
+##################################################################################
+# “AS-IS” Clause
+#
+# Except as represented in this agreement, all work produced by Developer is
+# provided “AS IS”. Other than as provided in this agreement, Developer makes no
+# other warranties, express or implied, and hereby disclaims all implied warranties,
+# including any warranty of merchantability and warranty of fitness for a particular
+# purpose.
+##################################################################################
+
+##################################################################################
+# Date Completed: October 19, 2026
+# Author: John Bumgarner
+#
+# Date Last Revised:
+# Revised by:
+##################################################################################
+
+##################################################################################
+# Python imports required for basic operations
+##################################################################################
+# Standard library imports
+import time
+import asyncio
+import logging
+import traceback
+import contextvars
+from collections import Counter
+from concurrent.futures.thread import BrokenThreadPool
+from concurrent.futures import ThreadPoolExecutor, as_completed, BrokenExecutor
+from concurrent.futures import TimeoutError as FuturesTimeoutError
+from typing import Any, AsyncIterator, Callable, Dict, Generator, Iterator, List, NamedTuple, Optional, Set, Tuple
+
+# Local or project-specific imports
+from wordhoard.utilities.colorized_text import colorized_text
+
+logger = logging.getLogger(__name__)
+
+
+def validate_limits(deadline: Optional[float] = None,
+                    quorum: Optional[int] = None,
+                    min_results: Optional[int] = None) -> None:
+    """
+    Validates the limits of a multi-source query.
+
+    :param deadline: The seconds after which the finished queries are returned.
+    :type deadline: Optional[float]
+    :param quorum: The number of repositories that agree on a result after which the results are returned.
+    :type quorum: Optional[int]
+    :param min_results: The number of distinct results after which they are returned.
+    :type min_results: Optional[int]
+    :return: None
+    :raises ValueError: When a limit is not positive.
+    """
+    if deadline is not None and deadline <= 0:
+        raise ValueError(f'The deadline must be a positive number of seconds, not {deadline}.')
+    if quorum is not None and quorum < 1:
+        raise ValueError(f'The quorum must be a positive number of sources, not {quorum}.')
+    if min_results is not None and min_results < 1:
+        raise ValueError(f'The minimum number of results must be positive, not {min_results}.')
+
+def _agreement_key(value: Any) -> Any:
+    """
+    Returns the form of a result that is compared to find the results on which sources agree.
+    """
+    return ' '.join(value.lower().split()) if isinstance(value, str) else value
+
+class StreamedResult(NamedTuple):
+    """
+        A result yielded by the streaming query functions of the relation classes.
+
+        Attributes
+        ----------
+        source : Optional[str]
+            The source of the result, or None for the merged result of all the sources.
+        output : Any
+            The output for the result, in the output format of the relation class.
+        final : bool
+            True for the merged result, which is the last yielded result.
+    """
+    source: Optional[str]
+    output: Any
+    final: bool
+
+
+def iter_query_tasks(tasks: Dict[str, Callable[[], Any]],
+                     deadline: Optional[float] = None,
+                     quorum: Optional[int] = None,
+                     min_results: Optional[int] = None,
+                     max_workers: int = 5) -> Generator[Tuple[str, Any], None, List[str]]:
+    """
+    Runs the query tasks in parallel using a ThreadPool and yields the source name and the
+    result of every task as soon as it finishes. Every task returns a tuple of results and a
+    part of speech or None. The quorum is reached when a result, compared case-insensitively,
+    was returned by that number of sources. The names of the sources that did not finish are
+    returned as the value of the generator.
+
+    :param tasks: The query tasks by source name.
+    :type tasks: Dict[str, Callable[[], Any]]
+    :param deadline: The seconds after which the finished queries are returned.
+    :type deadline: Optional[float]
+    :param quorum: The number of repositories that agree on a result after which the results are returned.
+    :type quorum: Optional[int]
+    :param min_results: The number of distinct results after which they are returned.
+    :type min_results: Optional[int]
+    :param max_workers: The number of threads.
+    :type max_workers: int
+    :return: The source name and the result of every finished task.
+    :rtype: Generator[Tuple[str, Any], None, List[str]]
+    """
+    validate_limits(deadline, quorum, min_results)
+    started = time.monotonic()
+    agreeing_sources: Counter = Counter()
+    distinct_results: Set[str] = set()
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    running_tasks = {}
+    collected_tasks = set()
+    try:
+        for source, task in tasks.items():
+            running_tasks[executor.submit(task)] = source
+        for finished_task in as_completed(running_tasks, timeout=deadline):
+            result = finished_task.result()
+            collected_tasks.add(finished_task)
+            yield running_tasks[finished_task], result
+            if result:
+                agreeing_sources.update({_agreement_key(value) for value in result[0]})
+                distinct_results.update(result[0])
+            if quorum is not None and agreeing_sources and agreeing_sources.most_common(1)[0][1] >= quorum:
+                break
+            if min_results is not None and len(distinct_results) >= min_results:
+                break
+    except FuturesTimeoutError:
+        logger.info(f'The query deadline of {deadline} seconds was reached after {time.monotonic() - started:.2f} seconds.')
+    except (BrokenExecutor, BrokenThreadPool) as error:
+        logger.error('An error occurred in the following code segment:')
+        logger.error(''.join(traceback.format_tb(error.__traceback__)))
+    finally:
+        # the queries that have not started are cancelled, and the running queries finish
+        # in the background, so their results are still added to the cache
+        for running_task in running_tasks:
+            running_task.cancel()
+        executor.shutdown(wait=False)
+    incomplete_sources = [source for running_task, source in running_tasks.items()
+                          if running_task not in collected_tasks]
+    if incomplete_sources:
+        logger.info(f"The results were returned before these sources finished: {', '.join(incomplete_sources)}")
+    return incomplete_sources
+
+def run_query_tasks(tasks: Dict[str, Callable[[], Any]],
+                    deadline: Optional[float] = None,
+                    quorum: Optional[int] = None,
+                    min_results: Optional[int] = None,
+                    max_workers: int = 5) -> Tuple[List[Any], List[str]]:
+    """
+    Runs the query tasks in parallel using a ThreadPool and waits for them. Every task
+    returns a tuple of results and a part of speech or None.
+
+    :param tasks: The query tasks by source name.
+    :type tasks: Dict[str, Callable[[], Any]]
+    :param deadline: The seconds after which the finished queries are returned.
+    :type deadline: Optional[float]
+    :param quorum: The number of repositories that agree on a result after which the results are returned.
+    :type quorum: Optional[int]
+    :param min_results: The number of distinct results after which they are returned.
+    :type min_results: Optional[int]
+    :param max_workers: The number of threads.
+    :type max_workers: int
+    :return: The results of the finished tasks and the names of the sources that did not finish.
+    :rtype: Tuple[List[Any], List[str]]
+    """
+    finished_tasks: List[Any] = []
+    stream = iter_query_tasks(tasks, deadline, quorum, min_results, max_workers)
+    while True:
+        try:
+            finished_tasks.append(next(stream)[1])
+        except StopIteration as stop:
+            return finished_tasks, stop.value
+
+def merged_query_output(query_results: List[Any],
+                        query_output: Callable[[List[str], Set[str]], Any],
+                        relation: str,
+                        word: str,
+                        normalize: Callable[[str], str] = str.strip) -> Any:
+    """
+    Merges the results of the queried sources of a relation class and builds the output for them.
+
+    :param query_results: The results of the queried sources, which are tuples of results and
+                          a part of speech or None.
+    :type query_results: List[Any]
+    :param query_output: Builds the output of the relation class from the results and the parts of speech.
+    :type query_output: Callable[[List[str], Set[str]], Any]
+    :param relation: antonyms, synonyms or definitions
+    :type relation: str
+    :param word: The queried word.
+    :type word: str
+    :param normalize: Removes the excess white space of a result.
+    :type normalize: Callable[[str], str]
+    :return: The output for the merged results or None when no source had results.
+    :rtype: Any
+    """
+    part_of_speech = {result[1] for result in query_results if result}
+    merged_results = [normalize(value) for result in query_results if result for value in result[0]]
+    if not merged_results:
+        colorized_text(text=f'No {relation} were found for the word: {word} \n'
+                            f'Please verify that the word is spelled correctly.', color='blue')
+        return None
+    return query_output(merged_results, part_of_speech)
+
+def stream_query_output(query_tasks: Callable[[], Dict[str, Callable[[], Any]]],
+                        check_cache: Callable[[], Tuple[bool, Any]],
+                        query_output: Callable[[List[str], Any], Any],
+                        merge_output: Callable[[List[Any]], Any],
+                        deadline: Optional[float] = None,
+                        quorum: Optional[int] = None,
+                        min_results: Optional[int] = None) -> Generator[StreamedResult, None, List[str]]:
+    """
+    Yields the output of every source of a relation class as soon as its query finishes,
+    followed by the merged output of all the sources. A cached word yields only the cached
+    output. The names of the sources that did not finish are returned as the value of the
+    generator.
+
+    :param query_tasks: Returns the query tasks by source name.
+    :type query_tasks: Callable[[], Dict[str, Callable[[], Any]]]
+    :param check_cache: Returns a tuple indicating whether the word is cached and the cached output.
+    :type check_cache: Callable[[], Tuple[bool, Any]]
+    :param query_output: Builds the output of the relation class from the results and the part of speech of a source.
+    :type query_output: Callable[[List[str], Any], Any]
+    :param merge_output: Builds the merged output from the results of all the sources.
+    :type merge_output: Callable[[List[Any]], Any]
+    :param deadline: The seconds after which the results of the finished sources are merged.
+    :type deadline: Optional[float]
+    :param quorum: The number of repositories that agree on a result after which the results are merged.
+    :type quorum: Optional[int]
+    :param min_results: The number of distinct results after which they are merged.
+    :type min_results: Optional[int]
+    :return: the output of every source, followed by the merged output with final set to True
+    :rtype: Generator[StreamedResult, None, List[str]]
+    """
+    cached_output = check_cache()
+    if cached_output[0] is True:
+        yield StreamedResult(source=None, output=cached_output[1], final=True)
+        return []
+    query_results = []
+    stream = iter_query_tasks(query_tasks(), deadline=deadline, quorum=quorum, min_results=min_results)
+    while True:
+        try:
+            source, query_result = next(stream)
+        except StopIteration as stop:
+            incomplete_sources = stop.value
+            break
+        query_results.append(query_result)
+        if query_result:
+            yield StreamedResult(source=source, output=query_output(query_result[0], query_result[1]), final=False)
+    merged_output = merge_output(query_results)
+    if merged_output is not None:
+        yield StreamedResult(source=None, output=merged_output, final=True)
+    return incomplete_sources
+
+async def iterate_async(stream: Iterator[Any]) -> AsyncIterator[Any]:
+    """
+    Iterates over a blocking iterator from a coroutine. Every item is retrieved in the
+    default executor of the event loop, so the event loop is not blocked.
+
+    :param stream: The blocking iterator.
+    :type stream: Iterator[Any]
+    :return: The items of the iterator.
+    :rtype: AsyncIterator[Any]
+    """
+    loop = asyncio.get_running_loop()
+    # the context holds the active trace span, which is propagated to the executor threads
+    context = contextvars.copy_context()
+    exhausted = object()
+    try:
+        while True:
+            item = await loop.run_in_executor(None, context.run, next, stream, exhausted)
+            if item is exhausted:
+                return
+            yield item
+    finally:
+        if hasattr(stream, 'close'):
+            try:
+                stream.close()
+            except ValueError:
+                # the iterator is still running in an executor thread and closes when it finishes
+                pass
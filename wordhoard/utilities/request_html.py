@@ -31,7 +31,7 @@ __copyright__ = "Copyright (C) 2020 John Bumgarner"
 # Python imports required for basic operations
 ##################################################################################
 # Standard library imports
-import sys
+import time
 import logging
 import warnings
 import traceback
@@ -40,11 +40,13 @@ from typing import Dict, Optional, Tuple
 # Third-party imports
 import requests
 from requests.adapters import Retry
-from requests.adapters import HTTPAdapter
-from urllib3.exceptions import MaxRetryError
+from urllib3.exceptions import MaxRetryError, ReadTimeoutError
 
 # Local or project-specific imports
+from wordhoard.utilities import metrics, request_policy, tracing, transport
 from wordhoard.utilities.colorized_text import colorized_text
+from wordhoard.utilities.exceptions import QueryRequestException
+from wordhoard.utilities.http_cache import HttpCache, get_http_cache
 from wordhoard.utilities.user_agents import get_random_user_agent
 
 warnings.filterwarnings('ignore', message='Unverified HTTPS request')
@@ -152,48 +154,62 @@ class Query:
 
     def _handle_exceptions(self, error):
         """
-        Helper method to handle Python Request exceptions
+        Helper method to handle Python Request exceptions. The error is logged and raised again
+        as a QueryRequestException, so the calling thread can continue with the other sources.
+
+        :raises QueryRequestException: Always, with the original error as its cause.
         """
         if isinstance(error, requests.HTTPError):
             colorized_text(text='A HTTPError has occurred.'
                                 '\nPlease review the WordHoard logs for additional information.', color='red')
             logger.error(f'A HTTPError has occurred when requesting {self._url_to_scrape}')
             logger.error(''.join(traceback.format_tb(error.__traceback__)))
-            sys.exit(1)
         elif isinstance(error, requests.URLRequired):
             logger.error(f'A URLRequired has occurred when requesting {self._url_to_scrape}')
             logger.error(''.join(traceback.format_tb(error.__traceback__)))
-            sys.exit(1)
         elif isinstance(error, requests.exceptions.ProxyError):
             colorized_text(text='A unknown type of Proxy Error has occurred.'
                                 '\nPlease verify that your proxies are working.', color='red')
             logger.error(f'A ProxyError has occurred when requesting {self._url_to_scrape}')
             logger.error(''.join(traceback.format_tb(error.__traceback__)))
-            sys.exit(1)
         elif isinstance(error, MaxRetryError):
             colorized_text(text='The max number of connection retries was exceeded.'
                                 '\nPlease review the WordHoard logs for additional information.', color='red')
             logger.error(f'A MaxRetryError has occurred when requesting {self._url_to_scrape}')
             logger.error(''.join(traceback.format_tb(error.__traceback__)))
-            sys.exit(1)
         elif isinstance(error, requests.ConnectionError):
             colorized_text(text='A ConnectionError has occurred.'
                                 '\nPlease review the WordHoard logs for additional information.', color='red')
             logger.error(f'A ConnectionError has occurred when requesting {self._url_to_scrape}')
             logger.error(''.join(traceback.format_tb(error.__traceback__)))
-            sys.exit(1)
         elif isinstance(error, requests.Timeout):
             colorized_text(text='A connection timeout has occurred.'
                            '\nPlease review the WordHoard logs for additional information.', color='red')
             logger.error(f'A Timeout has occurred when requesting {self._url_to_scrape}')
             logger.error(''.join(traceback.format_tb(error.__traceback__)))
-            sys.exit(1)
         elif isinstance(error, requests.RequestException):
             colorized_text(text='A RequestException has occurred.'
                            '\nPlease review the WordHoard logs for additional information.', color='red')
             logger.error(f'A RequestException has occurred when requesting {self._url_to_scrape}')
             logger.error(''.join(traceback.format_tb(error.__traceback__)))
-            sys.exit(1)
+        raise QueryRequestException(f'The request to {self._url_to_scrape} failed: {error}') from error
+
+    @staticmethod
+    def _is_read_timeout(error: requests.RequestException) -> bool:
+        """
+        Helper method to tell whether a request failed because the server did not answer
+        within the read timeout. When the read retries run out, requests raises a
+        ConnectionError that wraps the ReadTimeoutError of urllib3 in a MaxRetryError.
+
+        :param error: The exception raised by the request.
+        :type error: requests.RequestException
+        :return: True if the request timed out while reading the response.
+        :rtype: bool
+        """
+        if isinstance(error, requests.Timeout):
+            return True
+        reason = error.args[0] if error.args else None
+        return isinstance(reason, MaxRetryError) and isinstance(reason.reason, ReadTimeoutError)
 
     # reference: https://urllib3.readthedocs.io/en/latest/reference/urllib3.util.html#module-urllib3.util.retry
     @staticmethod
@@ -210,7 +226,7 @@ class Query:
             backoff_factor=backoff_factor,
             status_forcelist=status_forcelist,
         )
-        http_adapter = HTTPAdapter(max_retries=retry)
+        http_adapter = transport.build_adapter(max_retries=retry)
         session.mount('http://', http_adapter)
         session.mount('https://', http_adapter)
         return session
@@ -225,41 +241,52 @@ class Query:
             Returns:
                 requests.models.Response: The response object containing the HTML content of the website.
 
+            Raises:
+                QueryRequestException: When the request fails, e.g. because of a connection error or a timeout.
+
             This method performs an HTTP GET request to the specified URL, handling various scenarios such as proxy usage,
             user-agent headers, and response status codes. It logs relevant information about the request and response,
             including any encountered errors or status codes outside the norm.
         """
         response = ''
+        http_cache = get_http_cache()
+        cached_entry = http_cache.lookup(self._url_to_scrape) if http_cache is not None else None
+        if cached_entry is not None and http_cache.revalidate is False:
+            return http_cache.build_response(cached_entry)
+
+        headers = dict(http_headers) if self._user_agent is None else {'user-agent': self._user_agent}
+        headers.update(HttpCache.conditional_headers(cached_entry))
+        policy = request_policy.request_policy(self._url_to_scrape)
+        timeout = request_policy.request_timeout(self._url_to_scrape)
         try:
-            if self._proxies is None and self._user_agent is None:
-                response = self._requests_retry_session().get(self._url_to_scrape,
-                                                              headers=http_headers,
-                                                              allow_redirects=True,
-                                                              verify=True,
-                                                              timeout=(30, 45))
-
-            elif self._proxies is None and self._user_agent is not None:
-                response = self._requests_retry_session().get(self._url_to_scrape,
-                                                              headers={'user-agent': self._user_agent},
-                                                              allow_redirects=True,
-                                                              verify=True,
-                                                              timeout=(30, 45))
-
-            elif self._proxies is not None and self._user_agent is None:
-                response = self._requests_retry_session().get(self._url_to_scrape,
-                                                              headers=http_headers,
-                                                              allow_redirects=True,
-                                                              verify=True,
-                                                              timeout=(30, 45),
-                                                              proxies=self._proxies)
-
-            elif self._proxies is not None and self._user_agent is not None:
-                response = self._requests_retry_session().get(self._url_to_scrape,
-                                                              headers={'user-agent': self._user_agent},
-                                                              allow_redirects=True,
-                                                              verify=True,
-                                                              timeout=(30, 45),
-                                                              proxies=self._proxies)
+            with tracing.span('wordhoard.http_request', **{'http.url': self._url_to_scrape}) as request_span:
+                request_started = time.perf_counter()
+                try:
+                    response = self._requests_retry_session(retries=policy.retries,
+                                                            backoff_factor=policy.backoff_factor
+                                                            ).get(self._url_to_scrape,
+                                                                  headers=headers,
+                                                                  allow_redirects=True,
+                                                                  verify=True,
+                                                                  timeout=timeout,
+                                                                  proxies=self._proxies)
+                except (requests.Timeout, requests.ConnectionError) as error:
+                    # the timeout is recorded as the latency, so an adaptive timeout that is too short grows again
+                    if self._is_read_timeout(error):
+                        request_policy.record_latency(self._url_to_scrape, timeout[1])
+                    raise
+                request_seconds = time.perf_counter() - request_started
+                request_policy.record_latency(self._url_to_scrape, request_seconds)
+                metrics.record_request(self._url_to_scrape, request_seconds,
+                                       len(response.content), response.status_code)
+                request_span.set_attribute('http.status_code', response.status_code)
+
+            if http_cache is not None:
+                if response.status_code == 304 and cached_entry is not None:
+                    # the stored page is still current, so it is used in place of the empty 304 response
+                    response = http_cache.build_response(http_cache.refresh(self._url_to_scrape, response) or cached_entry)
+                elif response.status_code == 200:
+                    http_cache.store(self._url_to_scrape, response)
 
             cloudflare_protected = bool([value for (key, value) in response.headers.items()
                                          if key == 'Server'
@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+
+"""
+This Python module holds the timeout and retry policies of the HTTP requests to the online
+repositories. Every host can have its own policy, and the hosts without a policy use the
+default policy. In adaptive mode the read timeout of a host is derived from a percentile of
+its recent request latencies, so a fast repository is not given the same time to fail as a
+slow one.
+"""
+__author__ = 'John Bumgarner'
+__date__ = 'October 19, 2026'
+__status__ = 'Production'
+__license__ = 'MIT'
+__copyright__ = "Copyright (C) 2026 John Bumgarner"
+
+##################################################################################
+# “AS-IS” Clause
+#
+# Except as represented in this agreement, all work produced by Developer is
+# provided “AS IS”. Other than as provided in this agreement, Developer makes no
+# other warranties, express or implied, and hereby disclaims all implied warranties,
+# including any warranty of merchantability and warranty of fitness for a particular
+# purpose.
+##################################################################################
+
+##################################################################################
+# Date Completed: October 19, 2026
+# Author: John Bumgarner
+#
+# Date Last Revised:
+# Revised by:
+##################################################################################
+
+##################################################################################
+# Python imports required for basic operations
+##################################################################################
+# Standard library imports
+import math
+import logging
+import threading
+from collections import deque
+from urllib.parse import urlparse
+from typing import Deque, Dict, NamedTuple, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class RequestPolicy(NamedTuple):
+    """
+        The timeout and retry policy of the HTTP requests to one online repository.
+
+        Attributes
+        ----------
+        connect_timeout : float
+            The seconds to wait for the connection to the host.
+        read_timeout : float
+            The seconds to wait for the response. In adaptive mode this is the upper bound
+            of the read timeout.
+        retries : int
+            The number of retries of a failed request.
+        backoff_factor : float
+            The backoff factor between the retries.
+    """
+    connect_timeout: float
+    read_timeout: float
+    retries: int
+    backoff_factor: float
+
+
+# The policy of the hosts without a policy of their own
+DEFAULT_POLICY = RequestPolicy(connect_timeout=30.0, read_timeout=45.0, retries=5, backoff_factor=0.5)
+
+
+##################################################################################
+# module level request policies and adaptive timeout configuration
+##################################################################################
+_default_policy = DEFAULT_POLICY
+_host_policies: Dict[str, RequestPolicy] = {}
+_adaptive_enabled = False
+_adaptive_percentile = 0.95
+_adaptive_multiplier = 2.0
+_adaptive_minimum = 2.0
+_adaptive_minimum_samples = 5
+_adaptive_window = 50
+_latency_lock = threading.Lock()
+_host_latencies: Dict[str, Deque[float]] = {}
+
+def _host_of(url_or_host: str) -> str:
+    host = urlparse(url_or_host).hostname if '://' in url_or_host else url_or_host
+    return (host or '').lower()
+
+def set_request_policy(host: Optional[str] = None,
+                       connect_timeout: Optional[float] = None,
+                       read_timeout: Optional[float] = None,
+                       retries: Optional[int] = None,
+                       backoff_factor: Optional[float] = None) -> RequestPolicy:
+    """
+    Sets the timeout and retry policy of an online repository. The policy of a host also applies
+    to its subdomains, so the policy of thesaurus.com applies to www.thesaurus.com. The values that
+    are not provided are taken from the default policy.
+
+    :param host: The host name or a URL of the online repository. None sets the default policy.
+    :type host: Optional[str]
+    :param connect_timeout: The seconds to wait for the connection to the host.
+    :type connect_timeout: Optional[float]
+    :param read_timeout: The seconds to wait for the response.
+    :type read_timeout: Optional[float]
+    :param retries: The number of retries of a failed request.
+    :type retries: Optional[int]
+    :param backoff_factor: The backoff factor between the retries.
+    :type backoff_factor: Optional[float]
+    :return: The policy of the host.
+    :rtype: RequestPolicy
+    :raises ValueError: When a timeout is not positive or the retries or the backoff factor are negative.
+    """
+    global _default_policy
+    base_policy = _default_policy if host is None else _host_policies.get(_host_of(host), _default_policy)
+    policy = RequestPolicy(connect_timeout=base_policy.connect_timeout if connect_timeout is None else connect_timeout,
+                           read_timeout=base_policy.read_timeout if read_timeout is None else read_timeout,
+                           retries=base_policy.retries if retries is None else retries,
+                           backoff_factor=base_policy.backoff_factor if backoff_factor is None else backoff_factor)
+    if policy.connect_timeout <= 0 or policy.read_timeout <= 0:
+        raise ValueError('The connect and read timeouts must be positive numbers of seconds.')
+    if policy.retries < 0 or policy.backoff_factor < 0:
+        raise ValueError('The retries and the backoff factor must not be negative.')
+    if host is None:
+        _default_policy = policy
+    else:
+        _host_policies[_host_of(host)] = policy
+    return policy
+
+def reset_request_policies() -> None:
+    """
+    Restores the default policy, forgets the policies of all the hosts and their observed latencies.
+
+    :return: None
+    """
+    global _default_policy
+    _default_policy = DEFAULT_POLICY
+    _host_policies.clear()
+    with _latency_lock:
+        _host_latencies.clear()
+
+def request_policy(url: str) -> RequestPolicy:
+    """
+    Returns the policy of the host of a URL, which is the policy of the host,
+    of its closest parent domain with a policy or the default policy.
+
+    :param url: The requested URL or a host name.
+    :type url: str
+    :return: The policy of the host.
+    :rtype: RequestPolicy
+    """
+    labels = _host_of(url).split('.')
+    for index in range(len(labels)):
+        policy = _host_policies.get('.'.join(labels[index:]))
+        if policy is not None:
+            return policy
+    return _default_policy
+
+def configure_adaptive_timeouts(enabled: bool = True,
+                                percentile: float = 0.95,
+                                multiplier: float = 2.0,
+                                minimum: float = 2.0,
+                                minimum_samples: int = 5,
+                                window: int = 50) -> None:
+    """
+    Configures the adaptive read timeouts. In adaptive mode the read timeout of a host is the
+    percentile of its recent request latencies times the multiplier, bounded by the minimum
+    and by the read timeout of its policy. A host with fewer latency samples than minimum_samples
+    uses the read timeout of its policy.
+
+    :param enabled: True sets the read timeouts from the observed latencies.
+    :type enabled: bool
+    :param percentile: The latency percentile, between 0 and 1.
+    :type percentile: float
+    :param multiplier: The factor applied to the latency percentile.
+    :type multiplier: float
+    :param minimum: The lowest read timeout in seconds.
+    :type minimum: float
+    :param minimum_samples: The number of latency samples required before the read timeout adapts.
+    :type minimum_samples: int
+    :param window: The number of recent latency samples kept per host.
+    :type window: int
+    :return: None
+    :raises ValueError: When a value is out of range.
+    """
+    global _adaptive_enabled, _adaptive_percentile, _adaptive_multiplier, _adaptive_minimum
+    global _adaptive_minimum_samples, _adaptive_window
+    if not 0 < percentile <= 1 or multiplier <= 0 or minimum <= 0 or minimum_samples < 1 or window < minimum_samples:
+        raise ValueError('The percentile must be between 0 and 1, the multiplier and the minimum must be positive '
+                         'and the window must hold at least minimum_samples latencies.')
+    _adaptive_enabled = enabled
+    _adaptive_percentile = percentile
+    _adaptive_multiplier = multiplier
+    _adaptive_minimum = minimum
+    _adaptive_minimum_samples = minimum_samples
+    if window != _adaptive_window:
+        _adaptive_window = window
+        with _latency_lock:
+            for host, latencies in _host_latencies.items():
+                _host_latencies[host] = deque(latencies, maxlen=window)
+
+def record_latency(url: str, seconds: float) -> None:
+    """
+    Adds the latency of a request to the rolling latency window of its host.
+    A request that timed out is recorded with the timeout as its latency.
+
+    :param url: The requested URL.
+    :type url: str
+    :param seconds: The duration of the request.
+    :type seconds: float
+    :return: None
+    """
+    host = _host_of(url)
+    with _latency_lock:
+        latencies = _host_latencies.get(host)
+        if latencies is None:
+            latencies = _host_latencies.setdefault(host, deque(maxlen=_adaptive_window))
+        latencies.append(seconds)
+
+def latency_percentile(url: str, percentile: Optional[float] = None) -> Optional[float]:
+    """
+    Returns a percentile of the recent request latencies of the host of a URL,
+    using the nearest rank method.
+
+    :param url: The requested URL or a host name.
+    :type url: str
+    :param percentile: The percentile between 0 and 1. Default is the configured adaptive percentile.
+    :type percentile: Optional[float]
+    :return: The latency in seconds or None when no latency was recorded.
+    :rtype: Optional[float]
+    """
+    with _latency_lock:
+        latencies = sorted(_host_latencies.get(_host_of(url), ()))
+    if not latencies:
+        return None
+    rank = math.ceil((_adaptive_percentile if percentile is None else percentile) * len(latencies))
+    return latencies[max(rank, 1) - 1]
+
+def request_timeout(url: str) -> Tuple[float, float]:
+    """
+    Returns the connect and read timeouts of a request to a URL.
+
+    :param url: The requested URL.
+    :type url: str
+    :return: The connect timeout and the read timeout in seconds.
+    :rtype: Tuple[float, float]
+    """
+    policy = request_policy(url)
+    if _adaptive_enabled is False:
+        return policy.connect_timeout, policy.read_timeout
+    with _latency_lock:
+        samples = len(_host_latencies.get(_host_of(url), ()))
+    if samples < _adaptive_minimum_samples:
+        return policy.connect_timeout, policy.read_timeout
+    adaptive_timeout = latency_percentile(url) * _adaptive_multiplier
+    read_timeout = min(max(adaptive_timeout, _adaptive_minimum), policy.read_timeout)
+    return policy.connect_timeout, round(read_timeout, 3)
@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+
+"""
+This Python module tracks the health of the online repositories queried by WordHoard
+and implements a circuit breaker for every repository. A repository that keeps failing,
+because it is down, blocked by Cloudflare or too slow, is skipped by all the relation
+classes for a cool down period. After the cool down period a single query is let through
+as a probe, and its outcome decides whether the repository is queried again.
+"""
+__author__ = 'John Bumgarner'
+__date__ = 'October 19, 2026'
+__status__ = 'Production'
+__license__ = 'MIT'
+__copyright__ = "Copyright (C) 2026 John Bumgarner"
+
+##################################################################################
+# “AS-IS” Clause
+#
+# Except as represented in this agreement, all work produced by Developer is
+# provided “AS IS”. Other than as provided in this agreement, Developer makes no
+# other warranties, express or implied, and hereby disclaims all implied warranties,
+# including any warranty of merchantability and warranty of fitness for a particular
+# purpose.
+##################################################################################
+
+##################################################################################
+# Date Completed: October 19, 2026
+# Author: John Bumgarner
+#
+# Date Last Revised:
+# Revised by:
+##################################################################################
+
+##################################################################################
+# Python imports required for basic operations
+##################################################################################
+# Standard library imports
+import time
+import logging
+import threading
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+# The weight of the newest query in the exponentially weighted moving averages
+EWMA_WEIGHT = 0.2
+
+# The circuit breaker states
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half-open'
+
+
+class SourceHealth:
+    """
+        The health state and the circuit breaker of one online repository.
+
+        Parameters
+        ----------
+        source : str
+            The name of the online repository, e.g. thesaurus.com.
+
+        Attributes
+        ----------
+        source : str
+            The name of the online repository.
+        state : str
+            The circuit breaker state: closed, open or half-open.
+        queries : int
+            The number of recorded queries.
+        failures : int
+            The number of recorded failed queries.
+        consecutive_failures : int
+            The number of failed queries since the last successful query.
+        error_rate : float
+            The exponentially weighted moving average of the failed queries.
+        latency : Optional[float]
+            The exponentially weighted moving average of the query duration in seconds.
+        opened_at : Optional[float]
+            The time.monotonic() time when the circuit was last opened.
+
+        Methods
+        -------
+        allow_query(now: float) -> bool:
+            Returns True when the repository may be queried.
+        record_query(succeeded: bool, seconds: float, now: float) -> None:
+            Updates the health state with the outcome of a query.
+        as_dict() -> Dict[str, Any]:
+            Returns the health state as a dictionary.
+    """
+
+    def __init__(self, source: str):
+        self.source = source
+        self.state = CLOSED
+        self.queries = 0
+        self.failures = 0
+        self.consecutive_failures = 0
+        self.error_rate = 0.0
+        self.latency: Optional[float] = None
+        self.opened_at: Optional[float] = None
+        self._probe_started_at: Optional[float] = None
+
+    def allow_query(self, now: float) -> bool:
+        if self.state == CLOSED:
+            return True
+        if self.state == OPEN and now - self.opened_at >= _reset_timeout:
+            self.state = HALF_OPEN
+            self._probe_started_at = None
+        # a probe that was cancelled before it ran or never recorded its outcome expires
+        # after the cool down period, so the circuit is not stuck in the half-open state
+        if self.state == HALF_OPEN and (self._probe_started_at is None or
+                                        now - self._probe_started_at >= _reset_timeout):
+            # a single query is let through to probe the repository
+            self._probe_started_at = now
+            logger.info(f'The repository {self.source} is probed after the circuit breaker cool down period.')
+            return True
+        return False
+
+    def record_query(self, succeeded: bool, seconds: float, now: float) -> None:
+        self.queries += 1
+        self.latency = seconds if self.latency is None else (1 - EWMA_WEIGHT) * self.latency + EWMA_WEIGHT * seconds
+        self.error_rate = (1 - EWMA_WEIGHT) * self.error_rate + EWMA_WEIGHT * (0.0 if succeeded else 1.0)
+        if succeeded:
+            self.consecutive_failures = 0
+            if self.state != CLOSED:
+                logger.info(f'The circuit breaker of the repository {self.source} was closed.')
+            self.state = CLOSED
+            self._probe_started_at = None
+            return
+        self.failures += 1
+        self.consecutive_failures += 1
+        if self.state == HALF_OPEN or self.consecutive_failures >= _failure_threshold or \
+                (self.queries >= _minimum_queries and self.error_rate >= _error_rate_threshold):
+            if self.state != OPEN:
+                logger.warning(f'The circuit breaker of the repository {self.source} was opened after '
+                               f'{self.consecutive_failures} consecutive failed queries.')
+            self.state = OPEN
+            self.opened_at = now
+            self._probe_started_at = None
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {'state': self.state,
+                'queries': self.queries,
+                'failures': self.failures,
+                'consecutive_failures': self.consecutive_failures,
+                'error_rate': round(self.error_rate, 4),
+                'latency': None if self.latency is None else round(self.latency, 4)}
+
+
+##################################################################################
+# module level circuit breaker configuration and health registry
+##################################################################################
+_circuit_breaker_enabled = True
+_failure_threshold = 3
+_error_rate_threshold = 0.5
+_minimum_queries = 5
+_reset_timeout = 60.0
+_slow_query_seconds = 20.0
+_health_lock = threading.Lock()
+_source_health: Dict[str, SourceHealth] = {}
+
+def configure_circuit_breaker(enabled: bool = True,
+                              failure_threshold: int = 3,
+                              error_rate_threshold: float = 0.5,
+                              reset_timeout: float = 60.0,
+                              slow_query_seconds: float = 20.0) -> None:
+    """
+    Configures the circuit breakers of all the online repositories.
+
+    :param enabled: False queries every repository regardless of its health.
+    :type enabled: bool
+    :param failure_threshold: The number of consecutive failed queries that opens a circuit.
+    :type failure_threshold: int
+    :param error_rate_threshold: The moving average of failed queries that opens a circuit.
+    :type error_rate_threshold: float
+    :param reset_timeout: The seconds before an open circuit lets a probe query through, and before
+                          a probe that recorded no outcome is replaced by another probe.
+    :type reset_timeout: float
+    :param slow_query_seconds: A query that takes longer is counted as failed.
+    :type slow_query_seconds: float
+    :return: None
+    :raises ValueError: When a threshold or timeout is not positive.
+    """
+    global _circuit_breaker_enabled, _failure_threshold, _error_rate_threshold, _reset_timeout, _slow_query_seconds
+    if failure_threshold < 1 or not 0 < error_rate_threshold <= 1 or reset_timeout <= 0 or slow_query_seconds <= 0:
+        raise ValueError('The circuit breaker thresholds and timeouts must be positive '
+                         'and the error rate threshold must not exceed 1.')
+    _circuit_breaker_enabled = enabled
+    _failure_threshold = failure_threshold
+    _error_rate_threshold = error_rate_threshold
+    _reset_timeout = reset_timeout
+    _slow_query_seconds = slow_query_seconds
+
+def _health_of(source: str) -> SourceHealth:
+    health = _source_health.get(source)
+    if health is None:
+        health = _source_health.setdefault(source, SourceHealth(source))
+    return health
+
+def allow_query(source: str) -> bool:
+    """
+    Returns True when the online repository may be queried, which is the case unless
+    its circuit is open.
+
+    :param source: The name of the online repository.
+    :type source: str
+    :return: True or False
+    :rtype: bool
+    """
+    if _circuit_breaker_enabled is False:
+        return True
+    with _health_lock:
+        allowed = _health_of(source).allow_query(time.monotonic())
+    if allowed is False:
+        logger.info(f'The repository {source} was skipped, because its circuit breaker is open.')
+    return allowed
+
+def record_query(source: str, succeeded: bool, seconds: float) -> None:
+    """
+    Updates the health state of an online repository with the outcome of a query.
+    A successful query that took longer than the slow query threshold is counted as failed.
+
+    :param source: The name of the online repository.
+    :type source: str
+    :param succeeded: False when the query failed or the repository was blocked by Cloudflare.
+    :type succeeded: bool
+    :param seconds: The duration of the query.
+    :type seconds: float
+    :return: None
+    """
+    with _health_lock:
+        _health_of(source).record_query(succeeded and seconds <= _slow_query_seconds, seconds, time.monotonic())
+
+def source_health(source: Optional[str] = None) -> Dict[str, Dict[str, Any]]:
+    """
+    Returns the health state of the queried online repositories.
+
+    :param source: The name of a single online repository.
+    :type source: Optional[str]
+    :return: The health state by repository name.
+    :rtype: Dict[str, Dict[str, Any]]
+    """
+    with _health_lock:
+        return {name: health.as_dict() for name, health in sorted(_source_health.items())
+                if source is None or name == source}
+
+def reset_source_health(source: Optional[str] = None) -> None:
+    """
+    Forgets the health state of one or all online repositories, which closes their circuits.
+
+    :param source: The name of a single online repository.
+    :type source: Optional[str]
+    :return: None
+    """
+    with _health_lock:
+        if source is None:
+            _source_health.clear()
+        else:
+            _source_health.pop(source, None)
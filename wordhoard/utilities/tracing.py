@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+
+"""
+This Python module creates OpenTelemetry spans around the stages of a WordHoard query,
+which are the HTTP requests, the construction of the BeautifulSoup objects, the Cloudflare
+checks, the parsers and the formatting of the output. The spans are exported by the
+OpenTelemetry SDK configured by the application. When the opentelemetry-api package
+is not installed, the spans are no-ops.
+"""
+__author__ = 'John Bumgarner'
+__date__ = 'October 19, 2026'
+__status__ = 'Production'
+__license__ = 'MIT'
+__copyright__ = "Copyright (C) 2026 John Bumgarner"
+
+##################################################################################
+# “AS-IS” Clause
+#
+# Except as represented in this agreement, all work produced by Developer is
+# provided “AS IS”. Other than as provided in this agreement, Developer makes no
+# other warranties, express or implied, and hereby disclaims all implied warranties,
+# including any warranty of merchantability and warranty of fitness for a particular
+# purpose.
+##################################################################################
+
+##################################################################################
+# Date Completed: October 19, 2026
+# Author: John Bumgarner
+#
+# Date Last Revised:
+# Revised by:
+##################################################################################
+
+##################################################################################
+# Python imports required for basic operations
+##################################################################################
+# Standard library imports
+import functools
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator, Optional, Union
+
+# Third-party imports
+from bs4 import BeautifulSoup
+
+try:
+    from opentelemetry import trace
+except ImportError:
+    trace = None
+
+_tracer = trace.get_tracer('wordhoard') if trace is not None else None
+
+
+class _NoopSpan:
+    """
+        The span that is returned when the opentelemetry-api package is not installed.
+    """
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        pass
+
+    def record_exception(self, exception: BaseException, **kwargs) -> None:
+        pass
+
+
+_NOOP_SPAN = _NoopSpan()
+
+def tracing_available() -> bool:
+    """
+    Returns True when the opentelemetry-api package is installed.
+
+    :return: True or False
+    :rtype: bool
+    """
+    return _tracer is not None
+
+@contextmanager
+def span(name: str, **attributes: Union[str, int, float, bool]) -> Iterator[Any]:
+    """
+    Runs the block in a span, which is a child of the active span.
+
+    :param name: The name of the span.
+    :type name: str
+    :param attributes: The attributes of the span.
+    :return: The OpenTelemetry span or a no-op span.
+    :rtype: Iterator[Any]
+    """
+    if _tracer is None:
+        yield _NOOP_SPAN
+        return
+    with _tracer.start_as_current_span(name, attributes=attributes) as current_span:
+        yield current_span
+
+def traced(name: Optional[str] = None) -> Callable[[Callable], Callable]:
+    """
+    Decorates a function, so that every call runs in a span. The span is named after
+    the module and qualified name of the function, unless a name is provided.
+    Without the opentelemetry-api package the function is returned unchanged.
+
+    :param name: The name of the span.
+    :type name: Optional[str]
+    :return: The decorator.
+    :rtype: Callable[[Callable], Callable]
+    """
+    def decorator(function: Callable) -> Callable:
+        if _tracer is None:
+            return function
+        span_name = name or f'{function.__module__}.{function.__qualname__}'
+
+        @functools.wraps(function)
+        def traced_function(*args, **kwargs):
+            with _tracer.start_as_current_span(span_name):
+                return function(*args, **kwargs)
+        return traced_function
+    return decorator
+
+def make_soup(markup: Union[str, bytes], features: str = 'lxml') -> BeautifulSoup:
+    """
+    Builds a BeautifulSoup object in a span.
+
+    :param markup: The HTML page.
+    :type markup: Union[str, bytes]
+    :param features: The parser used by BeautifulSoup.
+    :type features: str
+    :return: The parsed HTML page.
+    :rtype: BeautifulSoup
+    """
+    with span('wordhoard.soup', parser=features, size=len(markup)):
+        return BeautifulSoup(markup=markup, features=features)
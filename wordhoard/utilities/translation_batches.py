@@ -0,0 +1,238 @@
+#!/usr/bin/env python3
+
+"""
+This Python module translates many words with as few requests to a translation service
+as its limits allow. The words are deduplicated, the words already in the translation cache
+are skipped, and the remaining words are packed into batches that stay within the number
+of texts and the request size accepted by the service. A service that accepts a single text
+per request receives the words of a batch joined by a line separator, and its translation
+is split on the same separator and mapped back to the words.
+"""
+__author__ = 'John Bumgarner'
+__date__ = 'October 19, 2026'
+__status__ = 'Production'
+__license__ = 'MIT'
+__copyright__ = "Copyright (C) 2026 John Bumgarner"
+
+##################################################################################
+# “AS-IS” Clause
+#
+# Except as represented in this agreement, all work produced by Developer is
+# provided “AS IS”. Other than as provided in this agreement, Developer makes no
+# other warranties, express or implied, and hereby disclaims all implied warranties,
+# including any warranty of merchantability and warranty of fitness for a particular
+# purpose.
+##################################################################################
+
+##################################################################################
+# Date Completed: October 19, 2026
+# Author: John Bumgarner
+#
+# Date Last Revised:
+# Revised by:
+##################################################################################
+
+
+##################################################################################
+# Python imports required for basic operations
+##################################################################################
+# Standard library imports
+import asyncio
+import logging
+from typing import Callable, Dict, List, Optional
+
+# Local or project-specific imports
+from wordhoard.utilities import async_translation, translation_cache
+
+logger = logging.getLogger(__name__)
+
+# The separator between the words of a batch sent to a service as a single text
+SEPARATOR = '\n'
+
+
+def normalize_text(text: str) -> str:
+    """
+    Collapses the whitespace of a text, so it cannot contain the batch separator.
+
+    :param text: The text to translate.
+    :type text: str
+    :return: The normalized text.
+    :rtype: str
+    """
+    return ' '.join(str(text).split())
+
+def pack_batches(texts: List[str], max_texts: int, max_bytes: int, separator: str = SEPARATOR) -> List[List[str]]:
+    """
+    Packs the texts into batches of at most max_texts texts, whose UTF-8 size, including the
+    separators between the texts, does not exceed max_bytes. A text that exceeds max_bytes
+    on its own is placed in a batch by itself, so the service reports its length error.
+
+    :param texts: The texts to translate.
+    :type texts: List[str]
+    :param max_texts: The maximum number of texts per batch.
+    :type max_texts: int
+    :param max_bytes: The maximum size of a batch in bytes.
+    :type max_bytes: int
+    :param separator: The separator between the texts of a batch.
+    :type separator: str
+    :return: The batches of texts.
+    :rtype: List[List[str]]
+    :raises ValueError: When a limit is not positive.
+    """
+    if max_texts < 1 or max_bytes < 1:
+        raise ValueError('The maximum number of texts and the maximum size of a batch must be positive.')
+    separator_size = len(separator.encode('utf-8'))
+    batches: List[List[str]] = []
+    batch: List[str] = []
+    batch_size = 0
+    for text in texts:
+        text_size = len(text.encode('utf-8'))
+        added_size = text_size + (separator_size if batch else 0)
+        if batch and (len(batch) >= max_texts or batch_size + added_size > max_bytes):
+            batches.append(batch)
+            batch, batch_size, added_size = [], 0, text_size
+        batch.append(text)
+        batch_size += added_size
+    if batch:
+        batches.append(batch)
+    return batches
+
+def split_batch_translation(translation: Optional[str],
+                            texts: List[str],
+                            separator: str = SEPARATOR) -> Optional[List[str]]:
+    """
+    Splits the translation of texts joined by the separator back into one translation per text.
+
+    :param translation: The translation of the joined texts.
+    :type translation: Optional[str]
+    :param texts: The texts of the batch.
+    :type texts: List[str]
+    :param separator: The separator between the texts of the batch.
+    :type separator: str
+    :return: The translations of the texts, or None when the service merged or split lines.
+    :rtype: Optional[List[str]]
+    """
+    if not translation:
+        return None
+    translations = [line.strip() for line in translation.strip().split(separator)]
+    if len(translations) != len(texts):
+        return None
+    return translations
+
+def _pending_texts(service: str,
+                   source_language: str,
+                   target_language: str,
+                   texts: Dict[str, str],
+                   translations: Dict[str, Optional[str]]) -> List[str]:
+    """
+    Adds the cached translations of the texts to the translations and returns the texts
+    that have to be sent to the translation service.
+    """
+    pending_texts: List[str] = []
+    for text in dict.fromkeys(texts.values()):
+        if not text:
+            translations[text] = None
+            continue
+        translation = translation_cache.cached_translation(service, source_language, target_language, text)
+        if translation is None:
+            pending_texts.append(text)
+        else:
+            translations[text] = translation
+    return pending_texts
+
+def _store_batch(service: str,
+                 source_language: str,
+                 target_language: str,
+                 batch: List[str],
+                 batch_translations: Optional[List[Optional[str]]],
+                 translations: Dict[str, Optional[str]]) -> None:
+    """
+    Adds the translations of a batch to the translations and to the translation cache.
+    """
+    batch_translations = batch_translations or []
+    for index, text in enumerate(batch):
+        translation = batch_translations[index] if index < len(batch_translations) else None
+        translations[text] = translation_cache.cache_translation(service, source_language, target_language,
+                                                                 text, translation)
+
+def translate_many(service: str,
+                   source_language: str,
+                   target_language: str,
+                   words: List[str],
+                   translate_batch: Callable[[List[str]], List[Optional[str]]],
+                   max_texts: int,
+                   max_bytes: int) -> Dict[str, Optional[str]]:
+    """
+    Translates many words with as few requests to the translation service as its limits allow.
+    The cached translations are used, and the new translations are added to the cache.
+
+    :param service: The name of the translation service, e.g. google.
+    :type service: str
+    :param source_language: The language of the words.
+    :type source_language: str
+    :param target_language: The language of the translations.
+    :type target_language: str
+    :param words: The words to translate.
+    :type words: List[str]
+    :param translate_batch: Translates a batch of texts with a single request, when possible,
+                            and returns a translation or None for every text.
+    :type translate_batch: Callable[[List[str]], List[Optional[str]]]
+    :param max_texts: The maximum number of texts per request.
+    :type max_texts: int
+    :param max_bytes: The maximum size of the texts of a request in bytes.
+    :type max_bytes: int
+    :return: The translation or None by word, in the order of the words.
+    :rtype: Dict[str, Optional[str]]
+    """
+    texts = {word: normalize_text(word) for word in words}
+    translations: Dict[str, Optional[str]] = {}
+    pending_texts = _pending_texts(service, source_language, target_language, texts, translations)
+    batches = pack_batches(pending_texts, max_texts, max_bytes)
+    for batch in batches:
+        _store_batch(service, source_language, target_language, batch, translate_batch(batch), translations)
+    if pending_texts:
+        logger.info(f'The {service} translation service translated {len(pending_texts)} words '
+                    f'from {source_language} to {target_language} with {len(batches)} requests.')
+    return {word: translations.get(text) for word, text in texts.items()}
+
+async def atranslate_many(service: str,
+                          source_language: str,
+                          target_language: str,
+                          words: List[str],
+                          translate_batch: Callable[[List[str]], List[Optional[str]]],
+                          max_texts: int,
+                          max_bytes: int) -> Dict[str, Optional[str]]:
+    """
+    The asynchronous variant of translate_many. The batches are translated concurrently in
+    the translation thread pool, which bounds the number of concurrent requests.
+
+    :param service: The name of the translation service, e.g. google.
+    :type service: str
+    :param source_language: The language of the words.
+    :type source_language: str
+    :param target_language: The language of the translations.
+    :type target_language: str
+    :param words: The words to translate.
+    :type words: List[str]
+    :param translate_batch: Translates a batch of texts with a single request, when possible,
+                            and returns a translation or None for every text.
+    :type translate_batch: Callable[[List[str]], List[Optional[str]]]
+    :param max_texts: The maximum number of texts per request.
+    :type max_texts: int
+    :param max_bytes: The maximum size of the texts of a request in bytes.
+    :type max_bytes: int
+    :return: The translation or None by word, in the order of the words.
+    :rtype: Dict[str, Optional[str]]
+    """
+    texts = {word: normalize_text(word) for word in words}
+    translations: Dict[str, Optional[str]] = {}
+    pending_texts = _pending_texts(service, source_language, target_language, texts, translations)
+    batches = pack_batches(pending_texts, max_texts, max_bytes)
+    batch_translations = await asyncio.gather(*(async_translation.run_translation(translate_batch, batch)
+                                                for batch in batches))
+    for batch, translated_batch in zip(batches, batch_translations):
+        _store_batch(service, source_language, target_language, batch, translated_batch, translations)
+    if pending_texts:
+        logger.info(f'The {service} translation service translated {len(pending_texts)} words '
+                    f'from {source_language} to {target_language} with {len(batches)} concurrent requests.')
+    return {word: translations.get(text) for word, text in texts.items()}
@@ -0,0 +1,248 @@
+#!/usr/bin/env python3
+
+"""
+This Python module caches the results of the translation services, so a word that was
+already translated is not sent to the translation service again. The translations are
+keyed by service, source language, target language and text. They are kept in memory
+and optionally in a SQLite file, which persists them across processes.
+"""
+__author__ = 'John Bumgarner'
+__date__ = 'October 19, 2026'
+__status__ = 'Production'
+__license__ = 'MIT'
+__copyright__ = "Copyright (C) 2026 John Bumgarner"
+
+##################################################################################
+# “AS-IS” Clause
+#
+# Except as represented in this agreement, all work produced by Developer is
+# provided “AS IS”. Other than as provided in this agreement, Developer makes no
+# other warranties, express or implied, and hereby disclaims all implied warranties,
+# including any warranty of merchantability and warranty of fitness for a particular
+# purpose.
+##################################################################################
+
+##################################################################################
+# Date Completed: October 19, 2026
+# Author: John Bumgarner
+#
+# Date Last Revised:
+# Revised by:
+##################################################################################
+
+##################################################################################
+# Python imports required for basic operations
+##################################################################################
+# Standard library imports
+import logging
+import sqlite3
+import threading
+import traceback
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+# Local or project-specific imports
+from wordhoard.utilities import metrics
+
+logger = logging.getLogger(__name__)
+
+TranslationKey = Tuple[str, str, str, str]
+
+
+class TranslationCache:
+    """
+        This class stores the results of the translation services in memory and optionally in a SQLite file.
+
+        Usage Examples
+        ----------
+        >>> translation_cache = TranslationCache(file_path='wordhoard_translations.db')
+        >>> translation_cache.store('google', 'es', 'en', 'casa', 'house')
+        >>> translation_cache.lookup('google', 'es', 'en', 'casa')
+        'house'
+
+        Parameters
+        ----------
+        file_path : str, optional
+            The SQLite file used to persist the translations. The translations are only kept in memory
+            when no file is provided.
+        max_entries : int, optional
+            The number of translations kept in memory. The least recently used translations are evicted
+            first. Default is 100000.
+
+        Methods
+        -------
+        make_key(service: str, source_language: str, target_language: str, text: str) -> TranslationKey:
+            Returns the normalized cache key of a translation.
+        lookup(service: str, source_language: str, target_language: str, text: str) -> Optional[str]:
+            Returns the cached translation of a text.
+        store(service: str, source_language: str, target_language: str, text: str, translation: str) -> None:
+            Caches the translation of a text.
+        clear() -> None:
+            Removes the translations kept in memory.
+    """
+
+    def __init__(self, file_path: Optional[str] = None, max_entries: int = 100000):
+        if max_entries < 1:
+            raise ValueError(f'The translation cache must hold at least one entry, not {max_entries}.')
+        self._file_path = file_path
+        self._max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries: 'OrderedDict[TranslationKey, str]' = OrderedDict()
+        self._connection: Optional[sqlite3.Connection] = None
+        if file_path is not None:
+            self._connection = sqlite3.connect(file_path, check_same_thread=False)
+            with self._connection:
+                self._connection.execute('CREATE TABLE IF NOT EXISTS translations ('
+                                         'service TEXT NOT NULL, '
+                                         'source_language TEXT NOT NULL, '
+                                         'target_language TEXT NOT NULL, '
+                                         'text TEXT NOT NULL, '
+                                         'translation TEXT NOT NULL, '
+                                         'PRIMARY KEY (service, source_language, target_language, text))')
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def make_key(service: str, source_language: str, target_language: str, text: str) -> TranslationKey:
+        return service.lower(), source_language.lower(), target_language.lower(), ' '.join(text.split())
+
+    def _remember(self, key: TranslationKey, translation: str) -> None:
+        self._entries[key] = translation
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def lookup(self, service: str, source_language: str, target_language: str, text: str) -> Optional[str]:
+        key = self.make_key(service, source_language, target_language, text)
+        with self._lock:
+            translation = self._entries.get(key)
+            if translation is not None:
+                self._entries.move_to_end(key)
+            elif self._connection is not None:
+                try:
+                    row = self._connection.execute('SELECT translation FROM translations WHERE service = ? AND '
+                                                   'source_language = ? AND target_language = ? AND text = ?',
+                                                   key).fetchone()
+                except sqlite3.Error as error:
+                    logger.error(f'The translation cache {self._file_path} could not be read.')
+                    logger.error(''.join(traceback.format_tb(error.__traceback__)))
+                    row = None
+                if row is not None:
+                    translation = row[0]
+                    self._remember(key, translation)
+        metrics.record_cache_lookup('translations', hit=translation is not None)
+        return translation
+
+    def store(self, service: str, source_language: str, target_language: str, text: str, translation: str) -> None:
+        key = self.make_key(service, source_language, target_language, text)
+        with self._lock:
+            self._remember(key, translation)
+            if self._connection is not None:
+                try:
+                    with self._connection:
+                        self._connection.execute('INSERT OR REPLACE INTO translations VALUES (?, ?, ?, ?, ?)',
+                                                 (*key, translation))
+                except sqlite3.Error as error:
+                    logger.error(f'The translation of {text} could not be written to {self._file_path}.')
+                    logger.error(''.join(traceback.format_tb(error.__traceback__)))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+
+##################################################################################
+# module level translation cache used by the translator modules
+##################################################################################
+_translation_cache: Optional[TranslationCache] = TranslationCache()
+
+def enable_translation_cache(file_path: Optional[str] = None, max_entries: int = 100000) -> TranslationCache:
+    """
+    Enables the translation cache for all the translator modules. The translations are kept
+    in memory by default.
+
+    :param file_path: The SQLite file used to persist the translations. Defaults to an in-memory cache.
+    :type file_path: Optional[str]
+    :param max_entries: The number of translations kept in memory.
+    :type max_entries: int
+    :return: the enabled cache
+    :rtype: TranslationCache
+    """
+    global _translation_cache
+    previous_cache = _translation_cache
+    _translation_cache = TranslationCache(file_path=file_path, max_entries=max_entries)
+    if previous_cache is not None:
+        previous_cache.close()
+    return _translation_cache
+
+def disable_translation_cache() -> None:
+    """
+    Disables the translation cache, so every translation is sent to the translation service.
+
+    :return: None
+    """
+    global _translation_cache
+    previous_cache = _translation_cache
+    _translation_cache = None
+    if previous_cache is not None:
+        previous_cache.close()
+
+def get_translation_cache() -> Optional[TranslationCache]:
+    """
+    Returns the enabled translation cache.
+
+    :return: the enabled cache or None
+    :rtype: Optional[TranslationCache]
+    """
+    return _translation_cache
+
+def cached_translation(service: str, source_language: str, target_language: str, text: str) -> Optional[str]:
+    """
+    Returns the cached translation of a text or None when the text was not translated before
+    or the translation cache is disabled.
+
+    :param service: google, mymemory or deepl
+    :type service: str
+    :param source_language: The language of the text.
+    :type source_language: str
+    :param target_language: The language of the translation.
+    :type target_language: str
+    :param text: The translated text.
+    :type text: str
+    :return: The cached translation or None
+    :rtype: Optional[str]
+    """
+    translation_cache = _translation_cache
+    if translation_cache is None:
+        return None
+    return translation_cache.lookup(service, source_language, target_language, text)
+
+def cache_translation(service: str, source_language: str, target_language: str, text: str,
+                      translation: Optional[str]) -> Optional[str]:
+    """
+    Caches the translation of a text, unless the translation failed.
+
+    :param service: google, mymemory or deepl
+    :type service: str
+    :param source_language: The language of the text.
+    :type source_language: str
+    :param target_language: The language of the translation.
+    :type target_language: str
+    :param text: The translated text.
+    :type text: str
+    :param translation: The translation or None when the translation failed.
+    :type translation: Optional[str]
+    :return: The translation
+    :rtype: Optional[str]
+    """
+    translation_cache = _translation_cache
+    if translation_cache is not None and translation:
+        translation_cache.store(service, source_language, target_language, text, translation)
+    return translation
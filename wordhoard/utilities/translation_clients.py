@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+
+"""
+This Python module holds the long-lived HTTP clients of the translation services. Every
+translation service has a single requests session, which is shared by all the Translator
+instances, so the connections to the service are kept alive and reused across translations.
+The DeepL clients are shared by authentication key. A session is rebuilt when the transport
+mode changes, so recorded and replayed translations use the matching transport adapter.
+"""
+__author__ = 'John Bumgarner'
+__date__ = 'October 19, 2026'
+__status__ = 'Production'
+__license__ = 'MIT'
+__copyright__ = "Copyright (C) 2026 John Bumgarner"
+
+##################################################################################
+# “AS-IS” Clause
+#
+# Except as represented in this agreement, all work produced by Developer is
+# provided “AS IS”. Other than as provided in this agreement, Developer makes no
+# other warranties, express or implied, and hereby disclaims all implied warranties,
+# including any warranty of merchantability and warranty of fitness for a particular
+# purpose.
+##################################################################################
+
+##################################################################################
+# Date Completed: October 19, 2026
+# Author: John Bumgarner
+#
+# Date Last Revised:
+# Revised by:
+##################################################################################
+
+
+##################################################################################
+# Python imports required for basic operations
+##################################################################################
+# Standard library imports
+import logging
+import threading
+from typing import Any, Dict, Tuple
+
+# Third-party imports
+import deepl
+import requests
+from requests.adapters import Retry
+
+# Local or project-specific imports
+from wordhoard.utilities import transport
+
+logger = logging.getLogger(__name__)
+
+# The connections kept alive per service, which bounds the concurrent translation requests that reuse a connection
+POOL_MAXSIZE = 10
+
+_RETRY_STATUS_CODES = (500, 502, 503, 504)
+
+_client_lock = threading.Lock()
+_sessions: Dict[str, Tuple[requests.Session, Tuple[str, Any]]] = {}
+_deepl_clients: Dict[str, deepl.Translator] = {}
+
+
+def _transport_state() -> Tuple[str, Any]:
+    return transport.transport_mode(), transport.transport_archive()
+
+# reference: https://urllib3.readthedocs.io/en/latest/reference/urllib3.util.html#module-urllib3.util.retry
+def _build_session(retries: int = 5, backoff_factor: float = 0.5) -> requests.Session:
+    session = requests.Session()
+    retry = Retry(total=retries,
+                  read=retries,
+                  connect=retries,
+                  backoff_factor=backoff_factor,
+                  status_forcelist=_RETRY_STATUS_CODES)
+    http_adapter = transport.build_adapter(max_retries=retry, pool_connections=1, pool_maxsize=POOL_MAXSIZE)
+    session.mount(prefix='http://', adapter=http_adapter)
+    session.mount(prefix='https://', adapter=http_adapter)
+    return session
+
+def translation_session(service: str) -> requests.Session:
+    """
+    Returns the shared requests session of a translation service. The session retries the
+    requests that fail with a server error and keeps its connections alive.
+
+    :param service: google or mymemory
+    :type service: str
+    :return: The shared session of the service.
+    :rtype: requests.Session
+    """
+    state = _transport_state()
+    with _client_lock:
+        shared = _sessions.get(service)
+        if shared is not None and shared[1][0] == state[0] and shared[1][1] is state[1]:
+            return shared[0]
+        session = _build_session()
+        _sessions[service] = (session, state)
+    if shared is not None:
+        logger.info(f'The session of the {service} translation service was rebuilt for the {state[0]} transport.')
+        shared[0].close()
+    return session
+
+def deepl_client(api_key: str) -> deepl.Translator:
+    """
+    Returns the shared DeepL client of an authentication key.
+
+    :param api_key: The authentication key of the DeepL translation service.
+    :type api_key: str
+    :return: The shared DeepL client.
+    :rtype: deepl.Translator
+    :raises ValueError: When the authentication key is empty.
+    """
+    with _client_lock:
+        client = _deepl_clients.get(api_key)
+        if client is None:
+            client = _deepl_clients[api_key] = deepl.Translator(auth_key=api_key)
+        return client
+
+def close_translation_clients() -> None:
+    """
+    Closes the shared sessions and DeepL clients of all the translation services.
+
+    :return: None
+    """
+    with _client_lock:
+        clients = [session for session, _ in _sessions.values()] + list(_deepl_clients.values())
+        _sessions.clear()
+        _deepl_clients.clear()
+    for client in clients:
+        client.close()
@@ -2,7 +2,8 @@
 
 """
 This Python script provides the supported languages for the translation modules
-embedded into WordHoard.
+embedded into WordHoard, and the immutable indexes that look up a supported language
+by its code, its name or a common alias.
 """
 __author__ = 'John Bumgarner'
 __date__ = 'February 12, 2023'
@@ -31,7 +32,9 @@ __copyright__ = "Copyright (C) 2023 John Bumgarner"
 ##################################################################################
 # Python imports required for basic operations
 ##################################################################################
-from typing import Dict
+import threading
+from types import MappingProxyType
+from typing import Callable, Dict, Iterator, Mapping, Optional, Tuple
 
 class Languages:
     """
@@ -398,3 +401,136 @@ class Languages:
                                'zu': 'zulu'}
 
         return supported_languages
+
+
+##################################################################################
+# module level language indexes of the translation services
+##################################################################################
+# Common aliases and the codes they stand for, in order of preference
+_LANGUAGE_ALIASES: Dict[str, Tuple[str, ...]] = {'zh': ('zh-CN',),
+                                                 'zh-hans': ('zh-CN', 'zh'),
+                                                 'zh-hant': ('zh-TW',),
+                                                 'chinese': ('zh-CN', 'zh'),
+                                                 'he': ('iw',),
+                                                 'iw': ('he',),
+                                                 'jv': ('jw',),
+                                                 'jw': ('jv',),
+                                                 'nb': ('no',),
+                                                 'no': ('nb',),
+                                                 'norwegian bokmal': ('nb', 'no'),
+                                                 'tl': ('fil',),
+                                                 'tagalog': ('fil', 'tl'),
+                                                 'burmese': ('my',),
+                                                 'farsi': ('fa',),
+                                                 'slovak': ('sk',),
+                                                 'slovakian': ('sk',),
+                                                 'en-us': ('en',),
+                                                 'en-gb': ('en',),
+                                                 'pt-br': ('pt',),
+                                                 'pt-pt': ('pt',)}
+
+_SERVICE_LANGUAGES: Dict[str, Callable[[], Dict[str, str]]] = {'deepl': Languages.deep_supported_languages,
+                                                               'google': Languages.google_supported_languages,
+                                                               'mymemory': Languages.mymemory_supported_languages}
+
+
+def _normalize_language(language: str) -> str:
+    return ' '.join(str(language).split()).lower()
+
+
+def _name_aliases(name: str) -> Iterator[str]:
+    """
+    Yields the alternative spellings of a qualified language name, e.g. chinese simplified
+    and simplified chinese for chinese (simplified).
+    """
+    if '(' in name and name.endswith(')'):
+        base, qualifier = name[:-1].split('(', 1)
+        base, qualifier = base.strip(), qualifier.strip()
+        yield f'{base} {qualifier}'
+        yield f'{qualifier} {base}'
+
+
+class LanguageIndex:
+    """
+        An immutable index of the languages supported by a translation service.
+
+        Parameters
+        ----------
+        service : str
+            The name of the translation service: deepl, google or mymemory.
+        languages : Dict[str, str]
+            The supported language names by language code.
+
+        Attributes
+        ----------
+        service : str
+            The name of the translation service.
+        languages : Mapping[str, str]
+            The read-only supported language names by language code.
+
+        Methods
+        -------
+        resolve(language: str) -> Optional[str]:
+            Returns the code of a supported language, which is looked up case-insensitively
+            by its code, its name or a common alias.
+        name(language: str) -> Optional[str]:
+            Returns the name of a supported language.
+    """
+
+    __slots__ = ('service', 'languages', '_lookup')
+
+    def __init__(self, service: str, languages: Dict[str, str]):
+        lookup: Dict[str, str] = {}
+        for code in languages:
+            lookup.setdefault(_normalize_language(code), code)
+        for code, name in languages.items():
+            lookup.setdefault(_normalize_language(name), code)
+            for alias in _name_aliases(_normalize_language(name)):
+                lookup.setdefault(alias, code)
+        for alias, codes in _LANGUAGE_ALIASES.items():
+            code = next((code for code in codes if code in languages), None)
+            if code is not None:
+                lookup.setdefault(alias, code)
+        self.service = service
+        self.languages: Mapping[str, str] = MappingProxyType(dict(languages))
+        self._lookup: Mapping[str, str] = MappingProxyType(lookup)
+
+    def __contains__(self, language: str) -> bool:
+        return self.resolve(language) is not None
+
+    def __len__(self) -> int:
+        return len(self.languages)
+
+    def resolve(self, language: str) -> Optional[str]:
+        if not language:
+            return None
+        return self._lookup.get(_normalize_language(language))
+
+    def name(self, language: str) -> Optional[str]:
+        code = self.resolve(language)
+        return None if code is None else self.languages[code]
+
+
+_index_lock = threading.Lock()
+_language_indexes: Dict[str, LanguageIndex] = {}
+
+def language_index(service: str) -> LanguageIndex:
+    """
+    Returns the language index of a translation service, which is built on first use.
+
+    :param service: deepl, google or mymemory
+    :type service: str
+    :return: The language index of the service.
+    :rtype: LanguageIndex
+    :raises ValueError: When the translation service is unknown.
+    """
+    index = _language_indexes.get(service)
+    if index is not None:
+        return index
+    if service not in _SERVICE_LANGUAGES:
+        raise ValueError(f'Unknown translation service: {service}. Acceptable services: deepl, google or mymemory.')
+    with _index_lock:
+        index = _language_indexes.get(service)
+        if index is None:
+            index = _language_indexes[service] = LanguageIndex(service, _SERVICE_LANGUAGES[service]())
+        return index
@@ -0,0 +1,251 @@
+#!/usr/bin/env python3
+
+"""
+This Python module provides the transport that sends the HTTP requests made by WordHoard.
+Besides the live transport, requests can be recorded to a local archive or replayed from
+it. A replayed run does not contact the online repositories, which makes it deterministic
+and allows historical scrapes to be processed again without the upstream rate limits.
+"""
+__author__ = 'John Bumgarner'
+__date__ = 'October 19, 2026'
+__status__ = 'Production'
+__license__ = 'MIT'
+__copyright__ = "Copyright (C) 2026 John Bumgarner"
+
+##################################################################################
+# “AS-IS” Clause
+#
+# Except as represented in this agreement, all work produced by Developer is
+# provided “AS IS”. Other than as provided in this agreement, Developer makes no
+# other warranties, express or implied, and hereby disclaims all implied warranties,
+# including any warranty of merchantability and warranty of fitness for a particular
+# purpose.
+##################################################################################
+
+##################################################################################
+# Date Completed: October 19, 2026
+# Author: John Bumgarner
+#
+# Date Last Revised:
+# Revised by:
+##################################################################################
+
+##################################################################################
+# Python imports required for basic operations
+##################################################################################
+# Standard library imports
+import os
+import json
+import time
+import base64
+import hashlib
+import logging
+import threading
+import traceback
+from typing import Any, Dict, Optional
+
+# Third-party imports
+import requests
+from requests.adapters import BaseAdapter, HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+
+logger = logging.getLogger(__name__)
+
+# The response header that marks a response served from the archive
+REPLAY_HEADER = 'X-Wordhoard-Replay'
+
+
+class RequestArchive:
+    """
+        This class stores HTTP responses in a directory, one JSON file per request.
+
+        Parameters
+        ----------
+        directory : str
+            The directory of the archive.
+
+        Methods
+        -------
+        request_key(request: requests.PreparedRequest) -> str:
+            Returns the key that identifies a request in the archive.
+        load(request: requests.PreparedRequest) -> Optional[Dict[str, Any]]:
+            Returns the archived entry for a request.
+        save(request: requests.PreparedRequest, response: requests.models.Response) -> None:
+            Archives the response to a request.
+        build_response(request: requests.PreparedRequest, entry: Dict[str, Any]) -> requests.models.Response:
+            Rebuilds a response object from an archived entry.
+    """
+
+    def __init__(self, directory: str):
+        self._directory = directory
+        os.makedirs(self._directory, exist_ok=True)
+
+    @staticmethod
+    def request_key(request: requests.PreparedRequest) -> str:
+        body = request.body or b''
+        if isinstance(body, str):
+            body = body.encode('utf-8')
+        fingerprint = f'{request.method} {request.url}\n'.encode('utf-8') + body
+        return hashlib.sha256(fingerprint).hexdigest()
+
+    def _entry_path(self, request: requests.PreparedRequest) -> str:
+        return os.path.join(self._directory, f'{self.request_key(request)}.json')
+
+    def load(self, request: requests.PreparedRequest) -> Optional[Dict[str, Any]]:
+        try:
+            with open(file=self._entry_path(request), mode='r', encoding='utf-8') as infile:
+                return json.load(infile)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as error:
+            logger.error(f'The archived response for {request.url} could not be read.')
+            logger.error(''.join(traceback.format_tb(error.__traceback__)))
+            return None
+
+    def save(self, request: requests.PreparedRequest, response: requests.models.Response) -> None:
+        entry = {'method': request.method,
+                 'url': request.url,
+                 'status_code': response.status_code,
+                 'reason': response.reason,
+                 'headers': dict(response.headers),
+                 'encoding': response.encoding,
+                 'content': base64.b64encode(response.content).decode('ascii'),
+                 'recorded_at': time.time()}
+        entry_path = self._entry_path(request)
+        temporary_path = f'{entry_path}.{threading.get_ident()}.tmp'
+        try:
+            with open(file=temporary_path, mode='w', encoding='utf-8') as outfile:
+                json.dump(entry, outfile)
+            os.replace(temporary_path, entry_path)
+        except OSError as error:
+            logger.error(f'The response for {request.url} could not be archived.')
+            logger.error(''.join(traceback.format_tb(error.__traceback__)))
+
+    @staticmethod
+    def build_response(request: requests.PreparedRequest, entry: Dict[str, Any]) -> requests.models.Response:
+        response = requests.models.Response()
+        response.request = request
+        response.url = entry['url']
+        response.status_code = entry['status_code']
+        response.reason = entry.get('reason')
+        response.headers = CaseInsensitiveDict(entry['headers'])
+        response.headers[REPLAY_HEADER] = 'hit'
+        # the archived body is already decoded, so it must not be decoded again
+        response.headers.pop('Content-Encoding', None)
+        response.encoding = entry['encoding']
+        response._content = base64.b64decode(entry['content'])
+        return response
+
+
+class RecordingAdapter(HTTPAdapter):
+    """
+        This transport adapter sends requests to the online repositories and archives every response.
+    """
+
+    def __init__(self, archive: RequestArchive, **kwargs):
+        super().__init__(**kwargs)
+        self._archive = archive
+
+    def send(self, request, **kwargs):
+        response = super().send(request, **kwargs)
+        self._archive.save(request, response)
+        return response
+
+
+class ReplayAdapter(BaseAdapter):
+    """
+        This transport adapter answers requests from the archive without any network access.
+        A request that is not in the archive is answered with a 404 Not Found response,
+        which the query classes treat as a source without a reference for the word.
+    """
+
+    def __init__(self, archive: RequestArchive, **kwargs):
+        super().__init__()
+        self._archive = archive
+
+    def send(self, request, **kwargs):
+        entry = self._archive.load(request)
+        if entry is not None:
+            return self._archive.build_response(request, entry)
+        logger.warning(f'The request {request.method} {request.url} is not in the replay archive.')
+        response = requests.models.Response()
+        response.request = request
+        response.url = request.url
+        response.status_code = 404
+        response.reason = 'Not Found'
+        response.headers = CaseInsensitiveDict({REPLAY_HEADER: 'miss'})
+        response._content = b''
+        return response
+
+    def close(self):
+        pass
+
+
+##################################################################################
+# module level transport used by the query and translator sessions
+##################################################################################
+_VALID_MODES = {'live', 'record', 'replay'}
+_transport_mode = 'live'
+_archive: Optional[RequestArchive] = None
+
+def set_transport(mode: str = 'live', directory: Optional[str] = None) -> None:
+    """
+    Selects the transport for all the HTTP requests made by WordHoard.
+
+    :param mode: 'live' sends requests to the online repositories, 'record' also archives
+                 every response in the directory and 'replay' answers requests from the
+                 directory without any network access.
+    :type mode: str
+    :param directory: The archive directory. Required for the record and replay modes.
+    :type directory: Optional[str]
+    :return: None
+    :raises ValueError: When the mode is unknown or the directory is missing.
+    """
+    global _transport_mode, _archive
+    if mode not in _VALID_MODES:
+        raise ValueError(f'Unknown transport mode: {mode}. Acceptable modes: live, record or replay.')
+    if mode != 'live' and not directory:
+        raise ValueError(f'The {mode} transport mode requires an archive directory.')
+    _archive = RequestArchive(directory) if mode != 'live' else None
+    _transport_mode = mode
+
+def transport_mode() -> str:
+    """
+    Returns the selected transport mode.
+
+    :return: live, record or replay
+    :rtype: str
+    """
+    return _transport_mode
+
+def transport_archive() -> Optional[RequestArchive]:
+    """
+    Returns the archive of the record and replay transport modes.
+
+    :return: The archive or None in the live transport mode.
+    :rtype: Optional[RequestArchive]
+    """
+    return _archive
+
+def replay_enabled() -> bool:
+    """
+    Returns True when requests are answered from the replay archive.
+
+    :return: True or False
+    :rtype: bool
+    """
+    return _transport_mode == 'replay'
+
+def build_adapter(**kwargs) -> BaseAdapter:
+    """
+    Returns the transport adapter for the selected transport mode.
+
+    :param kwargs: keyword arguments of requests.adapters.HTTPAdapter, such as max_retries
+    :return: transport adapter
+    :rtype: requests.adapters.BaseAdapter
+    """
+    if _transport_mode == 'record':
+        return RecordingAdapter(_archive, **kwargs)
+    if _transport_mode == 'replay':
+        return ReplayAdapter(_archive, **kwargs)
+    return HTTPAdapter(**kwargs)
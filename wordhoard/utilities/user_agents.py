@@ -31,13 +31,15 @@ __copyright__ = "Copyright (C) 2021 John Bumgarner"
 # Python imports required for basic operations
 ##################################################################################
 import os
-import sys
 import random
 import pickle
 import logging
 import traceback
 from typing import Union
 
+# Local or project-specific imports
+from wordhoard.utilities.exceptions import PickleFileException
+
 logger = logging.getLogger(__name__)
 
 PROJECT_ROOT = os.path.dirname(os.path.abspath(__file__))
@@ -57,10 +59,11 @@ def _unpickle_user_agents():
     This function attempts to load user agents from the common_user_agents.pkl file located
     in the 'files' directory under BASE_DIR. If successful, it returns a dictionary containing
     the user agents. If the file is not found or an OS error occurs during loading, the function
-    logs the error using the logger and exits the program with an error code.
+    logs the error using the logger and raises a PickleFileException.
 
     :return: A dictionary containing user agents if loaded successfully.
     :rtype: dict
+    :raises PickleFileException: When the pickle file cannot be found or opened.
     """
     try:
         _common_user_agents = os.path.join(BASE_DIR, 'files/common_user_agents.pkl')
@@ -70,11 +73,11 @@ def _unpickle_user_agents():
     except FileNotFoundError as error:
         logger.error('The common_user_agents.pkl file was not found. Aborting operation.')
         logger.error(''.join(traceback.format_tb(error.__traceback__)))
-        sys.exit(1)
+        raise PickleFileException('The common_user_agents.pkl file was not found.') from error
     except OSError as error:
         logger.error("An OS error occurred when trying to open the file common_user_agents.pkl")
         logger.error(''.join(traceback.format_tb(error.__traceback__)))
-        sys.exit(1)
+        raise PickleFileException('The common_user_agents.pkl file could not be opened.') from error
 
 def get_random_user_agent() -> str:
     """